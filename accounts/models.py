@@ -198,3 +198,39 @@ class Photo(models.Model):
     def __str__(self):
         return f"{self.user.username}'s photo"
 
+
+class DataExport(models.Model):
+    """사용자 데이터 내보내기 작업"""
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('running', '생성 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+        ('expired', '만료'),
+    ]
+
+    export_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='data_exports')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name='상태')
+    file_name = models.CharField(max_length=255, blank=True, verbose_name='파일 경로')
+    file_size = models.BigIntegerField(null=True, blank=True, verbose_name='파일 크기')
+    error = models.TextField(blank=True, verbose_name='오류 내용')
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True, verbose_name='완료 시간')
+    expires_at = models.DateTimeField(null=True, blank=True, verbose_name='다운로드 만료 시간')
+
+    class Meta:
+        verbose_name = '데이터 내보내기'
+        verbose_name_plural = '데이터 내보내기'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user.username}의 데이터 내보내기 ({self.status})"
+
+    @property
+    def is_downloadable(self):
+        return (
+            self.status == 'completed'
+            and self.expires_at is not None
+            and timezone.now() < self.expires_at
+        )
@@ -1,5 +1,7 @@
 from rest_framework import serializers
-from .models import User, Pregnancy, Follow, Photo
+from django.urls import reverse
+from .models import User, Pregnancy, Follow, Photo, DataExport
+from accounts.utils.export_utils import make_download_token
 from django.contrib.auth.password_validation import validate_password
 
 class UserSerializer(serializers.ModelSerializer):
@@ -298,4 +300,22 @@ class PhotoSerializer(serializers.ModelSerializer):
         elif new_image is None:
             validated_data.pop('image', None)  # 새 이미지가 없으면 'image' 필드 제거 (기존 이미지 유지)
 
-        return super().update(instance, validated_data)
\ No newline at end of file
+        return super().update(instance, validated_data)
+
+
+class DataExportSerializer(serializers.ModelSerializer):
+    """데이터 내보내기 작업 시리얼라이저 (완료된 작업은 기간 한정 다운로드 링크 포함)"""
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DataExport
+        fields = ['export_id', 'status', 'file_size', 'error', 'created_at', 'completed_at', 'expires_at', 'download_url']
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if not obj.is_downloadable:
+            return None
+        url = reverse('data-export-download', kwargs={'export_id': obj.export_id})
+        url = f"{url}?token={make_download_token(obj)}"
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
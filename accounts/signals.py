@@ -5,7 +5,8 @@ from django.db.models.signals import post_delete
 from django.dispatch import receiver
 import os
 from django.conf import settings
-from .models import Photo
+from .models import Photo, Pregnancy
+from .utils.conditional_utils import register_resource
 
 logger = logging.getLogger(__name__)
 
@@ -23,4 +24,8 @@ def delete_photo_file(sender, instance, **kwargs):
     if instance.image:
         file_path = instance.image.path
         if os.path.exists(file_path):
-            os.remove(file_path)
\ No newline at end of file
+            os.remove(file_path)
+
+
+# 조건부 요청(ETag) 리소스 버전 (주차 자동 갱신도 save()를 거치므로 함께 반영됨)
+register_resource('pregnancies', Pregnancy)
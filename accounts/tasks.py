@@ -55,3 +55,34 @@ def update_pregnancy_weeks():
     result_message = f"임신 주차 자동 업데이트 완료: 총 {len(pregnancies)}건 중 {updated_count}건 업데이트, {error_count}건 오류"
     logger.info(result_message)
     return result_message
+
+
+@shared_task
+def export_user_data(export_id):
+    """사용자 데이터 내보내기 zip 생성 태스크"""
+    from .models import DataExport
+    from .utils.export_utils import UserDataExportService
+
+    export = DataExport.objects.select_related('user').get(export_id=export_id)
+    counts = UserDataExportService(export.user).run(export)
+    logger.info(f"사용자 {export.user.username} 데이터 내보내기 완료 (ID: {export_id}): {counts}")
+    return counts
+
+
+@shared_task
+def cleanup_expired_data_exports():
+    """다운로드 기간이 지난 내보내기 파일 삭제"""
+    from .models import DataExport
+    from .utils.export_utils import delete_export_file
+
+    expired = DataExport.objects.filter(status='completed', expires_at__lte=timezone.now())
+    count = 0
+    for export in expired.iterator():
+        delete_export_file(export)
+        export.status = 'expired'
+        export.save(update_fields=['status'])
+        count += 1
+
+    result_message = f"만료된 데이터 내보내기 {count}건 정리 완료"
+    logger.info(result_message)
+    return result_message
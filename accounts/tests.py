@@ -1,11 +1,170 @@
-from django.test import TestCase
-import os
-from django.conf import settings
-from dotenv import load_dotenv
+import io
+import json
+import shutil
+import tempfile
+import time
+import zipfile
+from datetime import date, timedelta
+from unittest import mock
 
-load_dotenv()
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
 
-print(os.getenv('DJANGO_ENV'))
+from calendars.models import BabyDiary, BabyDiaryPhoto, Event
+from llm.models import ChatManager, LLMConversation
+from .models import DataExport, Photo, Pregnancy, User
+from .tasks import cleanup_expired_data_exports, update_pregnancy_weeks
+from .utils.export_utils import UserDataExportService, make_download_token
 
-# Create your tests here.
 
+class PregnancyConditionalGetTest(TestCase):
+    """Celery 태스크가 바꾼 임신 정보도 목록 ETag에 반영되는지 확인"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='weeks', email='weeks@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.pregnancy = Pregnancy.objects.create(
+            user=self.user, due_date=timezone.now().date() + timedelta(weeks=20), current_week=1
+        )
+
+    def test_task_bump_invalidates_etag(self):
+        response = self.client.get('/v1/accounts/pregnancies/')
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/v1/accounts/pregnancies/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # Celery 워커 프로세스의 캐시 클라이언트로 버전 갱신
+        with mock.patch('accounts.utils.conditional_utils.cache', caches.create_connection('default')):
+            update_pregnancy_weeks()
+
+        response = self.client.get('/v1/accounts/pregnancies/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['current_week'], 20)
+
+
+class DataExportTest(TestCase):
+    """사용자 데이터 내보내기: 모델별 NDJSON과 사진, 다운로드 토큰, 만료 정리, 멈춘 작업 실패 처리"""
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        media = override_settings(MEDIA_ROOT=f'{root}/media')
+        media.enable()
+        self.addCleanup(media.disable)
+        self.storage = FileSystemStorage(location=f'{root}/exports')
+        for target in ('accounts.utils.export_utils.export_storage', 'accounts.views.export_storage'):
+            patcher = mock.patch(target, self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='export', email='export@example.com', password='pw', name='내보내기')
+        self.other = User.objects.create_user(username='export2', email='export2@example.com', password='pw')
+
+    def run_export(self):
+        export = DataExport.objects.create(user=self.user)
+        UserDataExportService(self.user).run(export)
+        export.refresh_from_db()
+        return export
+
+    def read_archive(self, export):
+        with self.storage.open(export.file_name, 'rb') as f, zipfile.ZipFile(f) as archive:
+            return {name: archive.read(name) for name in archive.namelist()}
+
+    def ndjson(self, content):
+        return [json.loads(line) for line in content.decode('utf-8').splitlines()]
+
+    def test_archive_contents(self):
+        Pregnancy.objects.create(user=self.user, baby_name='튼튼이', due_date=date(2025, 1, 1))
+        room = ChatManager.objects.create(user=self.user)
+        LLMConversation.objects.create(user=self.user, chat_room=room, query='입덧이 심해요', response='답변')
+        Event.objects.create(user=self.user, title='검진', start_date=date(2024, 5, 1))
+        Event.objects.create(user=self.other, title='남의 일정', start_date=date(2024, 5, 1))
+        diary = BabyDiary.objects.create(user=self.user, content='첫 태동', diary_date=date(2024, 5, 2))
+        image = default_storage.save('baby_diary_photos/kick.jpg', ContentFile(b'diary-photo'))
+        BabyDiaryPhoto.objects.create(babydiary=diary, image=image)
+        BabyDiaryPhoto.objects.create(babydiary=diary, image='baby_diary_photos/missing.jpg')
+        profile = default_storage.save(f'users/{self.user.user_id}/photos/me.jpg', ContentFile(b'profile-photo'))
+        Photo.objects.create(user=self.user, image=profile)
+
+        export = self.run_export()
+        self.assertEqual(export.status, 'completed')
+        self.assertEqual(export.file_size, self.storage.size(export.file_name))
+        files = self.read_archive(export)
+
+        self.assertEqual(self.ndjson(files['profile.ndjson'])[0]['name'], '내보내기')
+        self.assertEqual([row['baby_name'] for row in self.ndjson(files['pregnancies.ndjson'])], ['튼튼이'])
+        self.assertEqual([row['query'] for row in self.ndjson(files['conversations.ndjson'])], ['입덧이 심해요'])
+        self.assertEqual(len(self.ndjson(files['chat_rooms.ndjson'])), 1)
+        self.assertEqual([row['title'] for row in self.ndjson(files['events.ndjson'])], ['검진'])
+        self.assertEqual(len(self.ndjson(files['baby_diary_photos.ndjson'])), 2)
+
+        # 저장소에 없는 사진은 건너뜀
+        self.assertEqual(files[f'photos/baby_diaries/{diary.diary_id}/kick.jpg'], b'diary-photo')
+        self.assertEqual(files['photos/profile/me.jpg'], b'profile-photo')
+        manifest = json.loads(files['manifest.json'])
+        self.assertEqual(manifest['counts']['photos'], 2)
+        self.assertEqual(manifest['counts']['events.ndjson'], 1)
+
+    def download(self, export, token):
+        return APIClient().get(f'/v1/accounts/users/me/exports/{export.export_id}/download/', {'token': token})
+
+    def test_download_token(self):
+        export = self.run_export()
+        token = make_download_token(export)
+        response = self.download(export, token)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(zipfile.is_zipfile(io.BytesIO(b''.join(response.streaming_content))))
+
+        # 다른 작업의 토큰, 변조된 토큰
+        other_export = self.run_export()
+        self.assertEqual(self.download(export, make_download_token(other_export)).status_code, 403)
+        self.assertEqual(self.download(export, token[:-1] + ('A' if token[-1] != 'A' else 'B')).status_code, 403)
+
+        # 서명 시각이 다운로드 가능 시간보다 오래된 토큰
+        with mock.patch('django.core.signing.time.time', return_value=time.time() - 25 * 3600):
+            old_token = make_download_token(export)
+        self.assertEqual(self.download(export, old_token).status_code, 403)
+
+        # 다운로드 기간이 지난 작업
+        DataExport.objects.filter(pk=export.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(self.download(export, token).status_code, 403)
+
+    def test_cleanup_deletes_expired_archives(self):
+        expired = self.run_export()
+        active = self.run_export()
+        DataExport.objects.filter(pk=expired.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        cleanup_expired_data_exports()
+        expired.refresh_from_db()
+        active.refresh_from_db()
+        self.assertEqual(expired.status, 'expired')
+        self.assertFalse(self.storage.exists(expired.file_name))
+        self.assertEqual(active.status, 'completed')
+        self.assertTrue(self.storage.exists(active.file_name))
+
+    def test_stale_exports_marked_failed(self):
+        self.client.force_authenticate(self.user)
+        stale = DataExport.objects.create(user=self.user, status='running')
+        DataExport.objects.filter(pk=stale.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        pending = DataExport.objects.create(user=self.user)
+
+        with mock.patch('accounts.views.export_user_data.delay') as delay:
+            # 제한 시간 안의 작업이 있으면 그 작업을 그대로 반환
+            response = self.client.post('/v1/accounts/users/me/exports/')
+            self.assertEqual(response.data['export_id'], str(pending.export_id))
+            delay.assert_not_called()
+
+            DataExport.objects.filter(pk=pending.pk).update(status='completed')
+            response = self.client.post('/v1/accounts/users/me/exports/')
+            self.assertEqual(response.status_code, 202)
+            delay.assert_called_once_with(response.data['export_id'])
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, 'failed')
+        self.assertTrue(stale.error)
+        self.assertNotIn(response.data['export_id'], (str(stale.export_id), str(pending.export_id)))
@@ -10,7 +10,7 @@ from .views import (
     NaverLoginCallbackView, GoogleLoginCallbackView, FindUsernameAPIView, RegisterSendEmailView,
     RegisterCheckView, FollowUnfollowView, FollowersListView, RetrieveUserByUserView,
     PhotoViewSet, DeleteAccountView, FollowListView, CheckEmailDuplicateView, CheckUsernameDuplicateView,
-    CheckPhoneNumberDuplicateView
+    CheckPhoneNumberDuplicateView, DataExportView, DataExportDetailView, DataExportDownloadView
 )
 
 pregnancy_router = DefaultRouter()
@@ -62,6 +62,11 @@ urlpatterns = [
 
     path('users/me/delete-account/', DeleteAccountView.as_view(), name='delete-account'),
 
+    # 사용자 데이터 내보내기
+    path('users/me/exports/', DataExportView.as_view(), name='data-export'),
+    path('users/me/exports/<uuid:export_id>/', DataExportDetailView.as_view(), name='data-export-detail'),
+    path('users/me/exports/<uuid:export_id>/download/', DataExportDownloadView.as_view(), name='data-export-download'),
+
     path('register/check-username/', CheckUsernameDuplicateView.as_view(), name='check-username'),
     path('register/check-email/', CheckEmailDuplicateView.as_view(), name='check-email'),
     path('register/check-phone-number/', CheckPhoneNumberDuplicateView.as_view(), name='check-phone-number'),
@@ -0,0 +1,164 @@
+import math
+import time
+import uuid
+import hashlib
+import logging
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponseNotModified
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'resource_version:{resource}:{user_id}'
+
+
+def _version_key(user_id, resource: str) -> str:
+    return VERSION_KEY.format(resource=resource, user_id=user_id)
+
+
+def get_resource_versions(user_id, resources) -> dict:
+    """
+    사용자별 리소스 버전 (캐시 한 번 조회)
+
+    버전은 Gunicorn 워커와 Celery 워커가 함께 쓰는 공유 캐시(Redis)에 저장하므로,
+    태스크나 다른 워커에서 갱신한 버전도 바로 반영됩니다.
+    버전은 마지막 변경 시각(ns)입니다. 캐시에 없으면(처음 조회, 캐시에서 밀려남) 현재 시각으로 새로 정하므로
+    이전에 발급한 ETag와 겹치지 않고, 클라이언트는 전체 응답을 한 번 더 받게 됩니다.
+    """
+    keys = {resource: _version_key(user_id, resource) for resource in resources}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for resource, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        versions[resource] = version
+    return versions
+
+
+def get_resource_version(user_id, resource: str) -> int:
+    return get_resource_versions(user_id, [resource])[resource]
+
+
+def bump_resource_version(user_id, *resources):
+    """리소스 버전 갱신 (이전 ETag와 캐시 키는 더 이상 일치하지 않음)"""
+    if user_id is None:
+        return
+    now = time.time_ns()
+    cache.set_many({_version_key(user_id, resource): now for resource in resources}, timeout=None)
+
+
+def register_resource(resource: str, model, get_user_id=None):
+    """
+    모델 저장/삭제 시그널에 리소스 버전 갱신 연결
+
+    Args:
+        resource: 리소스 이름 (예: 'events')
+        model: 변경을 감지할 모델
+        get_user_id: 인스턴스에서 사용자 ID를 구하는 함수 (기본값: instance.user_id)
+    """
+    get_user_id = get_user_id or (lambda instance: instance.user_id)
+
+    def bump(sender, instance, **kwargs):
+        if kwargs.get('raw'):
+            return
+        bump_resource_version(get_user_id(instance), resource)
+
+    uid = f'resource_version:{resource}:{model._meta.label}'
+    post_save.connect(bump, sender=model, weak=False, dispatch_uid=f'{uid}:save')
+    post_delete.connect(bump, sender=model, weak=False, dispatch_uid=f'{uid}:delete')
+
+
+def make_validators(user_id, versions: dict, full_path: str):
+    """
+    (ETag, Last-Modified 초) 계산
+
+    ETag는 사용자, 요청 경로(쿼리 포함), 리소스 버전의 해시이고,
+    Last-Modified는 가장 최근 변경 시각을 초 단위로 올린 값입니다.
+    """
+    source = f"{user_id}|{full_path}|" + '|'.join(f"{key}={versions[key]}" for key in sorted(versions))
+    etag = f'"{hashlib.sha256(source.encode()).hexdigest()[:32]}"'
+    last_modified = math.ceil(max(versions.values()) / 1e9) if versions else None
+    return etag, last_modified
+
+
+def is_not_modified(request, etag: str, last_modified) -> bool:
+    """If-None-Match(우선), If-Modified-Since 기준 304 응답 가능 여부"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        if if_none_match.strip() == '*':
+            return True
+        # GET은 약한 비교 허용
+        return etag in (tag[2:] if tag.startswith('W/') else tag for tag in parse_etags(if_none_match))
+
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE') or '')
+    return bool(last_modified and if_modified_since and if_modified_since >= last_modified)
+
+
+class NotModified(Exception):
+    """조건부 요청이 일치해 본문 없이 304를 반환해야 하는 경우"""
+
+
+class ConditionalGetMixin:
+    """
+    사용자별 리소스 버전 기반 조건부 GET (ETag / Last-Modified)
+
+    인증/권한 확인 직후 캐시에서 버전만 읽어 If-None-Match가 일치하면 뷰의 쿼리를 실행하지 않고 304를 반환합니다.
+    버전은 register_resource로 연결된 모델 시그널이 갱신합니다.
+
+    conditional_resources: 응답이 의존하는 리소스 이름 목록
+    conditional_actions: ViewSet에서 적용할 액션 (APIView는 모든 GET에 적용)
+    """
+    conditional_resources = ()
+    conditional_actions = ('list',)
+
+    def get_conditional_user_id(self, request):
+        """버전을 조회할 사용자 ID (None이면 조건부 처리 생략)"""
+        user = request.user
+        return user.pk if user and user.is_authenticated else None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.conditional_validators = None
+        if request.method not in ('GET', 'HEAD') or not self.conditional_resources:
+            return
+        action = getattr(self, 'action', None)
+        if action is not None and action not in self.conditional_actions:
+            return
+        user_id = self.get_conditional_user_id(request)
+        if user_id is None:
+            return
+
+        versions = get_resource_versions(user_id, self.conditional_resources)
+        etag, last_modified = make_validators(user_id, versions, request.get_full_path())
+        self.conditional_validators = (etag, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            raise NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return HttpResponseNotModified()
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, 'conditional_validators', None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            # 같은 초 안의 변경을 구분할 수 없으므로, 변경된 초가 지난 뒤에만 Last-Modified를 보냄
+            if last_modified and last_modified <= time.time():
+                response['Last-Modified'] = http_date(last_modified)
+            response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+def parse_user_id(value):
+    """쿼리 파라미터의 사용자 ID (UUID가 아니면 None)"""
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        return None
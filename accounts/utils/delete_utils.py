@@ -1,6 +1,7 @@
-from accounts.models import Follow, Pregnancy, Photo, User
+from accounts.models import DataExport, Follow, Pregnancy, Photo, User
+from accounts.utils.export_utils import delete_export_file
 from calendars.models import BabyDiary, Event, DailyConversationSummary, BabyDiaryPhoto
-from llm.models import LLMConversation
+from llm.models import LLMConversation, UserInfoSnapshot
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.tokens import OutstandingToken
 
@@ -18,8 +19,17 @@ class UserDataDeletionService:
         BabyDiary.objects.filter(user=self.user).delete()
         Pregnancy.objects.filter(user=self.user).delete()
         Event.objects.filter(user=self.user).delete()
+        snapshot_ids = list(
+            LLMConversation.objects.filter(user=self.user, user_info_snapshot__isnull=False)
+            .values_list('user_info_snapshot_id', flat=True).distinct()
+        )
         LLMConversation.objects.filter(user=self.user).delete()
+        # 다른 대화가 참조하지 않는 사용자 정보 스냅샷 삭제
+        UserInfoSnapshot.objects.filter(snapshot_id__in=snapshot_ids, conversations__isnull=True).delete()
         Photo.objects.filter(user=self.user).delete()
+        for export in DataExport.objects.filter(user=self.user):
+            delete_export_file(export)
+        DataExport.objects.filter(user=self.user).delete()
         baby_diary_ids = BabyDiary.objects.filter(user=self.user).values_list('diary_id', flat=True)
         BabyDiaryPhoto.objects.filter(babydiary_id__in=baby_diary_ids).delete()
 
@@ -0,0 +1,168 @@
+import os
+import json
+import shutil
+import zipfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from accounts.models import DataExport, Pregnancy, Photo, User
+from calendars.models import BabyDiary, BabyDiaryPhoto, DailyConversationSummary, Event
+from llm.models import ChatManager, LLMConversation, UserInfoSnapshot
+
+# 서버 측 커서로 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 500
+DOWNLOAD_SIGNING_SALT = 'accounts.data-export'
+
+export_storage = FileSystemStorage(location=settings.DATA_EXPORT_ROOT)
+
+
+class UserDataExportService:
+    """
+    사용자 데이터 내보내기
+
+    모델별 NDJSON 파일과 사진 파일을 zip 하나로 묶어 저장합니다.
+    쿼리셋은 iterator()로 서버 측 커서에서 청크 단위로 읽고, zip 항목에 바로 기록하므로
+    전체 데이터를 메모리에 올리지 않습니다.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    def datasets(self):
+        """(파일 이름, values 쿼리셋) 목록"""
+        user = self.user
+        return [
+            ('profile.ndjson', User.objects.filter(pk=user.pk).values(
+                'user_id', 'username', 'name', 'email', 'phone_number', 'gender', 'is_pregnant',
+                'address', 'date_joined', 'last_login'
+            )),
+            ('pregnancies.ndjson', Pregnancy.objects.filter(user=user).values()),
+            ('chat_rooms.ndjson', ChatManager.objects.filter(user=user).values(
+                'chat_id', 'pregnancy_id', 'topic', 'message_count', 'is_active', 'created_at', 'updated_at'
+            )),
+            ('conversations.ndjson', LLMConversation.objects.filter(user=user).values(
+                'id', 'chat_room_id', 'query', 'response', 'user_info', 'user_info_snapshot_id',
+                'source_documents', 'using_rag', 'created_at', 'updated_at'
+            )),
+            ('user_info_snapshots.ndjson', UserInfoSnapshot.objects.filter(
+                conversations__user=user
+            ).distinct().values('snapshot_id', 'data', 'created_at')),
+            ('events.ndjson', Event.objects.filter(user=user).values()),
+            ('conversation_summaries.ndjson', DailyConversationSummary.objects.filter(user=user).values()),
+            ('baby_diaries.ndjson', BabyDiary.objects.filter(user=user).values()),
+            ('baby_diary_photos.ndjson', BabyDiaryPhoto.objects.filter(babydiary__user=user).values(
+                'photo_id', 'babydiary_id', 'image', 'created_at'
+            )),
+        ]
+
+    def photo_files(self):
+        """(저장소 경로, zip 내부 경로) 이터레이터"""
+        photos = BabyDiaryPhoto.objects.filter(babydiary__user=self.user).values_list(
+            'babydiary_id', 'image'
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        for diary_id, image in photos:
+            if image:
+                yield image, f"photos/baby_diaries/{diary_id}/{os.path.basename(image)}"
+
+        profile = Photo.objects.filter(user=self.user).values_list('image', flat=True).first()
+        if profile:
+            yield profile, f"photos/profile/{os.path.basename(profile)}"
+
+    def _write_ndjson(self, archive, name, queryset):
+        count = 0
+        with archive.open(name, 'w', force_zip64=True) as entry:
+            for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                line = json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False)
+                entry.write(line.encode('utf-8') + b'\n')
+                count += 1
+        return count
+
+    def _write_file(self, archive, storage_name, arcname):
+        if not default_storage.exists(storage_name):
+            return False
+        with default_storage.open(storage_name, 'rb') as source, \
+                archive.open(arcname, 'w', force_zip64=True) as entry:
+            shutil.copyfileobj(source, entry, length=64 * 1024)
+        return True
+
+    def write_archive(self, path):
+        """
+        zip 파일 생성
+
+        Returns:
+            dict: {파일 이름: 행 수, 'photos': 사진 수}
+        """
+        counts = {}
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, queryset in self.datasets():
+                counts[name] = self._write_ndjson(archive, name, queryset)
+
+            # 사진은 이미 압축된 형식이므로 저장만 함
+            archive.compression = zipfile.ZIP_STORED
+            counts['photos'] = sum(
+                1 for storage_name, arcname in self.photo_files()
+                if self._write_file(archive, storage_name, arcname)
+            )
+
+            archive.compression = zipfile.ZIP_DEFLATED
+            archive.writestr('manifest.json', json.dumps({
+                'user_id': str(self.user.user_id),
+                'exported_at': timezone.now().isoformat(),
+                'counts': counts,
+            }, ensure_ascii=False, indent=2))
+        return counts
+
+    def run(self, export: DataExport):
+        """내보내기 작업 실행 후 상태 갱신"""
+        export.status = 'running'
+        export.save(update_fields=['status'])
+
+        file_name = f"{self.user.user_id}/{export.export_id}.zip"
+        path = export_storage.path(file_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            counts = self.write_archive(path)
+        except Exception as e:
+            if os.path.exists(path):
+                os.remove(path)
+            export.status = 'failed'
+            export.error = str(e)
+            export.save(update_fields=['status', 'error'])
+            raise
+
+        export.status = 'completed'
+        export.file_name = file_name
+        export.file_size = os.path.getsize(path)
+        export.completed_at = timezone.now()
+        export.expires_at = export.completed_at + timedelta(hours=settings.DATA_EXPORT_TTL_HOURS)
+        export.save(update_fields=['status', 'file_name', 'file_size', 'completed_at', 'expires_at'])
+        return counts
+
+
+def make_download_token(export: DataExport) -> str:
+    """다운로드 링크용 서명 토큰"""
+    return signing.dumps(str(export.export_id), salt=DOWNLOAD_SIGNING_SALT)
+
+
+def check_download_token(export: DataExport, token: str) -> bool:
+    """토큰이 해당 내보내기 작업용이고 만료되지 않았는지 확인"""
+    try:
+        value = signing.loads(
+            token,
+            salt=DOWNLOAD_SIGNING_SALT,
+            max_age=settings.DATA_EXPORT_TTL_HOURS * 3600
+        )
+    except signing.BadSignature:
+        return False
+    return value == str(export.export_id) and export.is_downloadable
+
+
+def delete_export_file(export: DataExport):
+    """내보내기 파일 삭제"""
+    if export.file_name and export_storage.exists(export.file_name):
+        export_storage.delete(export.file_name)
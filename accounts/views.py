@@ -3,7 +3,7 @@ import requests
 import logging
 import random
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.core.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
@@ -22,24 +22,29 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.decorators import action
 
 from django.contrib.auth.hashers import get_random_string
-from django.http import HttpResponseRedirect, JsonResponse
+from django.http import FileResponse, HttpResponseRedirect, JsonResponse
 from django.contrib.auth import authenticate
 from django.conf import settings
+from django.utils import timezone
 from django.core.mail import get_connection, EmailMultiAlternatives
 
 from django.contrib.auth import logout
 
 from calendars.models import BabyDiary, Event
+from calendars.month_cache import bump_version as bump_calendar_version
+from .utils.conditional_utils import ConditionalGetMixin
 from .serializers import (
     UserSerializer, LoginSerializer, PregnancySerializer, UserUpdateSerializer, ChangePasswordSerializer,
     PasswordResetSerializer, PasswordResetConfirmSerializer, FindUsernameSerializer, PasswordResetCheckSerializer,
-    PhotoSerializer, FollowUserSerializer
+    PhotoSerializer, FollowUserSerializer, DataExportSerializer
 )
-from .models import User, Pregnancy, Follow, Photo
+from .models import User, Pregnancy, Follow, Photo, DataExport
+from .tasks import export_user_data
 from dotenv import load_dotenv
 
 from accounts.utils.email_utils import EmailUtils
 from accounts.utils.delete_utils import UserDataDeletionService
+from accounts.utils.export_utils import check_download_token, export_storage
 
 # .env 파일 로드
 load_dotenv()
@@ -370,9 +375,10 @@ class UpdateUserInfoView(generics.RetrieveUpdateAPIView):
         })
 
 
-class PregnancyViewSet(viewsets.ModelViewSet):
+class PregnancyViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = PregnancySerializer
     permission_classes = [IsAuthenticated]
+    conditional_resources = ('pregnancies',)
 
     def get_queryset(self):
         return Pregnancy.objects.filter(user=self.request.user)
@@ -383,12 +389,18 @@ class PregnancyViewSet(viewsets.ModelViewSet):
         # 출산예정일이 있는 경우 Event 테이블에 일정 추가
         if pregnancy.due_date:
             self._create_or_update_due_date_event(pregnancy)
+            bump_calendar_version(pregnancy.user_id)
 
     def perform_update(self, serializer):
         pregnancy = serializer.instance
         old_due_date = pregnancy.due_date
+        old_is_active = pregnancy.is_active
         pregnancy = serializer.save()
         
+        # 활성 여부가 바뀌면 가상 정기검진 일정 표시도 바뀌므로 월간 일정 캐시 무효화
+        if pregnancy.is_active != old_is_active:
+            bump_calendar_version(pregnancy.user_id)
+        
         # 출산예정일이 변경된 경우
         if pregnancy.due_date != old_due_date:
             if pregnancy.due_date:
@@ -397,11 +409,14 @@ class PregnancyViewSet(viewsets.ModelViewSet):
             else:
                 # 출산예정일이 삭제된 경우 관련 이벤트도 삭제
                 self._delete_due_date_event(pregnancy)
+            # 출산예정일 기반 월간 일정 캐시 무효화
+            bump_calendar_version(pregnancy.user_id)
 
     def perform_destroy(self, instance):
         # 임신 정보 삭제 전에 관련 이벤트 삭제
         self._delete_due_date_event(instance)
         instance.delete()
+        bump_calendar_version(instance.user_id)
     
     def _create_or_update_due_date_event(self, pregnancy):
         """임신 정보의 출산예정일을 기반으로 이벤트 생성 또는 업데이트"""
@@ -1175,6 +1190,62 @@ class DeleteAccountView(APIView):
         return Response({"message": "탈퇴가 완료되었습니다. 다음에 또 방문해주세요 ☺️"}, status=status.HTTP_200_OK)
 
 
+class DataExportView(APIView):
+    """사용자 데이터 내보내기 요청 및 목록 조회 API"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        exports = DataExport.objects.filter(user=request.user)[:10]
+        serializer = DataExportSerializer(exports, many=True, context={'request': request})
+        return Response(serializer.data)
+
+    def post(self, request):
+        # 워커 중단 등으로 제한 시간이 지나도 끝나지 않은 작업은 실패 처리 (새 요청을 막지 않도록)
+        stale_before = timezone.now() - timedelta(minutes=settings.DATA_EXPORT_STALE_MINUTES)
+        DataExport.objects.filter(
+            user=request.user, status__in=['pending', 'running'], created_at__lt=stale_before
+        ).update(status='failed', error='제한 시간 안에 내보내기 작업이 완료되지 않았습니다.')
+
+        # 진행 중인 작업이 있으면 새로 만들지 않음
+        export = DataExport.objects.filter(user=request.user, status__in=['pending', 'running']).first()
+        if export is None:
+            export = DataExport.objects.create(user=request.user)
+            export_user_data.delay(str(export.export_id))
+        serializer = DataExportSerializer(export, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class DataExportDetailView(APIView):
+    """사용자 데이터 내보내기 상태 조회 API"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, export_id):
+        export = get_object_or_404(DataExport, export_id=export_id, user=request.user)
+        serializer = DataExportSerializer(export, context={'request': request})
+        return Response(serializer.data)
+
+
+class DataExportDownloadView(APIView):
+    """
+    사용자 데이터 내보내기 파일 다운로드 API
+
+    브라우저에서 바로 받을 수 있도록 인증 대신 서명된 기간 한정 토큰으로 확인합니다.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, export_id):
+        export = get_object_or_404(DataExport, export_id=export_id)
+        if not check_download_token(export, request.query_params.get('token', '')):
+            return Response({"error": "다운로드 링크가 만료되었거나 올바르지 않습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        return FileResponse(
+            export_storage.open(export.file_name, 'rb'),
+            as_attachment=True,
+            filename=f"florence-export-{timezone.localdate(export.completed_at):%Y%m%d}.zip",
+            content_type='application/zip'
+        )
+
+
 class CheckUsernameDuplicateView(APIView):
     permission_classes = [AllowAny]
     """아이디 중복 확인 API"""
@@ -0,0 +1,195 @@
+import logging
+from datetime import date, datetime, time, timedelta
+
+from django.db.models import DurationField, ExpressionWrapper, F, Max
+
+from .models import Event
+from .occurrences import occurrences_in_range
+from .recurrence import CompiledRule
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 종료 시간이 없는 일정의 기본 길이 (CalendarTool과 같은 기준)
+DEFAULT_EVENT_DURATION = timedelta(hours=1)
+# 빈 시간 조회 가능한 최대 기간
+MAX_FREE_SLOT_DAYS = 92
+# 반복 일정으로 제안된 경우 충돌을 확인할 최대 기간
+MAX_CONFLICT_LOOKAHEAD_DAYS = 365
+
+
+class IntervalTree:
+    """
+    반열린 구간 [start, end) 정적 interval tree
+
+    시작 시각으로 정렬한 배열을 암묵적 균형 이진 트리로 보고, 노드마다 서브트리의 최대 종료 시각을 저장합니다.
+    겹치는 구간 조회는 O(log n + k)이고, 결과는 시작 시각 순입니다.
+    """
+
+    __slots__ = ('_starts', '_ends', '_items', '_max_end')
+
+    def __init__(self, intervals):
+        """
+        Args:
+            intervals: (start, end, item) 목록
+        """
+        ordered = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+        self._starts = [interval[0] for interval in ordered]
+        self._ends = [interval[1] for interval in ordered]
+        self._items = [interval[2] for interval in ordered]
+        self._max_end = list(self._ends)
+        self._build(0, len(ordered))
+
+    def __len__(self):
+        return len(self._items)
+
+    def _build(self, lo: int, hi: int):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > self._max_end[mid]:
+                self._max_end[mid] = child
+        return self._max_end[mid]
+
+    def overlapping(self, start, end) -> list:
+        """[start, end)와 겹치는 구간 (start, end, item) 목록"""
+        result = []
+        stack = [(0, len(self._items))]
+        # 중위 순회로 시작 시각 순서를 유지 (왼쪽 서브트리 → 노드 → 오른쪽 서브트리)
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                # 서브트리의 모든 구간이 조회 구간 전에 끝남
+                continue
+            if hi - lo == 1:
+                # 노드 하나 (서브트리 최대 종료 시각은 위에서 이미 걸렀으므로 노드 자신만 확인)
+                if self._starts[mid] < end and self._ends[mid] > start:
+                    result.append((self._starts[mid], self._ends[mid], self._items[mid]))
+                continue
+            # 노드와 오른쪽 서브트리는 시작 시각이 노드 이상이므로, 노드가 조회 구간 뒤에 시작하면 왼쪽만 확인
+            if self._starts[mid] >= end:
+                stack.append((lo, mid))
+                continue
+            stack.append((mid + 1, hi))
+            stack.append((mid, mid + 1))
+            stack.append((lo, mid))
+        return result
+
+
+def event_interval(event, start_date: date, end_date=None):
+    """
+    일정 발생 1건의 시간 구간 [start, end)
+
+    시작 시간이 없는 종일 일정은 None을 반환합니다 (충돌/빈 시간 계산에서 제외).
+    종료 시간이 없거나 시작 시간보다 이르면 기본 길이(1시간)를 사용합니다.
+    """
+    if event.start_time is None:
+        return None
+    start = datetime.combine(start_date, event.start_time)
+    end = None
+    if event.end_time is not None:
+        end = datetime.combine(end_date or start_date, event.end_time)
+    if end is None or end <= start:
+        end = start + DEFAULT_EVENT_DURATION
+    return start, end
+
+
+def _max_event_span(user) -> timedelta:
+    """사용자 일정 중 가장 긴 멀티데이 기간 (구간 앞에서 시작해 걸쳐 있는 일정을 찾기 위함)"""
+    span = Event.objects.filter(user=user, end_date__isnull=False).aggregate(
+        span=Max(ExpressionWrapper(F('end_date') - F('start_date'), output_field=DurationField()))
+    )['span']
+    return max(span or timedelta(0), timedelta(0))
+
+
+def build_tree(user, start: datetime, end: datetime, exclude_event_id=None) -> IntervalTree:
+    """
+    조회 구간 [start, end)에 걸치는 사용자 일정 발생으로 interval tree 생성
+
+    발생일 테이블은 시작일 기준이므로, 가장 긴 멀티데이 기간만큼 앞에서 시작한 발생도 함께 읽습니다.
+    """
+    window_start = start.date() - _max_event_span(user)
+    window_end = (end - timedelta(microseconds=1)).date()
+    intervals = []
+    for record in occurrences_in_range(user, window_start, window_end):
+        if exclude_event_id is not None and record.event.event_id == exclude_event_id:
+            continue
+        interval = event_interval(record.event, record.start_date, record.end_date)
+        if interval is not None and interval[0] < end and interval[1] > start:
+            intervals.append((interval[0], interval[1], record))
+    return IntervalTree(intervals)
+
+
+def proposed_intervals(start_date: date, end_date=None, start_time=None, end_time=None, recurrence_rules=None):
+    """
+    제안된 일정의 발생 구간 목록
+
+    반복 규칙이 있으면 MAX_CONFLICT_LOOKAHEAD_DAYS 안의 반복일을 모두 펼칩니다.
+    """
+    proposed = Event(start_date=start_date, end_date=end_date, start_time=start_time, end_time=end_time)
+    if not recurrence_rules:
+        interval = event_interval(proposed, start_date, end_date)
+        return [interval] if interval else []
+
+    rule = CompiledRule.from_rules(recurrence_rules, start_date)
+    duration = (end_date - start_date) if end_date else None
+    last = min(rule.until, start_date + timedelta(days=MAX_CONFLICT_LOOKAHEAD_DAYS))
+    intervals = []
+    for occurrence in rule.occurrences(start_date, last):
+        interval = event_interval(proposed, occurrence, occurrence + duration if duration is not None else None)
+        if interval:
+            intervals.append(interval)
+    return intervals
+
+
+def find_conflicts(user, intervals, exclude_event_id=None) -> list:
+    """
+    제안된 구간들과 겹치는 기존 일정 발생 목록
+
+    전체 구간에 대해 interval tree를 한 번 만들고, 제안 구간마다 겹치는 발생을 조회합니다.
+
+    Returns:
+        list: [(제안 시작, 제안 종료, [(시작, 종료, OccurrenceRecord), ...]), ...] (겹치는 것이 있는 제안만)
+    """
+    if not intervals:
+        return []
+    tree = build_tree(
+        user, min(start for start, _ in intervals), max(end for _, end in intervals), exclude_event_id
+    )
+    result = []
+    for start, end in intervals:
+        overlaps = tree.overlapping(start, end)
+        if overlaps:
+            result.append((start, end, overlaps))
+    return result
+
+
+def find_free_slots(user, start_date: date, end_date: date, min_duration: timedelta,
+                    day_start: time = time(9, 0), day_end: time = time(18, 0)) -> list:
+    """
+    날짜 범위에서 하루 [day_start, day_end) 안의 빈 시간 목록
+
+    Returns:
+        list: [(시작, 종료), ...] (min_duration 이상인 구간만, 시간 순)
+    """
+    range_start = datetime.combine(start_date, day_start)
+    range_end = datetime.combine(end_date, day_end)
+    tree = build_tree(user, range_start, range_end)
+
+    slots = []
+    current_date = start_date
+    while current_date <= end_date:
+        cursor = datetime.combine(current_date, day_start)
+        day_close = datetime.combine(current_date, day_end)
+        for busy_start, busy_end, _ in tree.overlapping(cursor, day_close):
+            if busy_start - cursor >= min_duration:
+                slots.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if day_close - cursor >= min_duration:
+            slots.append((cursor, day_close))
+        current_date += timedelta(days=1)
+    return slots
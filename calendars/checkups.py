@@ -0,0 +1,131 @@
+import csv
+import math
+import uuid
+import logging
+from datetime import date, timedelta
+from functools import lru_cache
+
+from django.conf import settings
+
+from accounts.models import Pregnancy
+from .occurrences import OccurrenceRecord
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+CHECKUP_CSV_PATH = settings.BASE_DIR / 'llm' / 'pregnancy.csv'
+CHECKUP_WEEK_COLUMN = '임신주차'
+CHECKUP_COLUMN = '권장사항_정기검진'
+MAX_PREGNANCY_WEEK = 42
+
+CHECKUP_EVENT_TYPE = 'appointment'
+CHECKUP_EVENT_COLOR = '#96CEB4'
+
+# 가상 검진 일정 ID 생성용 (임신 정보, 주차가 같으면 항상 같은 ID)
+CHECKUP_NAMESPACE = uuid.UUID('8c1f3f0e-4a55-4d8e-9b61-2f6f0d3c7a42')
+
+
+@lru_cache(maxsize=1)
+def load_checkups() -> dict:
+    """
+    주차별 권장 정기검진 {주차: 검진 내용}
+
+    CSV 헤더와 값에 뒤쪽 공백이 섞여 있어 모두 정리해서 읽습니다.
+    """
+    checkups = {}
+    with open(CHECKUP_CSV_PATH, encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            row = {(key or '').strip(): (value or '').strip() for key, value in row.items()}
+            try:
+                week = int(row[CHECKUP_WEEK_COLUMN])
+            except (KeyError, ValueError):
+                continue
+            if row.get(CHECKUP_COLUMN):
+                checkups[week] = row[CHECKUP_COLUMN]
+    return checkups
+
+
+def week_start(due_date: date, week: int) -> date:
+    """
+    임신 주차의 첫날
+
+    update_pregnancy_weeks와 같은 기준 (주차 = ceil(40 - 출산 예정일까지 남은 일수 / 7))이므로
+    40주차는 출산 예정일 6일 전부터 출산 예정일까지입니다.
+    """
+    return due_date - timedelta(days=(41 - week) * 7 - 1)
+
+
+@lru_cache(maxsize=1024)
+def checkup_schedule(due_date: date) -> tuple:
+    """출산 예정일별 검진 일정 ((주차, 날짜, 검진 내용), ...) (1주차부터 주차 순, 출산 예정일 단위로 캐시)"""
+    checkups = load_checkups()
+    return tuple(
+        (week, week_start(due_date, week), checkups.get(week))
+        for week in range(1, MAX_PREGNANCY_WEEK + 1)
+    )
+
+
+def checkups_in_range(due_date: date, start_date: date, end_date: date) -> list:
+    """
+    조회 구간에 시작하는 주차의 검진 일정
+
+    주차 날짜는 등차수열이므로 구간에 걸리는 주차 범위를 바로 계산합니다 (구간 안의 주차 수만큼만 순회).
+    """
+    first_day = week_start(due_date, 1)
+    first = max(1, 1 + math.ceil((start_date - first_day).days / 7))
+    last = min(MAX_PREGNANCY_WEEK, 1 + (end_date - first_day).days // 7)
+    schedule = checkup_schedule(due_date)
+    return [schedule[week - 1] for week in range(first, last + 1) if schedule[week - 1][2]]
+
+
+def checkup_title(week: int, checkup: str) -> str:
+    return f"[{week}주차] {checkup}"
+
+
+class CheckupEvent:
+    """
+    임신 정보에서 계산한 가상 검진 일정 (DB에 저장하지 않는 읽기 전용 일정)
+
+    render_occurrences가 Event처럼 직렬화할 수 있도록 같은 속성을 갖고,
+    virtual_fields는 응답에 추가로 붙습니다 (promote_checkup으로 실제 일정으로 등록할 때 week 사용).
+    """
+
+    __slots__ = ('event_id', 'user_id', 'title', 'description', 'start_date', 'end_date', 'virtual_fields')
+
+    start_time = None
+    end_time = None
+    event_type = CHECKUP_EVENT_TYPE
+    recurrence_rules = None
+    event_color = CHECKUP_EVENT_COLOR
+    created_at = None
+    updated_at = None
+
+    def __init__(self, pregnancy, week: int, start_date: date, checkup: str):
+        self.event_id = uuid.uuid5(CHECKUP_NAMESPACE, f'{pregnancy.pregnancy_id}:{week}')
+        self.user_id = pregnancy.user_id
+        self.title = checkup_title(week, checkup)
+        self.description = f'임신 {week}주차 권장 정기검진입니다.'
+        self.start_date = start_date
+        self.end_date = start_date
+        self.virtual_fields = {'is_virtual': True, 'read_only': True, 'source': 'prenatal_checkup', 'week': week}
+
+
+def active_pregnancies(user):
+    return Pregnancy.objects.filter(user=user, is_active=True, due_date__isnull=False)
+
+
+def checkup_overlay(user, start_date: date, end_date: date, records=()) -> list:
+    """
+    조회 구간의 가상 검진 일정 (OccurrenceRecord)
+
+    이미 실제 일정으로 등록한(같은 날짜, 같은 제목) 검진은 제외합니다.
+    """
+    overlay = []
+    for pregnancy in active_pregnancies(user):
+        for week, checkup_date, checkup in checkups_in_range(pregnancy.due_date, start_date, end_date):
+            event = CheckupEvent(pregnancy, week, checkup_date, checkup)
+            overlay.append(OccurrenceRecord(event, checkup_date, checkup_date))
+    if overlay and records:
+        promoted = {(record.start_date, record.event.title) for record in records}
+        overlay = [record for record in overlay if (record.start_date, record.event.title) not in promoted]
+    return overlay
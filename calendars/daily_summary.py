@@ -0,0 +1,136 @@
+import os
+import logging
+from datetime import datetime, timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from openai import OpenAI
+
+from llm.models import LLMConversation
+from .models import DailyConversationSummary
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+SUMMARY_MODEL = "gpt-4o-mini"  # 더 가벼운 GPT-4o mini 모델 사용
+SUMMARY_SYSTEM_PROMPT = (
+    "당신은 임신 관련 정보를 요약해주는 전문가입니다. 캘린더에 기록될 '오늘의 하루' 요약을 생성해주세요. "
+    "'대화에서', '대화에 따르면' 같은 표현을 사용하지 말고, 직접적으로 정보와 주제만 요약해주세요. 300자 이내로 작성하세요."
+)
+SUMMARY_USER_PROMPT = (
+    "다음은 오늘 나눈 대화 내용입니다. 이 내용을 바탕으로 오늘의 주요 임신 관련 정보와 주제를 요약해주세요. "
+    "대화의 출처나 맥락을 언급하지 말고, 내용 자체만 요약해주세요:\n\n"
+)
+
+
+class DailySummaryError(Exception):
+    """일별 대화 요약을 만들 수 없는 경우"""
+
+
+class SummaryExists(DailySummaryError):
+    def __init__(self, summary_date, summary_id=None):
+        self.summary_id = summary_id
+        super().__init__(f"이미 {summary_date} 날짜의 요약이 존재합니다. ID: {summary_id}")
+
+
+class NoConversations(DailySummaryError):
+    def __init__(self, summary_date):
+        super().__init__(f"{summary_date} 날짜에 해당하는 대화가 없습니다.")
+
+
+class SummaryNotConfigured(DailySummaryError):
+    def __init__(self):
+        super().__init__("서비스 구성 오류가 발생했습니다. 관리자에게 문의하세요.")
+
+
+def day_bounds(summary_date):
+    """요약 날짜의 시작/끝 시각 (TIME_ZONE 기준)"""
+    start = timezone.make_aware(datetime.combine(summary_date, datetime.min.time()))
+    return start, start + timedelta(days=1)
+
+
+def users_to_summarize(summary_date) -> list:
+    """
+    요약 날짜에 대화가 있고 아직 요약이 없는 활성 사용자 ID 목록 (쿼리 1회)
+
+    대화가 없는 사용자는 아예 조회되지 않으므로 사용자 수가 아닌 대화한 사용자 수만큼만 작업이 생깁니다.
+    """
+    start, end = day_bounds(summary_date)
+    has_summary = DailyConversationSummary.objects.filter(user=OuterRef('user'), summary_date=summary_date)
+    return list(
+        LLMConversation.objects.filter(
+            created_at__gte=start,
+            created_at__lt=end,
+            user__is_active=True,
+        ).filter(~Exists(has_summary)).order_by('user_id').values_list('user_id', flat=True).distinct()
+    )
+
+
+def get_openai_client():
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        logger.error("OpenAI API 키가 설정되지 않았습니다.")
+        raise SummaryNotConfigured()
+    return OpenAI(api_key=api_key)
+
+
+def summarize_user_day(user_id, summary_date, pregnancy_id=None, client=None) -> DailyConversationSummary:
+    """
+    사용자의 하루 대화를 LLM으로 요약해 저장
+
+    Args:
+        client: OpenAI 클라이언트 (여러 사용자를 처리할 때 재사용, 없으면 새로 생성)
+
+    Raises:
+        SummaryExists, NoConversations, SummaryNotConfigured: 요약을 만들 수 없는 경우
+        그 외 LLM 호출 오류는 그대로 전달
+    """
+    existing_id = DailyConversationSummary.objects.filter(
+        user_id=user_id, summary_date=summary_date
+    ).values_list('summary_id', flat=True).first()
+    if existing_id:
+        raise SummaryExists(summary_date, existing_id)
+
+    start, end = day_bounds(summary_date)
+    conversations = list(LLMConversation.objects.filter(
+        user_id=user_id,
+        created_at__gte=start,
+        created_at__lt=end,
+    ).only('id', 'query', 'response'))
+    if not conversations:
+        raise NoConversations(summary_date)
+
+    # conversation 자체가 하나의 질문-응답 쌍입니다
+    all_conversations = "\n\n".join(
+        f"대화 ID: {conversation.id}\n사용자: {conversation.query}\nAI: {conversation.response}\n"
+        for conversation in conversations
+    )
+
+    client = client or get_openai_client()
+    response = client.chat.completions.create(
+        model=SUMMARY_MODEL,
+        messages=[
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": SUMMARY_USER_PROMPT + all_conversations}
+        ],
+        temperature=0.3,
+        max_tokens=500
+    )
+    summary_text = response.choices[0].message.content.strip()
+
+    try:
+        with transaction.atomic():
+            summary = DailyConversationSummary.objects.create(
+                user_id=user_id,
+                pregnancy_id=pregnancy_id,
+                summary_date=summary_date,
+                summary_text=summary_text
+            )
+    except IntegrityError:
+        # 같은 날짜 요약이 동시에 만들어진 경우
+        raise SummaryExists(summary_date)
+
+    # 대화 연결
+    summary.conversations.set(conversations)
+    return summary
@@ -0,0 +1,201 @@
+import logging
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core import signing
+
+from .models import CalendarFeed, Event
+from .recurrence import parse_date
+
+logger = logging.getLogger(__name__)
+
+FEED_SIGNING_SALT = 'calendars.ics-feed'
+FEED_CHUNK_SIZE = 500
+PRODID = '-//Nooridal//Calendar//KO'
+UID_DOMAIN = 'nooridal'
+MAX_LINE_OCTETS = 75
+
+RRULE_FREQ = {'daily': 'DAILY', 'weekly': 'WEEKLY', 'monthly': 'MONTHLY', 'yearly': 'YEARLY'}
+EVENT_TYPE_LABELS = dict(Event.EVENT_TYPES)
+
+# 서비스 시간대(Asia/Seoul)는 서머타임이 없으므로 고정 오프셋 VTIMEZONE 하나로 충분
+VTIMEZONE = [
+    'BEGIN:VTIMEZONE',
+    f'TZID:{settings.TIME_ZONE}',
+    'BEGIN:STANDARD',
+    'DTSTART:19700101T000000',
+    'TZOFFSETFROM:+0900',
+    'TZOFFSETTO:+0900',
+    'TZNAME:KST',
+    'END:STANDARD',
+    'END:VTIMEZONE',
+]
+
+
+def get_feed(user) -> CalendarFeed:
+    """사용자 구독 피드 (없으면 생성)"""
+    feed, _ = CalendarFeed.objects.get_or_create(user=user)
+    return feed
+
+
+def make_feed_token(feed: CalendarFeed) -> str:
+    """
+    구독용 서명 토큰 (사용자 ID + 피드 nonce)
+
+    캘린더 앱은 주소를 계속 다시 조회하므로 만료는 두지 않고, 유출 시 nonce를 바꿔(CalendarFeed.rotate) 무효화합니다.
+    """
+    return signing.dumps([str(feed.user_id), feed.nonce], salt=FEED_SIGNING_SALT)
+
+
+def feed_from_token(token: str):
+    """토큰의 구독 피드 (서명이 올바르지 않거나, nonce가 바뀌었거나, 탈퇴/비활성 사용자면 None)"""
+    try:
+        user_id, nonce = signing.loads(token, salt=FEED_SIGNING_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    return CalendarFeed.objects.filter(user_id=user_id, nonce=nonce, user__is_active=True).first()
+
+
+def escape_text(value: str) -> str:
+    """RFC 5545 TEXT 값 이스케이프"""
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+        .replace('\r', '\\n')
+    )
+
+
+def fold(line: str) -> bytes:
+    """75옥텟 단위 줄 접기 (UTF-8 문자 중간에서 자르지 않음)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return encoded + b'\r\n'
+
+    parts = []
+    start = 0
+    limit = MAX_LINE_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # UTF-8 연속 바이트(10xxxxxx)에서 끊기지 않도록 앞으로 이동
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(encoded[start:end])
+        start = end
+        limit = MAX_LINE_OCTETS - 1  # 이어지는 줄은 앞의 공백 1옥텟 포함
+    return b'\r\n '.join(parts) + b'\r\n'
+
+
+def _format_date(value) -> str:
+    return value.strftime('%Y%m%d')
+
+
+def _format_local(value_date, value_time) -> str:
+    return datetime.combine(value_date, value_time).strftime('%Y%m%dT%H%M%S')
+
+
+def _format_utc(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _rrule(event) -> str:
+    """recurrence_rules → RRULE 값"""
+    rules = event.recurrence_rules
+    parts = [f"FREQ={RRULE_FREQ[rules['pattern']]}"]
+    if rules.get('interval', 1) != 1:
+        parts.append(f"INTERVAL={rules['interval']}")
+    if rules.get('byday'):
+        parts.append(f"BYDAY={','.join(rules['byday'])}")
+
+    if rules.get('bymonthday'):
+        parts.append(f"BYMONTHDAY={','.join(str(day) for day in rules['bymonthday'])}")
+    elif rules['pattern'] == 'monthly' and not rules.get('byday') and event.start_date.day > 28:
+        # 기존 monthly 규칙은 말일을 넘으면 말일로 보정하므로 (시작일, 말일) 중 첫 날짜로 표현
+        day = event.start_date.day
+        parts.append('BYMONTHDAY=-1' if day == 31 else f'BYMONTHDAY={day},-1;BYSETPOS=1')
+
+    if rules.get('count') and not rules.get('until'):
+        parts.append(f"COUNT={rules['count']}")
+    elif event.recurrence_until:
+        # until이 없는 기존 규칙도 기본 반복 기간(1년)이 반영된 recurrence_until 사용
+        if event.start_time:
+            local_end = datetime.combine(
+                event.recurrence_until, event.start_time, tzinfo=ZoneInfo(settings.TIME_ZONE)
+            )
+            parts.append(f"UNTIL={_format_utc(local_end)}")
+        else:
+            parts.append(f"UNTIL={_format_date(event.recurrence_until)}")
+    return ';'.join(parts)
+
+
+def event_lines(event) -> list:
+    """일정 하나의 VEVENT 줄 목록 (반복 일정은 RRULE/EXDATE로 표현하고 펼치지 않음)"""
+    tzid = settings.TIME_ZONE
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{event.event_id}@{UID_DOMAIN}',
+        f'DTSTAMP:{_format_utc(event.updated_at)}',
+        f'LAST-MODIFIED:{_format_utc(event.updated_at)}',
+        f'CREATED:{_format_utc(event.created_at)}',
+    ]
+
+    end_date = event.end_date or event.start_date
+    if event.start_time:
+        lines.append(f'DTSTART;TZID={tzid}:{_format_local(event.start_date, event.start_time)}')
+        end_time = event.end_time or event.start_time
+        lines.append(f'DTEND;TZID={tzid}:{_format_local(end_date, end_time)}')
+    else:
+        # 종일 일정의 DTEND는 다음 날 (배타적)
+        lines.append(f'DTSTART;VALUE=DATE:{_format_date(event.start_date)}')
+        lines.append(f'DTEND;VALUE=DATE:{_format_date(end_date + timedelta(days=1))}')
+
+    lines.append(f'SUMMARY:{escape_text(event.title)}')
+    if event.description:
+        lines.append(f'DESCRIPTION:{escape_text(event.description)}')
+    lines.append(f'CATEGORIES:{escape_text(EVENT_TYPE_LABELS.get(event.event_type, event.event_type))}')
+
+    rules = event.recurrence_rules
+    if rules and rules.get('pattern') in RRULE_FREQ:
+        lines.append(f'RRULE:{_rrule(event)}')
+        exceptions = sorted(parse_date(value) for value in rules.get('exceptions') or [])
+        if exceptions:
+            if event.start_time:
+                values = ','.join(_format_local(value, event.start_time) for value in exceptions)
+                lines.append(f'EXDATE;TZID={tzid}:{values}')
+            else:
+                lines.append(f"EXDATE;VALUE=DATE:{','.join(_format_date(value) for value in exceptions)}")
+
+    lines.append('END:VEVENT')
+    return lines
+
+
+def iter_calendar(user_id, calendar_name: str = '누리달'):
+    """
+    사용자 일정 전체를 iCalendar 바이트 조각으로 생성 (StreamingHttpResponse용)
+
+    일정은 서버 측 커서로 청크 단위로 읽어 한 번에 메모리에 올리지 않습니다.
+    """
+    header = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape_text(calendar_name)}',
+        f'X-WR-TIMEZONE:{settings.TIME_ZONE}',
+    ] + VTIMEZONE
+    yield b''.join(fold(line) for line in header)
+
+    events = Event.objects.filter(user_id=user_id).order_by('start_date', 'event_id')
+    for event in events.iterator(chunk_size=FEED_CHUNK_SIZE):
+        try:
+            yield b''.join(fold(line) for line in event_lines(event))
+        except (KeyError, TypeError, ValueError) as e:
+            # 해석할 수 없는 기존 규칙은 피드 전체를 깨뜨리지 않도록 건너뜀
+            logger.warning(f"iCalendar 변환 실패 (일정 {event.event_id}): {e}")
+
+    yield fold('END:VCALENDAR')
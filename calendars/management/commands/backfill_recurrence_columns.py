@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from calendars.models import Event
+
+
+class Command(BaseCommand):
+    help = '기존 일정의 recurrence_rules에서 recurrence_pattern, recurrence_until 컬럼 채우기 (청크 단위)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='한 번에 처리할 일정 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        pending = Event.objects.filter(recurrence_rules__isnull=False, recurrence_pattern__isnull=True)
+        total = pending.count()
+        self.stdout.write(f"백필 대상 일정: {total}건 (청크 크기 {chunk_size})")
+
+        processed = 0
+        last_id = None
+        while True:
+            chunk_query = pending.order_by('event_id')
+            if last_id is not None:
+                chunk_query = chunk_query.filter(event_id__gt=last_id)
+            chunk = list(chunk_query.only('event_id', 'start_date', 'recurrence_rules')[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1].event_id
+
+            for event in chunk:
+                event.sync_recurrence_columns()
+            # bulk_update는 save()와 시그널을 거치지 않으므로 updated_at과 월간 캐시는 그대로 유지됨
+            Event.objects.bulk_update(chunk, ['recurrence_pattern', 'recurrence_until'])
+
+            processed += len(chunk)
+            self.stdout.write(f"  {processed}/{total}건 처리")
+
+        self.stdout.write(self.style.SUCCESS(f"백필 완료: 일정 {processed}건"))
@@ -0,0 +1,54 @@
+import json
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from calendars.scale_benchmark import DEFAULT_SIZES, run_suite
+
+
+class Command(BaseCommand):
+    help = '일정 규모별 벤치마크: 월/분기/연 조회와 반복 일정 수정/삭제의 지연 시간, 쿼리 수, 메모리 측정 (JSON 출력)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+            help='사용자별 일정 수, 쉼표로 구분 (기본값: 10,100,1000)'
+        )
+        parser.add_argument(
+            '--windows', default='month,quarter,year', help='조회 구간, 쉼표로 구분 (기본값: month,quarter,year)'
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='항목별 반복 측정 횟수 (기본값: 5)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--anchor', help='조회 기준일 YYYY-MM-DD (기본값: 오늘)')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (없으면 표준 출력)')
+        parser.add_argument(
+            '--keepdb', action='store_true',
+            help='벤치마크용 테스트 데이터베이스를 삭제하지 않고 재사용 (Postgres에서 테이블 생성 시간 절약)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',') if size.strip()]
+            anchor = datetime.strptime(options['anchor'], '%Y-%m-%d').date() if options['anchor'] else None
+        except ValueError:
+            raise CommandError('--sizes는 정수 목록, --anchor는 YYYY-MM-DD 형식이어야 합니다.')
+        windows = [name.strip() for name in options['windows'].split(',') if name.strip()]
+        if set(windows) - {'month', 'quarter', 'year'}:
+            raise CommandError('--windows는 month, quarter, year 중에서 선택해야 합니다.')
+
+        # 운영 데이터를 건드리지 않도록 설정된 DB 엔진(Postgres/SQLite)의 테스트 데이터베이스에서 실행
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            report = run_suite(sizes, windows, options['repeat'], options['seed'], anchor)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+
+        payload = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(payload)
+            self.stdout.write(self.style.SUCCESS(f"벤치마크 결과 저장: {options['output']}"))
+            return
+        self.stdout.write(payload)
@@ -0,0 +1,132 @@
+import copy
+import json
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, time as dtime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from calendars.models import Event
+from calendars.occurrences import OccurrenceRecord
+from calendars.recurrence import CompiledRule
+from calendars.serializers import EventSerializer, render_occurrences
+
+
+def legacy_render(events, window_start, window_end):
+    """기존 방식: 발생마다 모델 인스턴스를 copy.copy 후 EventSerializer + JSONRenderer로 직렬화 (비교용)"""
+    instances = []
+    for event in events:
+        duration = (event.end_date - event.start_date).days if event.end_date else None
+        rule = CompiledRule.from_rules(event.recurrence_rules, event.start_date)
+        for occurrence in rule.occurrences(window_start, window_end):
+            if occurrence == event.start_date:
+                instances.append(event)
+                continue
+            instance = copy.copy(event)
+            instance._is_virtual = True
+            instance._original_event_id = event.event_id
+            instance.start_date = occurrence
+            instance.end_date = occurrence + timedelta(days=duration) if duration is not None else None
+            instances.append(instance)
+    return JSONRenderer().render(EventSerializer(instances, many=True).data)
+
+
+def record_render(events, window_start, window_end):
+    """OccurrenceRecord + render_occurrences"""
+    records = []
+    for event in events:
+        duration = (event.end_date - event.start_date) if event.end_date else None
+        rule = CompiledRule.from_rules(event.recurrence_rules, event.start_date)
+        for occurrence in rule.occurrences(window_start, window_end):
+            records.append(OccurrenceRecord(event, occurrence, occurrence + duration if duration is not None else None))
+    return render_occurrences(records)
+
+
+class Command(BaseCommand):
+    help = '연간 조회 렌더링: 모델 인스턴스 복사 + EventSerializer와 OccurrenceRecord + 전용 직렬화 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=100, help='반복 일정 수 (기본값: 100)')
+        parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수 (기본값: 3)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def _make_events(self, count, seed, window_start):
+        rng = random.Random(seed)
+        user_id = uuid.uuid4()
+        now = timezone.now()
+        events = []
+        for index in range(count):
+            start = window_start - timedelta(days=rng.randint(0, 365))
+            pattern = rng.choice(['daily', 'weekly', 'weekly', 'monthly'])
+            event = Event(
+                user_id=user_id,
+                title=f'반복 일정 {index}',
+                description='벤치마크용 일정 설명입니다.',
+                start_date=start,
+                end_date=start + timedelta(days=rng.choice([0, 0, 1])),
+                start_time=dtime(rng.randint(6, 20), 0),
+                recurrence_rules={
+                    'pattern': pattern,
+                    'until': (window_start + timedelta(days=400)).isoformat(),
+                    'exceptions': [],
+                },
+            )
+            event.created_at = event.updated_at = now
+            events.append(event)
+        return events
+
+    def _measure(self, func, events, window_start, window_end, repeat):
+        elapsed = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(events, window_start, window_end)
+            elapsed.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        payload = func(events, window_start, window_end)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return min(elapsed) * 1000, peak, payload
+
+    def handle(self, *args, **options):
+        window_start = date(date.today().year, 1, 1)
+        window_end = date(window_start.year, 12, 31)
+        events = self._make_events(options['events'], options['seed'], window_start)
+
+        legacy_ms, legacy_peak, legacy_payload = self._measure(
+            legacy_render, events, window_start, window_end, options['repeat']
+        )
+        record_ms, record_peak, record_payload = self._measure(
+            record_render, events, window_start, window_end, options['repeat']
+        )
+        occurrences = json.loads(record_payload)
+        if json.loads(legacy_payload) != occurrences:
+            self.stderr.write(self.style.ERROR('직렬화 결과가 일치하지 않습니다.'))
+            return
+
+        result = {
+            'events': len(events),
+            'occurrences': len(occurrences),
+            'legacy_ms': round(legacy_ms, 1),
+            'record_ms': round(record_ms, 1),
+            'legacy_peak_kb': round(legacy_peak / 1024, 1),
+            'record_peak_kb': round(record_peak / 1024, 1),
+            'speedup': round(legacy_ms / record_ms, 1) if record_ms else None,
+            'memory_ratio': round(legacy_peak / record_peak, 1) if record_peak else None,
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, indent=2))
+            return
+
+        self.stdout.write(f"반복 일정 {result['events']}개, 연간 발생 {result['occurrences']}건")
+        self.stdout.write(f"기존 방식: {result['legacy_ms']}ms, 최대 메모리 {result['legacy_peak_kb']}KB")
+        self.stdout.write(f"OccurrenceRecord: {result['record_ms']}ms, 최대 메모리 {result['record_peak_kb']}KB")
+        self.stdout.write(self.style.SUCCESS(
+            f"결과 일치, {result['speedup']}배 빠름, 메모리 {result['memory_ratio']}배 적음"
+        ))
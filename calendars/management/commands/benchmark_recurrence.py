@@ -0,0 +1,153 @@
+import json
+import random
+import calendar
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from calendars.recurrence import CompiledRule, RuleCache
+
+
+def legacy_expand_dates(recurrence_rules, event_start, start_date, end_date):
+    """
+    기존 EventViewSet._expand_recurring_event의 반복일 계산 (비교용)
+
+    시작일부터 하루/한 주/한 달씩 이동하며, 매번 strftime으로 예외 목록을 확인합니다.
+    """
+    pattern = recurrence_rules.get('pattern')
+    until_date_str = recurrence_rules.get('until')
+    exceptions = recurrence_rules.get('exceptions', [])
+    if until_date_str:
+        until_date = datetime.strptime(until_date_str, '%Y-%m-%d').date()
+    else:
+        until_date = event_start + timedelta(days=365)
+    end_date = min(end_date, until_date)
+    if end_date < event_start or start_date > until_date:
+        return []
+
+    result = []
+    if start_date <= event_start <= end_date and event_start.strftime('%Y-%m-%d') not in exceptions:
+        result.append(event_start)
+
+    if pattern in ('daily', 'weekly'):
+        step = timedelta(days=1 if pattern == 'daily' else 7)
+        current = event_start + step
+        while current <= end_date:
+            if current >= start_date and current.strftime('%Y-%m-%d') not in exceptions:
+                result.append(current)
+            current += step
+    elif pattern == 'monthly':
+        day = event_start.day
+
+        def next_month(value):
+            year, month = (value.year + 1, 1) if value.month == 12 else (value.year, value.month + 1)
+            return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+        current = next_month(event_start)
+        while current <= end_date:
+            if current >= start_date and current.strftime('%Y-%m-%d') not in exceptions:
+                result.append(current)
+            current = next_month(current)
+    elif pattern == 'yearly':
+        for year in range(event_start.year + 1, end_date.year + 1):
+            try:
+                current = date(year, event_start.month, event_start.day)
+            except ValueError:
+                continue
+            if current > end_date:
+                break
+            if current >= start_date and current.strftime('%Y-%m-%d') not in exceptions:
+                result.append(current)
+    return result
+
+
+class _Event:
+    """벤치마크용 최소 일정 객체"""
+
+    __slots__ = ('event_id', 'updated_at', 'start_date', 'recurrence_rules')
+
+    def __init__(self, start_date, recurrence_rules):
+        self.event_id = uuid.uuid4()
+        self.updated_at = datetime.now()
+        self.start_date = start_date
+        self.recurrence_rules = recurrence_rules
+
+
+class Command(BaseCommand):
+    help = '반복 일정 확장: 기존 순차 방식과 산술 계산 엔진의 결과 및 속도 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=200, help='반복 일정 수 (기본값: 200)')
+        parser.add_argument('--age-days', type=int, default=730, help='일정 시작일이 조회 월보다 앞선 최대 일수 (기본값: 730)')
+        parser.add_argument('--exceptions', type=int, default=30, help='일정별 예외 날짜 수 (기본값: 30)')
+        parser.add_argument('--repeat', type=int, default=20, help='월 조회 반복 횟수 (기본값: 20)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def _make_events(self, options, window_start):
+        rng = random.Random(options['seed'])
+        events = []
+        for _ in range(options['events']):
+            start = window_start - timedelta(days=rng.randint(0, options['age_days']))
+            pattern = rng.choice(['daily', 'daily', 'weekly', 'monthly', 'yearly'])
+            until = start + timedelta(days=rng.randint(365, 365 * 3))
+            exceptions = sorted({
+                (start + timedelta(days=rng.randint(0, (until - start).days))).strftime('%Y-%m-%d')
+                for _ in range(options['exceptions'])
+            })
+            events.append(_Event(start, {
+                'pattern': pattern,
+                'until': until.strftime('%Y-%m-%d'),
+                'exceptions': exceptions,
+            }))
+        return events
+
+    def handle(self, *args, **options):
+        window_start = date.today().replace(day=1)
+        window_end = window_start.replace(day=calendar.monthrange(window_start.year, window_start.month)[1])
+        events = self._make_events(options, window_start)
+
+        # 결과 일치 확인
+        cache = RuleCache()
+        for event in events:
+            expected = legacy_expand_dates(event.recurrence_rules, event.start_date, window_start, window_end)
+            actual = list(cache.get(event).occurrences(window_start, window_end))
+            if expected != actual:
+                raise CommandError(f"결과 불일치: {event.recurrence_rules} / {event.start_date}")
+
+        def measure(func):
+            started = time.perf_counter()
+            for _ in range(options['repeat']):
+                for event in events:
+                    func(event)
+            return (time.perf_counter() - started) / options['repeat'] * 1000
+
+        legacy_ms = measure(
+            lambda event: legacy_expand_dates(event.recurrence_rules, event.start_date, window_start, window_end)
+        )
+        cold_ms = measure(
+            lambda event: list(CompiledRule.from_rules(event.recurrence_rules, event.start_date)
+                               .occurrences(window_start, window_end))
+        )
+        cached_ms = measure(lambda event: list(cache.get(event).occurrences(window_start, window_end)))
+
+        result = {
+            'events': len(events),
+            'window': [window_start.isoformat(), window_end.isoformat()],
+            'legacy_ms_per_month_view': round(legacy_ms, 3),
+            'engine_uncached_ms_per_month_view': round(cold_ms, 3),
+            'engine_cached_ms_per_month_view': round(cached_ms, 3),
+            'speedup_cached': round(legacy_ms / cached_ms, 1) if cached_ms else None,
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, indent=2))
+            return
+
+        self.stdout.write(f"반복 일정 {result['events']}개, 조회 구간 {result['window'][0]} ~ {result['window'][1]}")
+        self.stdout.write(f"기존 방식: {result['legacy_ms_per_month_view']}ms / 월 조회")
+        self.stdout.write(f"엔진 (캐시 없음): {result['engine_uncached_ms_per_month_view']}ms / 월 조회")
+        self.stdout.write(f"엔진 (규칙 캐시): {result['engine_cached_ms_per_month_view']}ms / 월 조회")
+        self.stdout.write(self.style.SUCCESS(f"결과 일치, {result['speedup_cached']}배 빠름"))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from calendars.occurrences import extend_occurrences, horizon_end
+
+
+class Command(BaseCommand):
+    help = '일정 발생일 테이블 생성 (기존 일정 백필, --rebuild 시 전체 재생성)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='이미 생성된 일정도 발생일을 처음부터 다시 생성'
+        )
+
+    def handle(self, *args, **options):
+        horizon = horizon_end()
+        self.stdout.write(f"{horizon}까지 일정 발생일 생성 중...")
+        processed = extend_occurrences(horizon, rebuild=options['rebuild'])
+        self.stdout.write(self.style.SUCCESS(f"완료: {processed}개 일정 처리"))
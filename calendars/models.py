@@ -5,6 +5,7 @@ from sorl.thumbnail import get_thumbnail
 import os
 # PostgreSQL의 JSONField 대신 Django 기본 JSONField 사용
 from django.db.models import JSONField
+from .recurrence import CompiledRule
 
 
 
@@ -58,7 +59,7 @@ class Event(models.Model):
         null=True, 
         blank=True, 
         verbose_name='반복 규칙',
-        help_text='{"pattern": "daily/weekly/monthly/yearly", "until": "2024-12-31", "exceptions": ["2024-06-15"]}'
+        help_text='{"pattern": "daily/weekly/monthly/yearly", "interval": 1, "byday": ["MO", "WE"], "bymonthday": [1, -1], "count": 10, "until": "2024-12-31", "exceptions": ["2024-06-15"]}'
     )
     event_color = models.CharField(
         max_length=7,
@@ -66,6 +67,13 @@ class Event(models.Model):
         default='#FFD600',
         verbose_name='일정 색상'
     )
+    # recurrence_rules에서 파생된 컬럼 (DB에서 반복 일정 범위를 거르기 위해 save() 시 동기화)
+    recurrence_pattern = models.CharField(
+        max_length=10, null=True, blank=True, editable=False, verbose_name='반복 패턴'
+    )
+    recurrence_until = models.DateField(null=True, blank=True, editable=False, verbose_name='반복 종료일')
+    # EventOccurrence 테이블에 반복일이 빠짐없이 저장된 마지막 날짜 (null이면 아직 생성 전)
+    materialized_until = models.DateField(null=True, blank=True, editable=False, verbose_name='반복일 생성 완료일')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -73,10 +81,95 @@ class Event(models.Model):
         ordering = ['start_date', 'start_time']
         verbose_name = '일정'
         verbose_name_plural = '일정들'
+        indexes = [
+            models.Index(
+                fields=['user', 'recurrence_pattern', 'recurrence_until', 'start_date'],
+                name='cal_event_user_recur_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.start_date} - {self.title}"
 
+    def sync_recurrence_columns(self):
+        """
+        recurrence_rules에서 recurrence_pattern, recurrence_until 계산
+
+        recurrence_until은 count나 기본 반복 기간(1년)까지 반영한 실제 마지막 반복 가능일입니다.
+        규칙을 해석할 수 없으면 recurrence_until을 비워 두어 DB에서 걸러지지 않게 합니다.
+        """
+        rules = self.recurrence_rules
+        if not rules or not isinstance(rules, dict):
+            self.recurrence_pattern = None
+            self.recurrence_until = None
+            return
+        self.recurrence_pattern = rules.get('pattern')
+        try:
+            self.recurrence_until = CompiledRule.from_rules(rules, self.start_date).until
+        except (TypeError, ValueError, AttributeError):
+            self.recurrence_until = None
+
+    def save(self, *args, **kwargs):
+        self.sync_recurrence_columns()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and ({'recurrence_rules', 'start_date'} & set(update_fields)):
+            kwargs['update_fields'] = set(update_fields) | {'recurrence_pattern', 'recurrence_until'}
+        super().save(*args, **kwargs)
+
+
+class EventOccurrence(models.Model):
+    """
+    일정 발생일 모델
+
+    반복 일정을 미리 펼쳐 둔 테이블로, 월간 조회를 (user, occurrence_date) 범위 쿼리 하나로 처리합니다.
+    반복이 없는 일정도 한 행으로 저장합니다.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='occurrences', verbose_name='일정')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='event_occurrences', verbose_name='사용자')
+    occurrence_date = models.DateField(verbose_name='발생 날짜')
+    end_date = models.DateField(null=True, blank=True, verbose_name='종료 날짜')
+
+    class Meta:
+        verbose_name = '일정 발생일'
+        verbose_name_plural = '일정 발생일 목록'
+        unique_together = ['event', 'occurrence_date']
+        indexes = [
+            models.Index(fields=['user', 'occurrence_date'], name='cal_occ_user_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.occurrence_date} - {self.event_id}"
+
+
+def new_feed_nonce():
+    return uuid.uuid4().hex
+
+
+class CalendarFeed(models.Model):
+    """
+    사용자별 iCalendar 구독 피드
+
+    구독 토큰에 nonce가 들어가므로, nonce를 새로 만들면 이전에 발급한 구독 주소는 더 이상 동작하지 않습니다.
+    """
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='calendar_feed', verbose_name='사용자'
+    )
+    nonce = models.CharField(max_length=32, default=new_feed_nonce, verbose_name='토큰 nonce')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '캘린더 구독 피드'
+        verbose_name_plural = '캘린더 구독 피드 목록'
+
+    def __str__(self):
+        return f"{self.user_id} 구독 피드"
+
+    def rotate(self):
+        """구독 주소 재발급 (이전 토큰 무효화)"""
+        self.nonce = new_feed_nonce()
+        self.save(update_fields=['nonce', 'updated_at'])
+
 
 class DailyConversationSummary(models.Model):
     """일별 LLM 대화 요약 모델"""
@@ -0,0 +1,84 @@
+import logging
+
+from django.core.cache import cache
+
+from accounts.utils.conditional_utils import bump_resource_version, get_resource_version
+
+logger = logging.getLogger(__name__)
+
+# 월간 일정 응답 캐시 유지 시간 (무효화는 버전으로 처리하고, 이전 버전 항목을 정리하기 위한 값)
+MONTH_CACHE_TIMEOUT = 60 * 60 * 24
+
+EVENTS_RESOURCE = 'events'
+MONTH_KEY = 'calendar:month:{user_id}:v{version}:{start}:{end}'
+HITS_KEY = 'calendar:month_cache:hits'
+MISSES_KEY = 'calendar:month_cache:misses'
+
+
+def _incr(key: str) -> int:
+    """캐시 카운터 1 증가 (키가 없으면 새로 생성)"""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key)
+
+
+def get_version(user_id) -> int:
+    """
+    사용자 일정 버전 (조건부 요청의 'events' 리소스 버전과 공유)
+
+    버전 키가 캐시에서 밀려나도 이전 버전의 응답을 다시 쓰지 않도록
+    처음 값은 1이 아닌 현재 시각(ns)으로 정합니다.
+    """
+    return get_resource_version(user_id, EVENTS_RESOURCE)
+
+
+def bump_version(user_id):
+    """사용자 일정 버전 갱신 (이전 버전의 월간 캐시와 ETag는 더 이상 일치하지 않음)"""
+    bump_resource_version(user_id, EVENTS_RESOURCE)
+
+
+def cached_month_payload(user_id, start_date, end_date, build):
+    """
+    (사용자, 조회 구간) 단위 일정 응답 캐시
+
+    응답과 버전 키 모두 공유 캐시(Redis)에 저장하므로, 한 워커나 Celery 태스크에서 일정이 바뀌면
+    모든 워커에서 이전 버전의 응답이 더 이상 조회되지 않습니다.
+    Args:
+        build: 캐시에 없을 때 응답 데이터를 만드는 함수
+
+    Returns:
+        tuple: (응답 데이터, 캐시 적중 여부)
+    """
+    key = MONTH_KEY.format(
+        user_id=user_id,
+        version=get_version(user_id),
+        start=start_date.isoformat(),
+        end=end_date.isoformat()
+    )
+    payload = cache.get(key)
+    if payload is not None:
+        _incr(HITS_KEY)
+        return payload, True
+
+    payload = build()
+    cache.set(key, payload, timeout=MONTH_CACHE_TIMEOUT)
+    _incr(MISSES_KEY)
+    return payload, False
+
+
+def cache_stats() -> dict:
+    """월간 일정 캐시 적중률 (모든 워커가 공유하는 캐시 기준)"""
+    hits = cache.get(HITS_KEY) or 0
+    misses = cache.get(MISSES_KEY) or 0
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+    }
+
+
+def reset_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,193 @@
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Event, EventOccurrence
+from .recurrence import CompiledRule, event_occurrences
+
+logger = logging.getLogger(__name__)
+
+OCCURRENCE_BATCH_SIZE = 1000
+
+# 더 이상 생성할 반복일이 없는 일정의 materialized_until 값
+FULLY_MATERIALIZED = date.max
+
+
+class OccurrenceRecord:
+    """
+    일정 발생 1건
+
+    원본 일정 객체는 여러 발생이 공유하고, 발생마다 달라지는 날짜만 보관합니다.
+    (모델 인스턴스를 복사하지 않음)
+    """
+
+    __slots__ = ('event', 'start_date', 'end_date')
+
+    def __init__(self, event, start_date: date, end_date):
+        self.event = event
+        self.start_date = start_date
+        self.end_date = end_date
+
+    @property
+    def is_virtual(self) -> bool:
+        """원본 일정의 시작일이 아닌 반복 인스턴스인지 여부"""
+        return self.start_date != self.event.start_date
+
+    @classmethod
+    def for_event(cls, event):
+        return cls(event, event.start_date, event.end_date)
+
+
+def horizon_end(today=None) -> date:
+    """발생일을 미리 생성해 둘 마지막 날짜 (오늘 + EVENT_OCCURRENCE_HORIZON_DAYS)"""
+    today = today or timezone.localdate()
+    return today + timedelta(days=settings.EVENT_OCCURRENCE_HORIZON_DAYS)
+
+
+def _build_rows(event, rule, start: date, end: date):
+    """[start, end] 구간의 EventOccurrence 행 (저장 전)"""
+    duration = (event.end_date - event.start_date).days if event.end_date else None
+    if rule is None:
+        dates = [event.start_date] if start <= event.start_date <= end else []
+    else:
+        dates = rule.occurrences(start, end)
+    for current in dates:
+        yield EventOccurrence(
+            event_id=event.event_id,
+            user_id=event.user_id,
+            occurrence_date=current,
+            end_date=current + timedelta(days=duration) if duration is not None else None,
+        )
+
+
+def _plan_range(event, start: date, horizon: date):
+    """
+    [start, horizon] 구간에 저장할 행과 새 materialized_until 값
+
+    반복이 horizon 전에 끝나면 더 생성할 날짜가 없으므로 FULLY_MATERIALIZED를 반환합니다.
+    반복 없는 일정도 시작일이 horizon 뒤이면 아직 행이 없으므로 horizon을 반환합니다
+    (horizon 연장 시 행이 생성되고, 그 전까지는 조회 시 직접 포함됨).
+    """
+    rule = CompiledRule.from_rules(event.recurrence_rules, event.start_date) if event.recurrence_rules else None
+    last_date = event.start_date if rule is None else rule.until
+    materialized_until = FULLY_MATERIALIZED if last_date <= horizon else horizon
+    return _build_rows(event, rule, start, horizon), materialized_until
+
+
+def _materialize_range(event, start: date, horizon: date) -> date:
+    """[start, horizon] 구간의 발생일을 저장하고 새 materialized_until 값을 반환"""
+    rows, materialized_until = _plan_range(event, start, horizon)
+    EventOccurrence.objects.bulk_create(rows, batch_size=OCCURRENCE_BATCH_SIZE, ignore_conflicts=True)
+    return materialized_until
+
+
+def materialize_event(event, horizon=None) -> date:
+    """
+    일정의 발생일을 처음부터 다시 생성 (일정 저장, update_recurring, delete_recurring 시)
+
+    updated_at이 바뀌지 않도록 materialized_until은 update()로 저장합니다.
+    """
+    return materialize_events([event], horizon)[event.event_id]
+
+
+def materialize_events(events, horizon=None) -> dict:
+    """
+    여러 일정의 발생일을 한 번에 다시 생성 (일괄 생성/수정 시)
+
+    기존 행 삭제, 새 행 저장, materialized_until 갱신을 일정 수와 관계없이 몇 개의 쿼리로 처리합니다.
+
+    Returns:
+        dict: {event_id: materialized_until}
+    """
+    horizon = horizon or horizon_end()
+    rows = []
+    result = {}
+    by_until = defaultdict(list)
+    for event in events:
+        event_rows, materialized_until = _plan_range(event, event.start_date, horizon)
+        rows.extend(event_rows)
+        result[event.event_id] = event.materialized_until = materialized_until
+        by_until[materialized_until].append(event.event_id)
+
+    with transaction.atomic():
+        EventOccurrence.objects.filter(event_id__in=list(result)).delete()
+        EventOccurrence.objects.bulk_create(rows, batch_size=OCCURRENCE_BATCH_SIZE)
+        for materialized_until, event_ids in by_until.items():
+            Event.objects.filter(pk__in=event_ids).update(materialized_until=materialized_until)
+    return result
+
+
+def extend_occurrences(horizon=None, rebuild=False) -> int:
+    """
+    materialized_until이 horizon보다 앞선 일정의 발생일을 horizon까지 이어서 생성
+
+    Args:
+        horizon: 생성할 마지막 날짜 (기본값: horizon_end())
+        rebuild: True이면 모든 일정의 발생일을 처음부터 다시 생성
+
+    Returns:
+        int: 처리한 일정 수
+    """
+    horizon = horizon or horizon_end()
+    events = Event.objects.all() if rebuild else Event.objects.exclude(materialized_until__gte=horizon)
+    processed = 0
+    for event in events.order_by('pk').iterator(chunk_size=OCCURRENCE_BATCH_SIZE):
+        if rebuild or event.materialized_until is None:
+            materialize_event(event, horizon)
+        else:
+            with transaction.atomic():
+                materialized_until = _materialize_range(
+                    event, event.materialized_until + timedelta(days=1), horizon
+                )
+                Event.objects.filter(pk=event.pk).update(materialized_until=materialized_until)
+        processed += 1
+    logger.info(f"일정 발생일 생성: {processed}개 일정, {horizon}까지")
+    return processed
+
+
+def occurrences_in_range(user, start_date: date, end_date: date) -> list:
+    """
+    조회 구간에 시작하는 일정 및 반복 인스턴스 목록 (OccurrenceRecord)
+
+    EventOccurrence 테이블을 (user, occurrence_date) 범위 쿼리로 조회하고,
+    원본 일정은 pk로 한 번만 읽어 발생들이 공유합니다.
+    발생일이 아직 조회 구간 끝까지 생성되지 않은 일정(백필 전, horizon 밖 조회)만 직접 확장합니다.
+    """
+    rows = list(EventOccurrence.objects.filter(
+        user=user,
+        occurrence_date__gte=start_date,
+        occurrence_date__lte=end_date,
+        event__materialized_until__gte=end_date,
+    ).order_by('occurrence_date', 'event__start_time').values_list('event_id', 'occurrence_date', 'end_date'))
+
+    events = Event.objects.in_bulk({event_id for event_id, _, _ in rows}) if rows else {}
+    records = [
+        OccurrenceRecord(events[event_id], occurrence_date, occurrence_end)
+        for event_id, occurrence_date, occurrence_end in rows
+    ]
+
+    # 반복 없는 일정은 구간 안에 시작하는 것만, 반복 일정은 구간 전에 끝난 시리즈를 DB에서 제외
+    pending = Event.objects.filter(user=user, start_date__lte=end_date).filter(
+        Q(materialized_until__isnull=True) | Q(materialized_until__lt=end_date)
+    ).filter(
+        Q(recurrence_pattern__isnull=True, start_date__gte=start_date) |
+        Q(recurrence_pattern__isnull=False) & (
+            Q(recurrence_until__isnull=True) | Q(recurrence_until__gte=start_date)
+        )
+    )
+    for event in pending:
+        if event.recurrence_rules:
+            # 멀티데이 이벤트인 경우 일정 기간 계산
+            duration = (event.end_date - event.start_date) if event.end_date else None
+            records.extend(
+                OccurrenceRecord(event, occurrence, occurrence + duration if duration is not None else None)
+                for occurrence in event_occurrences(event, start_date, end_date)
+            )
+        elif event.start_date >= start_date:
+            records.append(OccurrenceRecord.for_event(event))
+    return records
@@ -0,0 +1,356 @@
+import re
+import calendar
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+logger = logging.getLogger(__name__)
+
+# until/count가 없는 반복 일정의 기본 반복 기간 (시작일로부터)
+DEFAULT_RECURRENCE_DAYS = 365
+
+# count만 있는 규칙의 마지막 반복일을 찾을 때 탐색할 최대 기간
+MAX_RECURRENCE_YEARS = 100
+
+# 허용 범위
+MAX_INTERVAL = 999
+MAX_COUNT = 1000
+
+# 컴파일된 규칙 캐시 크기
+RULE_CACHE_SIZE = 4096
+
+VALID_PATTERNS = ['daily', 'weekly', 'monthly', 'yearly']
+WEEKDAY_CODES = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+BYDAY_RE = re.compile(r'^([+-]?[1-5])?(MO|TU|WE|TH|FR|SA|SU)$')
+
+
+def parse_date(value):
+    """YYYY-MM-DD 문자열(또는 date)을 date로 변환"""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def add_months(start: date, months: int, day: int) -> date:
+    """start 기준 months개월 후의 day일 (해당 월의 마지막 날을 넘으면 마지막 날)"""
+    index = start.year * 12 + start.month - 1 + months
+    year, month = divmod(index, 12)
+    month += 1
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def parse_byday(values):
+    """
+    BYDAY 값 파싱
+
+    Returns:
+        list: (순번 또는 None, 요일 번호) 목록 - 예: "MO" → (None, 0), "-1FR" → (-1, 4)
+    """
+    parsed = []
+    for value in values:
+        match = BYDAY_RE.match(value)
+        ordinal, code = match.groups()
+        parsed.append((int(ordinal) if ordinal else None, WEEKDAY_CODES.index(code)))
+    return parsed
+
+
+def validate_recurrence_rules(recurrence_rules):
+    """
+    반복 규칙 구조 검증 (RFC 5545 RRULE의 INTERVAL, BYDAY, BYMONTHDAY, COUNT 지원)
+
+    {
+        "pattern": "daily/weekly/monthly/yearly",  # 필수 (RRULE FREQ)
+        "interval": 2,                             # 선택, 기본 1
+        "byday": ["MO", "WE", "FR"],               # 선택, daily/weekly는 요일, monthly는 "1MO", "-1FR"처럼 순번 가능
+        "bymonthday": [1, 15, -1],                 # 선택, monthly 전용 (음수는 말일 기준)
+        "count": 10,                               # 선택, 시작일을 포함한 총 반복 횟수
+        "until": "2024-12-31",                     # 선택
+        "exceptions": ["2024-06-15"]               # 선택
+    }
+
+    Raises:
+        ValueError: 규칙이 올바르지 않은 경우 (메시지는 사용자에게 그대로 노출)
+    """
+    if not isinstance(recurrence_rules, dict):
+        raise ValueError("반복 규칙은 객체 형태여야 합니다.")
+
+    if 'pattern' not in recurrence_rules:
+        raise ValueError("반복 패턴은 필수 항목입니다.")
+
+    pattern = recurrence_rules.get('pattern')
+    if pattern not in VALID_PATTERNS:
+        raise ValueError(f"유효한 반복 패턴이 아닙니다. 가능한 값: {', '.join(VALID_PATTERNS)}")
+
+    until = recurrence_rules.get('until')
+    if until:
+        try:
+            parse_date(until)
+        except (TypeError, ValueError):
+            raise ValueError("종료일은 YYYY-MM-DD 형식이어야 합니다.")
+
+    exceptions = recurrence_rules.get('exceptions', [])
+    if not isinstance(exceptions, list):
+        raise ValueError("예외 날짜는 리스트 형태여야 합니다.")
+    for exception_date in exceptions:
+        try:
+            parse_date(exception_date)
+        except (TypeError, ValueError):
+            raise ValueError("예외 날짜는 YYYY-MM-DD 형식이어야 합니다.")
+
+    interval = recurrence_rules.get('interval')
+    if interval is not None:
+        if isinstance(interval, bool) or not isinstance(interval, int) or not 1 <= interval <= MAX_INTERVAL:
+            raise ValueError(f"반복 간격(interval)은 1~{MAX_INTERVAL} 사이의 정수여야 합니다.")
+
+    count = recurrence_rules.get('count')
+    if count is not None:
+        if isinstance(count, bool) or not isinstance(count, int) or not 1 <= count <= MAX_COUNT:
+            raise ValueError(f"반복 횟수(count)는 1~{MAX_COUNT} 사이의 정수여야 합니다.")
+
+    byday = recurrence_rules.get('byday')
+    if byday is not None:
+        if pattern == 'yearly':
+            raise ValueError("byday는 daily, weekly, monthly 반복에서만 사용할 수 있습니다.")
+        if not isinstance(byday, list) or not byday:
+            raise ValueError("byday는 요일 코드 리스트여야 합니다. 예: [\"MO\", \"WE\"]")
+        for value in byday:
+            match = BYDAY_RE.match(value) if isinstance(value, str) else None
+            if not match:
+                raise ValueError(f"유효한 요일 코드가 아닙니다: {value} (가능한 값: {', '.join(WEEKDAY_CODES)})")
+            if match.group(1) and pattern != 'monthly':
+                raise ValueError("요일 순번(예: 1MO, -1FR)은 monthly 반복에서만 사용할 수 있습니다.")
+
+    bymonthday = recurrence_rules.get('bymonthday')
+    if bymonthday is not None:
+        if pattern != 'monthly':
+            raise ValueError("bymonthday는 monthly 반복에서만 사용할 수 있습니다.")
+        if not isinstance(bymonthday, list) or not bymonthday:
+            raise ValueError("bymonthday는 날짜 리스트여야 합니다. 예: [1, 15]")
+        for value in bymonthday:
+            if isinstance(value, bool) or not isinstance(value, int) or value == 0 or not -31 <= value <= 31:
+                raise ValueError("bymonthday 값은 1~31 또는 -31~-1 사이의 정수여야 합니다.")
+
+
+class CompiledRule:
+    """
+    반복 규칙을 미리 해석해 둔 객체
+
+    예외 날짜는 date 집합으로 변환해 두고, 조회 구간의 첫 반복일은
+    시작일부터 하루씩 이동하지 않고 산술 계산으로 바로 구합니다.
+    count는 컴파일 시 마지막 반복일로 바꿔 until과 같이 처리합니다.
+
+    시작일은 RFC 5545의 DTSTART처럼 항상 첫 번째 반복으로 포함됩니다.
+    """
+
+    __slots__ = ('pattern', 'start', 'until', 'exceptions', 'interval', 'weekdays', 'byday', 'bymonthday')
+
+    def __init__(self, pattern: str, start: date, until: date, exceptions: frozenset,
+                 interval: int = 1, byday=None, bymonthday=None):
+        self.pattern = pattern
+        self.start = start
+        self.until = until
+        self.exceptions = exceptions
+        self.interval = interval
+        # 순번 없는 요일 집합 (daily/weekly 필터, monthly의 "매주 해당 요일")
+        self.weekdays = tuple(sorted({weekday for ordinal, weekday in byday or [] if ordinal is None})) or None
+        self.byday = tuple(byday) if byday else None
+        self.bymonthday = tuple(bymonthday) if bymonthday else None
+
+    @classmethod
+    def from_rules(cls, recurrence_rules: dict, start_date: date):
+        until_value = recurrence_rules.get('until')
+        count = recurrence_rules.get('count')
+        if until_value:
+            until = parse_date(until_value)
+        elif count:
+            until = date(min(start_date.year + MAX_RECURRENCE_YEARS, date.max.year), 12, 31)
+        else:
+            until = start_date + timedelta(days=DEFAULT_RECURRENCE_DAYS)
+
+        rule = cls(
+            recurrence_rules.get('pattern'),
+            start_date,
+            until,
+            frozenset(parse_date(value) for value in recurrence_rules.get('exceptions') or []),
+            interval=recurrence_rules.get('interval') or 1,
+            byday=parse_byday(recurrence_rules['byday']) if recurrence_rules.get('byday') else None,
+            bymonthday=recurrence_rules.get('bymonthday'),
+        )
+
+        if count:
+            # count번째 반복일을 구해 종료일로 사용 (예외 날짜도 횟수에 포함)
+            last = None
+            for index, current in enumerate(rule._all(start_date, rule.until)):
+                last = current
+                if index + 1 >= count:
+                    break
+            if last is not None:
+                rule.until = min(rule.until, last)
+        return rule
+
+    # 패턴별 반복일 생성 (시작일 이후, 오름차순, 예외/시작일 처리 전)
+
+    def _daily(self, window_start, window_end):
+        interval = self.interval
+        skip = -(-(window_start - self.start).days // interval)  # 올림
+        current = self.start + timedelta(days=skip * interval)
+        step = timedelta(days=interval)
+        weekdays = self.weekdays
+        while current <= window_end:
+            if weekdays is None or current.weekday() in weekdays:
+                yield current
+            current += step
+
+    def _weekly(self, window_start, window_end):
+        interval = self.interval
+        weekdays = self.weekdays or (self.start.weekday(),)
+        # 주 시작(월요일) 기준으로 interval 주마다 반복
+        first_week = self.start - timedelta(days=self.start.weekday())
+        weeks = (window_start - timedelta(days=window_start.weekday()) - first_week).days // 7
+        period = -(-weeks // interval) * interval
+        while True:
+            week = first_week + timedelta(days=period * 7)
+            if week > window_end:
+                return
+            for weekday in weekdays:
+                current = week + timedelta(days=weekday)
+                if current > window_end:
+                    return
+                if current >= window_start:
+                    yield current
+            period += interval
+
+    def _month_days(self, year: int, month: int) -> list:
+        """monthly 규칙에서 해당 월의 반복일 목록"""
+        days_in_month = calendar.monthrange(year, month)[1]
+
+        if self.bymonthday is None and self.byday is None:
+            # 기존 방식: 시작일과 같은 날짜 (말일을 넘으면 말일)
+            return [date(year, month, min(self.start.day, days_in_month))]
+
+        monthdays = None
+        if self.bymonthday is not None:
+            monthdays = set()
+            for value in self.bymonthday:
+                day = value if value > 0 else days_in_month + 1 + value
+                if 1 <= day <= days_in_month:
+                    monthdays.add(day)
+
+        if self.byday is not None:
+            first_weekday = date(year, month, 1).weekday()
+            bydays = set()
+            for ordinal, weekday in self.byday:
+                days = list(range(1 + (weekday - first_weekday) % 7, days_in_month + 1, 7))
+                if ordinal is None:
+                    bydays.update(days)
+                elif -len(days) <= ordinal <= len(days) and ordinal != 0:
+                    bydays.add(days[ordinal - 1] if ordinal > 0 else days[ordinal])
+            monthdays = bydays if monthdays is None else monthdays & bydays
+
+        return [date(year, month, day) for day in sorted(monthdays)]
+
+    def _monthly(self, window_start, window_end):
+        interval = self.interval
+        months = (window_start.year - self.start.year) * 12 + window_start.month - self.start.month
+        period = max(0, -(-months // interval) * interval)
+        base = self.start.year * 12 + self.start.month - 1
+        while True:
+            year, month = divmod(base + period, 12)
+            month += 1
+            if date(year, month, 1) > window_end:
+                return
+            for current in self._month_days(year, month):
+                if current > window_end:
+                    return
+                if current >= window_start:
+                    yield current
+            period += interval
+
+    def _yearly(self, window_start, window_end):
+        interval = self.interval
+        month, day = self.start.month, self.start.day
+        years = window_start.year - self.start.year
+        year = self.start.year + max(0, -(-years // interval) * interval)
+        while year <= window_end.year:
+            if not (month == 2 and day == 29 and not calendar.isleap(year)):
+                # 윤년이 아닌 해의 2월 29일은 건너뜀
+                current = date(year, month, day)
+                if window_start <= current <= window_end:
+                    yield current
+            year += interval
+
+    def _all(self, window_start, window_end):
+        """시작일(항상 첫 반복)과 규칙에 따른 반복일 (예외 포함)"""
+        generator = {
+            'daily': self._daily,
+            'weekly': self._weekly,
+            'monthly': self._monthly,
+            'yearly': self._yearly,
+        }.get(self.pattern)
+        if generator is None:
+            return
+
+        window_start = max(window_start, self.start)
+        if window_start <= self.start <= window_end:
+            yield self.start
+        for current in generator(window_start, window_end):
+            if current != self.start:
+                yield current
+
+    def occurrences(self, window_start: date, window_end: date):
+        """
+        조회 구간 [window_start, window_end] 안의 반복일 (시작일 포함, 예외 제외)
+        """
+        window_end = min(window_end, self.until)
+        if window_end < max(window_start, self.start):
+            return
+
+        exceptions = self.exceptions
+        for current in self._all(window_start, window_end):
+            if current not in exceptions:
+                yield current
+
+
+class RuleCache:
+    """(event_id, updated_at) 기준 컴파일된 반복 규칙 LRU 캐시 (프로세스 단위)"""
+
+    def __init__(self, size: int = RULE_CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._rules = OrderedDict()
+
+    def get(self, event) -> CompiledRule:
+        key = (event.event_id, event.updated_at)
+        with self._lock:
+            rule = self._rules.get(key)
+            if rule is not None:
+                self._rules.move_to_end(key)
+                return rule
+
+        rule = CompiledRule.from_rules(event.recurrence_rules, event.start_date)
+        with self._lock:
+            self._rules[key] = rule
+            if len(self._rules) > self.size:
+                self._rules.popitem(last=False)
+        return rule
+
+    def clear(self):
+        with self._lock:
+            self._rules.clear()
+
+
+# 프로세스 전역 캐시
+rule_cache = RuleCache()
+
+
+def event_occurrences(event, window_start: date, window_end: date):
+    """반복 일정의 조회 구간 내 반복일 목록"""
+    if not event.recurrence_rules:
+        return []
+    if event.updated_at is None:
+        # 저장되지 않은 일정은 캐시하지 않음
+        rule = CompiledRule.from_rules(event.recurrence_rules, event.start_date)
+    else:
+        rule = rule_cache.get(event)
+    return list(rule.occurrences(window_start, window_end))
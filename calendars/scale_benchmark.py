@@ -0,0 +1,262 @@
+import gc
+import time
+import random
+import logging
+import statistics
+import tracemalloc
+from datetime import date, datetime, time as dtime, timedelta
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from .models import Event
+from .month_cache import bump_version
+from .occurrences import materialize_events
+from .recurrence import CompiledRule
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 사용자별 일정 수 (기본 시나리오)
+DEFAULT_SIZES = (10, 100, 1000)
+
+# 반복 일정 비율과 패턴 분포 (RRULE 확장 규칙 포함)
+RECURRING_RATIO = 0.4
+RECURRENCE_TEMPLATES = [
+    {'pattern': 'daily'},
+    {'pattern': 'daily', 'interval': 2},
+    {'pattern': 'weekly'},
+    {'pattern': 'weekly', 'byday': ['MO', 'WE', 'FR']},
+    {'pattern': 'monthly'},
+    {'pattern': 'monthly', 'byday': ['2TU']},
+    {'pattern': 'monthly', 'bymonthday': [1, -1]},
+    {'pattern': 'yearly'},
+]
+# 예외 날짜 목록 길이 (일부 일정은 수백 개의 예외를 가짐)
+EXCEPTION_COUNTS = [0, 0, 0, 5, 30, 300]
+
+
+def window_for(name: str, anchor: date):
+    """조회 구간 (month/quarter/year) 시작일, 종료일"""
+    if name == 'month':
+        start = anchor.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    elif name == 'quarter':
+        start = date(anchor.year, (anchor.month - 1) // 3 * 3 + 1, 1)
+        end = (start + timedelta(days=95)).replace(day=1) - timedelta(days=1)
+    elif name == 'year':
+        start = date(anchor.year, 1, 1)
+        end = date(anchor.year, 12, 31)
+    else:
+        raise ValueError(f"알 수 없는 조회 구간입니다: {name}")
+    return start, end
+
+
+def generate_user_events(size: int, seed: int, anchor: date, username: str = None):
+    """
+    벤치마크용 사용자와 일정 생성 (같은 seed면 같은 데이터)
+
+    반복 일정은 기준일 전후 1년 안에서 시작하고, 일부는 긴 예외 목록을 가집니다.
+    bulk_create는 save()와 시그널을 거치지 않으므로 파생 컬럼과 발생일 테이블을 직접 채웁니다.
+
+    Returns:
+        tuple: (사용자, 반복 일정 ID 목록)
+    """
+    rng = random.Random(f'{seed}:{size}')
+    username = username or f'bench_{size}_{seed}'
+    user = User.objects.create_user(
+        username=username,
+        email=f'{username}@example.com',
+        password=None,
+        phone_number=None,
+    )
+
+    events = []
+    for index in range(size):
+        start = anchor + timedelta(days=rng.randint(-365, 365))
+        event = Event(
+            user=user,
+            title=f'일정 {index}',
+            description='벤치마크용 일정 설명입니다.' if rng.random() < 0.5 else None,
+            start_date=start,
+            end_date=start + timedelta(days=rng.choice([0, 0, 0, 1, 2])),
+            start_time=dtime(rng.randint(6, 21), rng.choice([0, 30])),
+            event_type=rng.choice(['appointment', 'medication', 'exercise', 'other']),
+        )
+        if rng.random() < RECURRING_RATIO:
+            rules = dict(rng.choice(RECURRENCE_TEMPLATES))
+            if rng.random() < 0.7:
+                rules['until'] = (start + timedelta(days=rng.randint(90, 730))).isoformat()
+            span = (CompiledRule.from_rules(rules, start).until - start).days
+            rules['exceptions'] = sorted({
+                (start + timedelta(days=rng.randint(1, max(span, 1)))).isoformat()
+                for _ in range(rng.choice(EXCEPTION_COUNTS))
+            })
+            event.recurrence_rules = rules
+        event.sync_recurrence_columns()
+        events.append(event)
+
+    Event.objects.bulk_create(events, batch_size=500)
+    materialize_events(events)
+    return user, [event.event_id for event in events if event.recurrence_rules]
+
+
+def _measure(func, repeat: int, before=None) -> dict:
+    """
+    지연 시간(ms), 쿼리 수, 최대 메모리(KB) 측정
+
+    지연 시간은 repeat회 측정하고, 메모리는 tracemalloc 오버헤드가 지연 시간에 섞이지 않도록 한 번 더 실행해 잽니다.
+    """
+    elapsed = []
+    queries = 0
+    for _ in range(repeat):
+        if before:
+            before()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            func()
+            elapsed.append((time.perf_counter() - started) * 1000)
+        queries = len(captured)
+
+    if before:
+        before()
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'latency_ms': {
+            'min': round(min(elapsed), 2),
+            'median': round(statistics.median(elapsed), 2),
+            'max': round(max(elapsed), 2),
+        },
+        'queries': queries,
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def _rolled_back(func):
+    """데이터셋이 바뀌지 않도록 트랜잭션 안에서 실행 후 롤백"""
+    def run():
+        with transaction.atomic():
+            func()
+            transaction.set_rollback(True)
+    return run
+
+
+def benchmark_user(user, recurring_ids, anchor: date, windows, repeat: int, seed: int) -> dict:
+    """
+    한 사용자의 일정 목록 조회와 반복 일정 수정/삭제 측정
+
+    목록 조회는 월간 캐시를 비운 경우(cold)와 캐시 적중(cached)을 나눠 잽니다.
+    """
+    from .views import EventViewSet
+
+    factory = APIRequestFactory()
+    list_view = EventViewSet.as_view({'get': 'list'})
+    update_view = EventViewSet.as_view({'patch': 'update_recurring'})
+    delete_view = EventViewSet.as_view({'delete': 'delete_recurring'})
+
+    def request(method, path, data=None, params=None):
+        if params:
+            path = f"{path}?{'&'.join(f'{key}={value}' for key, value in params.items())}"
+        req = getattr(factory, method)(path, data, format='json')
+        force_authenticate(req, user=user)
+        return req
+
+    result = {'list': {}}
+    for name in windows:
+        start, end = window_for(name, anchor)
+        params = {'start_date_from': start.isoformat(), 'start_date_to': end.isoformat()}
+
+        def list_events():
+            response = list_view(request('get', '/events/', params=params))
+            assert response.status_code == 200, response.status_code
+
+        result['list'][name] = {
+            'cold': _measure(list_events, repeat, before=lambda: bump_version(user.pk)),
+            'cached': _measure(list_events, repeat),
+        }
+
+    if not recurring_ids:
+        return result
+
+    # 수정/삭제 대상: 시드로 고른 반복 일정의 중간 발생일
+    event = Event.objects.get(pk=random.Random(seed).choice(recurring_ids))
+    rule = CompiledRule.from_rules(event.recurrence_rules, event.start_date)
+    occurrences = list(rule.occurrences(event.start_date, rule.until))
+    event_date = occurrences[len(occurrences) // 2].isoformat()
+    target = {'event_id': str(event.event_id), 'pattern': event.recurrence_rules.get('pattern'),
+              'exceptions': len(event.recurrence_rules.get('exceptions', [])), 'event_date': event_date}
+
+    result['update_recurring'] = {'target': target}
+    result['delete_recurring'] = {'target': target}
+    for kind in ('this_only', 'this_and_future', 'all'):
+        data = {'title': '수정된 일정'}
+        if kind != 'all':
+            data['start_date'] = event_date
+        if kind == 'this_and_future':
+            data['recurrence_rules'] = {key: value for key, value in event.recurrence_rules.items()
+                                        if key not in ('until', 'count', 'exceptions')}
+
+        def update(kind=kind, data=data):
+            response = update_view(
+                request('patch', f'/events/{event.event_id}/update_recurring/', data,
+                        {'update_type': kind, 'event_date': event_date}),
+                pk=str(event.event_id)
+            )
+            assert response.status_code == 200, (response.status_code, getattr(response, 'data', None))
+
+        def delete(kind=kind):
+            response = delete_view(
+                request('delete', f'/events/{event.event_id}/delete_recurring/', None,
+                        {'delete_type': kind, 'event_date': event_date}),
+                pk=str(event.event_id)
+            )
+            assert response.status_code == 204, response.status_code
+
+        result['update_recurring'][kind] = _measure(_rolled_back(update), repeat)
+        result['delete_recurring'][kind] = _measure(_rolled_back(delete), repeat)
+    return result
+
+
+def run_suite(sizes=DEFAULT_SIZES, windows=('month', 'quarter', 'year'), repeat: int = 5,
+              seed: int = 42, anchor: date = None) -> dict:
+    """
+    사용자 규모별 벤치마크 실행
+
+    Returns:
+        dict: 실행 환경과 규모별 측정 결과 (JSON 직렬화 가능)
+    """
+    anchor = anchor or timezone.localdate()
+    report = {
+        'database': connection.vendor,
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'anchor': anchor.isoformat(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': [],
+    }
+    for size in sizes:
+        # 규모별 데이터는 측정 후 롤백 (같은 DB에서 반복 실행해도 결과가 섞이지 않음)
+        with transaction.atomic():
+            started = time.perf_counter()
+            user, recurring_ids = generate_user_events(size, seed, anchor)
+            seed_seconds = time.perf_counter() - started
+            logger.info(f"벤치마크 데이터 생성: 일정 {size}개 ({seed_seconds:.1f}초)")
+
+            entry = {
+                'events': size,
+                'recurring_events': len(recurring_ids),
+                'occurrence_rows': user.event_occurrences.count(),
+                'seed_seconds': round(seed_seconds, 2),
+            }
+            entry.update(benchmark_user(user, recurring_ids, anchor, windows, repeat, seed))
+            report['results'].append(entry)
+            transaction.set_rollback(True)
+    return report
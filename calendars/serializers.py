@@ -1,6 +1,11 @@
+import io
+import json
+from datetime import time
 from rest_framework import serializers
 from .models import Event, DailyConversationSummary, BabyDiary, BabyDiaryPhoto
 from llm.models import LLMConversation
+from .recurrence import validate_recurrence_rules
+from .availability import MAX_FREE_SLOT_DAYS
 
 class EventSerializer(serializers.ModelSerializer):
     """
@@ -8,9 +13,130 @@ class EventSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Event
-        fields = '__all__'
+        exclude = ['recurrence_pattern', 'recurrence_until', 'materialized_until']
         read_only_fields = ['event_id', 'created_at', 'updated_at', 'user']
 
+_datetime_field = serializers.DateTimeField()
+
+
+def _dumps(value) -> str:
+    """DRF JSONRenderer와 같은 형식 (compact, ensure_ascii=False, U+2028/U+2029 이스케이프)"""
+    content = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return content.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def _event_json_parts(event):
+    """
+    일정별 고정 JSON 조각 (시작일 앞부분, 종료일 뒷부분, UTF-8 바이트)
+
+    EventSerializer와 같은 필드 순서이며, 발생마다 달라지는 start_date/end_date만 비워 둡니다.
+    """
+    head = _dumps({
+        'event_id': str(event.event_id),
+        'title': event.title,
+        'description': event.description,
+    })[:-1] + ',"start_date":'
+    tail = ',' + _dumps({
+        'start_time': event.start_time.isoformat() if event.start_time else None,
+        'end_time': event.end_time.isoformat() if event.end_time else None,
+        'event_type': event.event_type,
+        'recurrence_rules': event.recurrence_rules,
+        'event_color': event.event_color,
+        'created_at': _datetime_field.to_representation(event.created_at),
+        'updated_at': _datetime_field.to_representation(event.updated_at),
+        'user': str(event.user_id),
+        # 가상 검진 일정(CheckupEvent)만 갖는 추가 필드
+        **(getattr(event, 'virtual_fields', None) or {}),
+    })[1:]
+    return head.encode('utf-8'), tail.encode('utf-8')
+
+
+def render_occurrences(records) -> bytes:
+    """
+    OccurrenceRecord 목록을 EventSerializer(many=True) 응답과 같은 JSON 배열로 직렬화
+
+    일정별 공통 필드는 한 번만 JSON 바이트로 만들어 두고, 발생마다 날짜 조각만 이어 붙입니다.
+    (발생마다 모델 인스턴스나 dict를 만들지 않음)
+    """
+    parts = {}
+    dates = {None: b'null'}
+    # bytes.join은 조각마다 버퍼 구조체를 잡으므로 BytesIO에 순서대로 기록
+    buffer = io.BytesIO()
+    write = buffer.write
+    separator = b'['
+    for record in records:
+        event = record.event
+        event_parts = parts.get(event.event_id)
+        if event_parts is None:
+            event_parts = parts[event.event_id] = _event_json_parts(event)
+        start = dates.get(record.start_date)
+        if start is None:
+            start = dates[record.start_date] = b'"%s"' % record.start_date.isoformat().encode()
+        end = dates.get(record.end_date)
+        if end is None:
+            end = dates[record.end_date] = b'"%s"' % record.end_date.isoformat().encode()
+
+        write(separator)
+        write(event_parts[0])
+        write(start)
+        write(b',"end_date":')
+        write(end)
+        write(event_parts[1])
+        separator = b','
+    write(b'[]' if separator == b'[' else b']')
+    return buffer.getvalue()
+
+
+# 일괄 생성/수정 API 한 번에 처리할 수 있는 최대 일정 수
+BULK_EVENT_LIMIT = 100
+
+
+class EventBulkListSerializer(serializers.ListSerializer):
+    """
+    일정 일괄 생성/수정 검증
+
+    ListSerializer.is_valid()는 항목 하나만 실패해도 전체를 거부하므로,
+    항목마다 child 시리얼라이저로 검증해 성공/실패를 따로 돌려줍니다.
+    event_id가 있는 항목은 해당 일정의 부분 수정, 없는 항목은 새 일정 생성으로 처리합니다.
+    """
+
+    def validate_items(self, instances: dict) -> list:
+        """
+        Args:
+            instances: 수정 대상 일정 {event_id 문자열: Event}
+
+        Returns:
+            list: 항목별 (수정 대상 Event 또는 None, validated_data 또는 None, 오류 또는 None)
+        """
+        child_class = type(self.child)
+        results = []
+        seen = set()
+        for item in self.initial_data:
+            if not isinstance(item, dict):
+                results.append((None, None, {"non_field_errors": ["일정 정보는 객체 형태여야 합니다."]}))
+                continue
+
+            event_id = item.get('event_id')
+            instance = None
+            if event_id is not None:
+                instance = instances.get(str(event_id))
+                if instance is None:
+                    results.append((None, None, {"event_id": ["일정을 찾을 수 없습니다."]}))
+                    continue
+                if instance.event_id in seen:
+                    results.append((None, None, {"event_id": ["같은 일정이 한 요청에 두 번 포함되어 있습니다."]}))
+                    continue
+
+            serializer = child_class(instance, data=item, partial=instance is not None)
+            if serializer.is_valid():
+                if instance is not None:
+                    seen.add(instance.event_id)
+                results.append((instance, serializer.validated_data, None))
+            else:
+                results.append((instance, None, serializer.errors))
+        return results
+
+
 class EventDetailSerializer(serializers.ModelSerializer):
     """
     일정 상세 정보 및 생성/수정용 시리얼라이저
@@ -18,8 +144,9 @@ class EventDetailSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Event
-        fields = '__all__'
+        exclude = ['recurrence_pattern', 'recurrence_until', 'materialized_until']
         read_only_fields = ['event_id', 'created_at', 'updated_at', 'user']
+        list_serializer_class = EventBulkListSerializer
         
     def validate(self, data):
         """
@@ -27,47 +154,61 @@ class EventDetailSerializer(serializers.ModelSerializer):
         """
         recurrence_rules = data.get('recurrence_rules')
         
-        # recurrence_rules이 있는 경우 기본 구조 확인
+        # recurrence_rules이 있는 경우 구조 확인 (RRULE의 interval, byday, bymonthday, count 포함)
         if recurrence_rules:
-            # 필수 pattern 필드 확인
-            if 'pattern' not in recurrence_rules:
-                raise serializers.ValidationError({"recurrence_rules": "반복 패턴은 필수 항목입니다."})
-            
-            # pattern 유효성 검증
-            pattern = recurrence_rules.get('pattern')
-            valid_patterns = ['daily', 'weekly', 'monthly', 'yearly']
-            if pattern not in valid_patterns:
-                raise serializers.ValidationError({"recurrence_rules": f"유효한 반복 패턴이 아닙니다. 가능한 값: {', '.join(valid_patterns)}"})
-            
-            # until 날짜 형식 확인
-            until = recurrence_rules.get('until')
-            if until:
-                try:
-                    from datetime import datetime
-                    datetime.strptime(until, '%Y-%m-%d')
-                except ValueError:
-                    raise serializers.ValidationError({"recurrence_rules": "종료일은 YYYY-MM-DD 형식이어야 합니다."})
-            
-            # exceptions 형식 확인
-            exceptions = recurrence_rules.get('exceptions', [])
-            if not isinstance(exceptions, list):
-                raise serializers.ValidationError({"recurrence_rules": "예외 날짜는 리스트 형태여야 합니다."})
-            
-            for exception_date in exceptions:
-                try:
-                    datetime.strptime(exception_date, '%Y-%m-%d')
-                except ValueError:
-                    raise serializers.ValidationError({"recurrence_rules": "예외 날짜는 YYYY-MM-DD 형식이어야 합니다."})
+            try:
+                validate_recurrence_rules(recurrence_rules)
+            except ValueError as e:
+                raise serializers.ValidationError({"recurrence_rules": str(e)})
         
-        # start_date 및 end_date 유효성 검증
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
+        # start_date 및 end_date 유효성 검증 (부분 수정 시 빠진 값은 기존 값 사용)
+        start_date = data.get('start_date', getattr(self.instance, 'start_date', None))
+        end_date = data.get('end_date', getattr(self.instance, 'end_date', None))
         
         if end_date and start_date > end_date:
             raise serializers.ValidationError({"end_date": "종료 날짜는 시작 날짜 이후여야 합니다."})
         
         return data
 
+class EventConflictQuerySerializer(serializers.Serializer):
+    """일정 충돌 확인 요청 (등록/수정하려는 일정)"""
+    start_date = serializers.DateField()
+    end_date = serializers.DateField(required=False, allow_null=True)
+    start_time = serializers.TimeField(required=False, allow_null=True)
+    end_time = serializers.TimeField(required=False, allow_null=True)
+    recurrence_rules = serializers.JSONField(required=False, allow_null=True)
+    event_id = serializers.UUIDField(required=False, allow_null=True, help_text='수정 중인 일정 (충돌 대상에서 제외)')
+
+    def validate(self, data):
+        if data.get('recurrence_rules'):
+            try:
+                validate_recurrence_rules(data['recurrence_rules'])
+            except ValueError as e:
+                raise serializers.ValidationError({"recurrence_rules": str(e)})
+        if data.get('end_date') and data['start_date'] > data['end_date']:
+            raise serializers.ValidationError({"end_date": "종료 날짜는 시작 날짜 이후여야 합니다."})
+        return data
+
+
+class FreeSlotQuerySerializer(serializers.Serializer):
+    """빈 시간 조회 조건"""
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    min_duration = serializers.IntegerField(required=False, default=30, min_value=1, max_value=24 * 60,
+                                            help_text='최소 길이 (분)')
+    day_start = serializers.TimeField(required=False, default=time(9, 0))
+    day_end = serializers.TimeField(required=False, default=time(18, 0))
+
+    def validate(self, data):
+        if data['start_date'] > data['end_date']:
+            raise serializers.ValidationError({"end_date": "종료 날짜는 시작 날짜 이후여야 합니다."})
+        if (data['end_date'] - data['start_date']).days >= MAX_FREE_SLOT_DAYS:
+            raise serializers.ValidationError({"end_date": f"빈 시간은 최대 {MAX_FREE_SLOT_DAYS}일까지 조회할 수 있습니다."})
+        if data['day_start'] >= data['day_end']:
+            raise serializers.ValidationError({"day_end": "하루 종료 시간은 시작 시간 이후여야 합니다."})
+        return data
+
+
 class DailyConversationSummarySerializer(serializers.ModelSerializer):
     class Meta:
         model = DailyConversationSummary
@@ -1,6 +1,12 @@
 from celery.signals import worker_ready
 from .tasks import auto_summarize_yesterday_conversations
 import logging
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from accounts.utils.conditional_utils import bump_resource_version, register_resource
+from .models import BabyDiary, BabyDiaryPhoto, DailyConversationSummary, Event
+from .occurrences import materialize_event
+from .month_cache import bump_version
 
 logger = logging.getLogger(__name__)
 
@@ -10,4 +16,37 @@ def trigger_summarize_on_startup(sender=None, **kwargs):
     Celery worker가 시작될 때 한 번만 대화 자동 요약 작업을 실행
     """
     logger.info("Celery worker 시작: 대화 자동 요약 작업 예약")
-    auto_summarize_yesterday_conversations.delay() 
\ No newline at end of file
+    auto_summarize_yesterday_conversations.delay()
+
+
+@receiver(post_save, sender=Event)
+def sync_event_occurrences(sender, instance, raw=False, **kwargs):
+    """
+    일정이 저장될 때마다 발생일 테이블 재생성
+    (update_recurring, delete_recurring의 예외/종료일 변경도 event.save()를 거치므로 함께 반영됨)
+    """
+    if raw:
+        return
+    materialize_event(instance)
+
+
+@receiver([post_save, post_delete], sender=Event)
+def bump_calendar_version(sender, instance, **kwargs):
+    """일정이 저장/삭제되면 사용자의 월간 일정 캐시 버전 증가"""
+    bump_version(instance.user_id)
+
+
+# 조건부 요청(ETag) 리소스 버전
+register_resource('conversation-summaries', DailyConversationSummary)
+register_resource('baby-diaries', BabyDiary)
+register_resource(
+    'baby-diaries', BabyDiaryPhoto,
+    get_user_id=lambda photo: BabyDiary.objects.filter(pk=photo.babydiary_id).values_list('user_id', flat=True).first()
+)
+
+
+@receiver(m2m_changed, sender=DailyConversationSummary.conversations.through)
+def bump_summary_conversations(sender, instance, action, reverse, **kwargs):
+    """요약의 관련 대화 목록이 바뀌면 대화 요약 버전 갱신"""
+    if action.startswith('post_') and not reverse:
+        bump_resource_version(instance.user_id, 'conversation-summaries')
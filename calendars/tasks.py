@@ -1,77 +1,90 @@
 import logging
-from celery import shared_task
+from celery import chord, shared_task
 from datetime import datetime, timedelta
+from django.conf import settings
 from django.utils import timezone
-from rest_framework.test import APIRequestFactory
-from rest_framework.request import Request
-from .views import DailyConversationSummaryViewSet
-from django.contrib.auth import get_user_model
-from rest_framework.test import APIRequestFactory, force_authenticate
+from .daily_summary import (
+    DailySummaryError, NoConversations, SummaryExists, get_openai_client, summarize_user_day, users_to_summarize
+)
+from .occurrences import extend_occurrences
 
-User = get_user_model()
 logger = logging.getLogger(__name__)
 
 @shared_task
 def auto_summarize_yesterday_conversations():
-    """매일 새벽에 전날의 대화를 자동으로 요약하는 태스크"""
+    """
+    매일 새벽에 전날의 대화를 자동으로 요약하는 태스크
+
+    전날 대화가 있고 요약이 없는 사용자만 집계 쿼리 한 번으로 고른 뒤,
+    DAILY_SUMMARY_CHUNK_SIZE명씩 나눈 청크 태스크를 group으로 분배합니다 (전체 소요 시간은 워커 수에 비례해 줄어듦).
+    """
     # 어제 날짜 계산
     yesterday = (timezone.now() - timedelta(days=1)).date()
     yesterday_str = yesterday.strftime('%Y-%m-%d')
     
     logger.info(f"전날({yesterday_str}) 대화 자동 요약 시작")
     
-    # 모든 활성 사용자에 대해 요약 생성
-    users = User.objects.filter(is_active=True)
-    success_count = 0
-    skipped_count = 0  # 정상적으로 건너뛴 경우 카운트
-    error_count = 0
-    
-    for user in users:
+    user_ids = [str(user_id) for user_id in users_to_summarize(yesterday)]
+    if not user_ids:
+        result_message = f"전날({yesterday_str}) 대화 자동 요약: 요약할 사용자 없음"
+        logger.info(result_message)
+        return result_message
+
+    chunk_size = settings.DAILY_SUMMARY_CHUNK_SIZE
+    chunks = [user_ids[i:i + chunk_size] for i in range(0, len(user_ids), chunk_size)]
+    chord(
+        summarize_conversation_chunk.s(chunk, yesterday_str) for chunk in chunks
+    )(report_summary_results.s(yesterday_str))
+
+    result_message = f"전날({yesterday_str}) 대화 자동 요약 분배: 사용자 {len(user_ids)}명, 청크 {len(chunks)}개"
+    logger.info(result_message)
+    return result_message
+
+
+@shared_task
+def summarize_conversation_chunk(user_ids, summary_date_str):
+    """사용자 청크의 하루 대화 요약 (OpenAI 클라이언트는 청크 안에서 재사용)"""
+    summary_date = datetime.strptime(summary_date_str, '%Y-%m-%d').date()
+    counts = {'success': 0, 'skipped': 0, 'error': 0}
+    try:
+        client = get_openai_client()
+    except DailySummaryError as e:
+        logger.error(f"{summary_date_str} 대화 요약 청크 실패: {str(e)}")
+        counts['error'] = len(user_ids)
+        return counts
+
+    for user_id in user_ids:
         try:
-            # API 요청 모방
-            factory = APIRequestFactory()
-            request = factory.post(
-                '/api/v1/calendars/conversation-summaries/auto_summarize/',
-                {'summary_date': yesterday_str},
-                format='json'
-            )
-            
-            # 인증을 강제하여 DRF가 user를 "인증됨"으로 인식하도록 함
-            force_authenticate(request, user=user)
-            
-            # ViewSet 실행
-            view = DailyConversationSummaryViewSet.as_view({'post': 'auto_summarize'})
-            response = view(request)
-            
-            # 결과 로깅
-            if response.status_code == 201:  # HTTP_201_CREATED
-                success_count += 1
-                logger.info(f"사용자 {user.username}의 {yesterday_str} 대화 요약 생성 완료")
-            elif response.status_code == 400 and "요약이 존재합니다" in str(response.data):
-                # 이미 요약이 존재하는 경우 - 정상적인 상황
-                skipped_count += 1
-                logger.info(f"사용자 {user.username}의 {yesterday_str} 대화 요약이 이미 존재함")
-            elif response.status_code == 404 and "대화가 없습니다" in str(response.data):
-                # 대화가 없는 경우 - 정상적인 상황
-                skipped_count += 1
-                logger.info(f"사용자 {user.username}의 {yesterday_str} 대화가 없음")
-            else:
-                # 실제 에러 상황만 에러로 카운트
-                error_count += 1
-                logger.warning(
-                    f"사용자 {user.username}의 {yesterday_str} 대화 요약 생성 실패: "
-                    f"상태코드 {response.status_code}, 응답: {response.data}"
-                )
-                
+            summarize_user_day(user_id, summary_date, client=client)
+            counts['success'] += 1
+            logger.info(f"사용자 {user_id}의 {summary_date_str} 대화 요약 생성 완료")
+        except (SummaryExists, NoConversations) as e:
+            # 집계 이후 다른 경로로 요약이 생기거나 대화가 삭제된 경우 - 정상적인 상황
+            counts['skipped'] += 1
+            logger.info(f"사용자 {user_id}: {str(e)}")
         except Exception as e:
-            error_count += 1
-            logger.error(f"사용자 {user.username}의 대화 요약 중 예외 발생: {str(e)}")
-    
-    result_message = f"전날({yesterday_str}) 대화 자동 요약 완료: 성공 {success_count}건, 건너뜀 {skipped_count}건, 실패 {error_count}건"
+            counts['error'] += 1
+            logger.error(f"사용자 {user_id}의 대화 요약 중 예외 발생: {str(e)}")
+    return counts
+
+
+@shared_task
+def report_summary_results(results, summary_date_str):
+    """청크 결과 합산 로그"""
+    totals = {key: sum(result[key] for result in results) for key in ('success', 'skipped', 'error')}
+    result_message = (
+        f"전날({summary_date_str}) 대화 자동 요약 완료: "
+        f"성공 {totals['success']}건, 건너뜀 {totals['skipped']}건, 실패 {totals['error']}건"
+    )
     logger.info(result_message)
-    
     return result_message
 
+@shared_task
+def extend_event_occurrences():
+    """매일 반복 일정 발생일 테이블을 EVENT_OCCURRENCE_HORIZON_DAYS까지 연장하는 태스크"""
+    processed = extend_occurrences()
+    return f"일정 발생일 연장 완료: {processed}개 일정"
+
 @shared_task
 def test_task():
     print("테스트 태스크가 실행되었습니다!")
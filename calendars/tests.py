@@ -1,3 +1,646 @@
-from django.test import TestCase
+import math
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+from unittest import mock
 
-# Create your tests here.
+from dateutil import rrule as du
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from llm.models import LLMConversation
+
+from .availability import IntervalTree, find_conflicts, find_free_slots, proposed_intervals
+from .checkups import checkup_schedule, checkups_in_range, load_checkups, week_start
+from .daily_summary import users_to_summarize
+from .models import CalendarFeed, DailyConversationSummary, Event, EventOccurrence
+from .occurrences import FULLY_MATERIALIZED, OccurrenceRecord, extend_occurrences, horizon_end, occurrences_in_range
+from .recurrence import (
+    DEFAULT_RECURRENCE_DAYS, WEEKDAY_CODES, CompiledRule, validate_recurrence_rules
+)
+from .scale_benchmark import generate_user_events, run_suite
+from .serializers import BULK_EVENT_LIMIT, EventSerializer, render_occurrences
+from .views import EventViewSet
+
+FREQS = {'daily': du.DAILY, 'weekly': du.WEEKLY, 'monthly': du.MONTHLY, 'yearly': du.YEARLY}
+WEEKDAYS = [du.MO, du.TU, du.WE, du.TH, du.FR, du.SA, du.SU]
+
+
+def to_datetime(value):
+    return datetime(value.year, value.month, value.day)
+
+
+def random_rules(rng, pattern):
+    """패턴별로 무작위 RRULE 구성 (기준 구현과 비교 가능한 조합만)"""
+    rules = {'pattern': pattern, 'interval': rng.choice([1, 1, 2, 3, 5])}
+    if pattern in ('daily', 'weekly') and rng.random() < 0.6:
+        rules['byday'] = rng.sample(WEEKDAY_CODES, rng.randint(1, 4))
+    if pattern == 'monthly':
+        kind = rng.choice(['plain', 'bymonthday', 'byday', 'both'])
+        if kind in ('bymonthday', 'both'):
+            rules['bymonthday'] = rng.sample([1, 5, 15, 28, 29, 30, 31, -1, -2, -7], rng.randint(1, 3))
+        if kind == 'byday':
+            # dateutil은 순번 있는 요일과 없는 요일을 섞으면 결과가 비므로 한 종류만 사용
+            ordinals = rng.choice([[''], ['1', '2', '-1', '4', '5']])
+            rules['byday'] = [
+                f"{rng.choice(ordinals)}{code}" for code in rng.sample(WEEKDAY_CODES, rng.randint(1, 2))
+            ]
+        if kind == 'both':
+            # 교집합이 비지 않도록 순번 없는 요일만 사용 (예: 매월 13일인 금요일)
+            rules['byday'] = rng.sample(WEEKDAY_CODES, rng.randint(1, 2))
+    return rules
+
+
+def reference_rrule(rules, start, until=None, count=None):
+    """dateutil.rrule로 같은 규칙 구성"""
+    kwargs = {'dtstart': to_datetime(start), 'interval': rules.get('interval', 1)}
+    if rules.get('byday'):
+        kwargs['byweekday'] = [
+            WEEKDAYS[WEEKDAY_CODES.index(value[-2:])](int(value[:-2])) if value[:-2] else
+            WEEKDAYS[WEEKDAY_CODES.index(value)]
+            for value in rules['byday']
+        ]
+    if rules.get('bymonthday'):
+        kwargs['bymonthday'] = rules['bymonthday']
+    if count is not None:
+        kwargs['count'] = count
+    if until is not None:
+        kwargs['until'] = to_datetime(until)
+    return du.rrule(FREQS[rules['pattern']], **kwargs)
+
+
+class RecurrencePropertyTest(SimpleTestCase):
+    """
+    반복 일정 엔진과 dateutil.rrule(기준 구현) 비교
+
+    hypothesis 대신 고정 시드의 무작위 규칙으로 검사합니다.
+    RFC 5545와 달리 이 엔진은 시작일을 항상 포함하므로, 시작일은 규칙에 맞는 첫 날짜로 맞춥니다.
+    """
+
+    CASES = 400
+
+    def aligned_start(self, rng, rules):
+        seed = date(2020, 1, 1) + timedelta(days=rng.randint(0, 365 * 4))
+        if rules['pattern'] == 'monthly' and not rules.get('bymonthday') and not rules.get('byday'):
+            # 기존 monthly는 말일 보정이 있으므로 모든 달에 있는 날짜로 제한
+            seed = seed.replace(day=min(seed.day, 28))
+        first = reference_rrule(rules, seed, until=seed + timedelta(days=365 * 2)).after(
+            to_datetime(seed), inc=True
+        )
+        return first.date() if first else None
+
+    def test_matches_reference_implementation(self):
+        rng = random.Random(20240601)
+        checked = 0
+        while checked < self.CASES:
+            rules = random_rules(rng, rng.choice(list(FREQS)))
+            start = self.aligned_start(rng, rules)
+            if start is None:
+                continue
+
+            end_kind = rng.choice(['until', 'count', 'both', 'default'])
+            until = count = None
+            if end_kind in ('until', 'both'):
+                until = start + timedelta(days=rng.randint(0, 365 * 3))
+                rules['until'] = until.isoformat()
+            if end_kind in ('count', 'both'):
+                count = rng.randint(1, 60)
+                rules['count'] = count
+            if end_kind == 'default':
+                until = start + timedelta(days=DEFAULT_RECURRENCE_DAYS)
+
+            reference = [value.date() for value in reference_rrule(rules, start, until=until, count=count)]
+            if reference:
+                rules['exceptions'] = [value.isoformat() for value in rng.sample(reference, min(3, len(reference)))]
+            expected_all = [value for value in reference if value.isoformat() not in rules.get('exceptions', [])]
+
+            validate_recurrence_rules(rules)
+            rule = CompiledRule.from_rules(rules, start)
+
+            window_start = start + timedelta(days=rng.randint(-40, 365 * 2))
+            window_end = window_start + timedelta(days=rng.choice([0, 6, 30, 92, 365]))
+            expected = [value for value in expected_all if window_start <= value <= window_end]
+            actual = list(rule.occurrences(window_start, window_end))
+            self.assertEqual(actual, expected, msg=f"{rules} start={start} window={window_start}~{window_end}")
+            checked += 1
+
+
+class RecurrenceCompatibilityTest(SimpleTestCase):
+    """기존 반복 규칙(pattern/until/exceptions)의 동작 유지"""
+
+    def test_monthly_clamps_to_month_end(self):
+        rule = CompiledRule.from_rules({'pattern': 'monthly', 'until': '2024-05-31'}, date(2024, 1, 31))
+        self.assertEqual(
+            list(rule.occurrences(date(2024, 1, 1), date(2024, 12, 31))),
+            [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30), date(2024, 5, 31)]
+        )
+
+    def test_default_period_is_one_year(self):
+        start = date(2024, 3, 1)
+        rule = CompiledRule.from_rules({'pattern': 'daily'}, start)
+        occurrences = list(rule.occurrences(start, start + timedelta(days=1000)))
+        self.assertEqual(occurrences[-1], start + timedelta(days=DEFAULT_RECURRENCE_DAYS))
+        self.assertEqual(len(occurrences), DEFAULT_RECURRENCE_DAYS + 1)
+
+    def test_start_date_always_included(self):
+        # 화요일 시작, 매주 월요일 반복이어도 시작일은 첫 반복
+        rule = CompiledRule.from_rules({'pattern': 'weekly', 'byday': ['MO'], 'count': 3}, date(2024, 1, 2))
+        self.assertEqual(
+            list(rule.occurrences(date(2024, 1, 1), date(2024, 12, 31))),
+            [date(2024, 1, 2), date(2024, 1, 8), date(2024, 1, 15)]
+        )
+
+    def test_monthly_byday_mixes_ordinal_and_weekday(self):
+        # RFC 5545: 매주 목요일 + 둘째 월요일의 합집합
+        rule = CompiledRule.from_rules({'pattern': 'monthly', 'byday': ['TH', '2MO'], 'count': 6}, date(2024, 1, 4))
+        self.assertEqual(
+            list(rule.occurrences(date(2024, 1, 1), date(2024, 12, 31))),
+            [date(2024, 1, 4), date(2024, 1, 8), date(2024, 1, 11), date(2024, 1, 18), date(2024, 1, 25),
+             date(2024, 2, 1)]
+        )
+
+    def test_exceptions_skipped(self):
+        rule = CompiledRule.from_rules(
+            {'pattern': 'weekly', 'until': '2024-01-29', 'exceptions': ['2024-01-15']}, date(2024, 1, 1)
+        )
+        self.assertEqual(
+            list(rule.occurrences(date(2024, 1, 1), date(2024, 1, 31))),
+            [date(2024, 1, 1), date(2024, 1, 8), date(2024, 1, 22), date(2024, 1, 29)]
+        )
+
+
+class RecurrenceValidationTest(SimpleTestCase):
+
+    def test_invalid_rules(self):
+        invalid = [
+            {'pattern': 'hourly'},
+            {'pattern': 'daily', 'interval': 0},
+            {'pattern': 'daily', 'count': 'ten'},
+            {'pattern': 'weekly', 'byday': ['XX']},
+            {'pattern': 'weekly', 'byday': ['1MO']},
+            {'pattern': 'yearly', 'byday': ['MO']},
+            {'pattern': 'weekly', 'bymonthday': [1]},
+            {'pattern': 'monthly', 'bymonthday': [0]},
+            {'pattern': 'daily', 'until': '2024/01/01'},
+            {'pattern': 'daily', 'exceptions': ['2024-13-01']},
+        ]
+        for rules in invalid:
+            with self.assertRaises(ValueError, msg=rules):
+                validate_recurrence_rules(rules)
+
+    def test_valid_rules(self):
+        validate_recurrence_rules({'pattern': 'daily', 'until': '2024-12-31', 'exceptions': ['2024-06-15']})
+        validate_recurrence_rules({'pattern': 'monthly', 'interval': 2, 'byday': ['-1FR'], 'bymonthday': [-1], 'count': 5})
+
+
+class RenderOccurrencesTest(SimpleTestCase):
+    """전용 직렬화 결과가 EventSerializer + JSONRenderer와 바이트 단위로 같은지 확인"""
+
+    def make_event(self, **kwargs):
+        event = Event(user_id=uuid.uuid4(), **kwargs)
+        event.created_at = event.updated_at = timezone.now()
+        return event
+
+    def test_matches_event_serializer(self):
+        recurring = self.make_event(
+            title='주간 "요가"\u2028', description='설명', start_date=date(2024, 1, 1), end_date=date(2024, 1, 2),
+            start_time=time(9, 30), recurrence_rules={'pattern': 'weekly', 'until': '2024-01-31'}
+        )
+        single = self.make_event(title='병원', start_date=date(2024, 1, 10), event_type='appointment')
+
+        records = [OccurrenceRecord.for_event(recurring), OccurrenceRecord.for_event(single)]
+        instances = [recurring, single]
+        for occurrence in (date(2024, 1, 8), date(2024, 1, 15)):
+            records.append(OccurrenceRecord(recurring, occurrence, occurrence + timedelta(days=1)))
+            instance = Event(**{
+                field.attname: getattr(recurring, field.attname) for field in Event._meta.concrete_fields
+            })
+            instance.start_date = occurrence
+            instance.end_date = occurrence + timedelta(days=1)
+            instances.append(instance)
+
+        expected = JSONRenderer().render(EventSerializer(instances, many=True).data)
+        self.assertEqual(render_occurrences(records), expected)
+        self.assertEqual(render_occurrences([]), b'[]')
+
+
+class FarFutureOccurrenceTest(TestCase):
+    """horizon 뒤에 시작하는 반복 없는 일정도 조회되고, horizon 연장 시 발생일 행이 생성됨"""
+
+    def test_one_off_event_beyond_horizon(self):
+        user = User.objects.create_user(username='future', email='future@example.com', password='pw')
+        start = horizon_end() + timedelta(days=170)
+        event = Event.objects.create(user=user, title='먼 미래 일정', start_date=start)
+        event.refresh_from_db()
+        self.assertEqual(event.materialized_until, horizon_end())
+        self.assertFalse(event.occurrences.exists())
+
+        records = occurrences_in_range(user, start, start)
+        self.assertEqual([record.event.event_id for record in records], [event.event_id])
+
+        extend_occurrences(horizon=start)
+        event.refresh_from_db()
+        self.assertEqual(event.materialized_until, FULLY_MATERIALIZED)
+        self.assertEqual(list(event.occurrences.values_list('occurrence_date', flat=True)), [start])
+        records = occurrences_in_range(user, start, start)
+        self.assertEqual([record.event.event_id for record in records], [event.event_id])
+
+
+class ConditionalGetTest(TestCase):
+    """버전 기반 ETag: 변경이 없으면 쿼리 없이 304, 일정이 바뀌면 200"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='etag', email='etag@example.com', password='pw')
+        self.view = EventViewSet.as_view({'get': 'list'})
+        self.factory = APIRequestFactory()
+
+    def get(self, **headers):
+        request = self.factory.get('/events/', {'start_date_from': '2024-01-01', 'start_date_to': '2024-01-31'}, **headers)
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+    def test_not_modified_until_event_changes(self):
+        etag = self.get()['ETag']
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=f'W/{etag}').status_code, 304)
+
+        Event.objects.create(user=self.user, title='검진', start_date=date(2024, 1, 5))
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_bump_from_another_cache_client(self):
+        # Celery 워커나 다른 Gunicorn 워커는 별도의 캐시 클라이언트로 같은 공유 캐시에 버전을 기록
+        etag = self.get()['ETag']
+        other_process_cache = caches.create_connection('default')
+        with mock.patch('accounts.utils.conditional_utils.cache', other_process_cache):
+            Event.objects.create(user=self.user, title='검진', start_date=date(2024, 1, 5))
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class MonthCacheTest(TestCase):
+    """월간 일정 캐시: 같은 구간 재조회는 HIT, 일정 생성/수정/삭제 후에는 MISS로 새 응답"""
+
+    URL = '/v1/calendars/events/'
+    RANGE = {'start_date_from': '2024-03-01', 'start_date_to': '2024-03-31'}
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='month', email='month@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+
+    def get(self):
+        return self.client.get(self.URL, self.RANGE)
+
+    def titles(self, response):
+        return sorted(item['title'] for item in response.json())
+
+    def test_hit_and_miss(self):
+        Event.objects.create(user=self.user, title='검진', start_date=date(2024, 3, 5))
+        first = self.get()
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            second = self.get()
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.content, second.content)
+
+        # 다른 구간은 따로 캐시
+        response = self.client.get(self.URL, {'start_date_from': '2024-04-01', 'start_date_to': '2024-04-30'})
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+    def test_invalidated_on_create_update_delete(self):
+        self.get()
+        response = self.client.post(self.URL, {'title': '검진', 'start_date': '2024-03-05', 'event_type': 'appointment'})
+        self.assertEqual(response.status_code, 201)
+        event_id = response.data['event_id']
+        response = self.get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(self.titles(response), ['검진'])
+        self.assertEqual(self.get()['X-Cache'], 'HIT')
+
+        self.client.patch(f'{self.URL}{event_id}/', {'title': '초음파 검사'})
+        response = self.get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(self.titles(response), ['초음파 검사'])
+
+        self.client.delete(f'{self.URL}{event_id}/')
+        response = self.get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(self.titles(response), [])
+
+    def test_invalidated_by_another_worker(self):
+        self.get()
+        # 다른 워커(별도 캐시 클라이언트)에서 일정 저장
+        with mock.patch('accounts.utils.conditional_utils.cache', caches.create_connection('default')):
+            Event.objects.create(user=self.user, title='검진', start_date=date(2024, 3, 5))
+        response = self.get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(self.titles(response), ['검진'])
+
+
+class CalendarFeedTest(TestCase):
+    """iCalendar 구독 피드: RRULE/EXDATE가 같은 발생일로 해석되고, 토큰 재발급/탈퇴 시 404, 변경 없으면 304"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='feed', email='feed@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+
+    def feed_url(self):
+        return self.client.get('/v1/calendars/events/feed/').data['feed_url']
+
+    def fetch(self, url, **headers):
+        return APIClient().get(url, **headers)
+
+    def vevents(self, response):
+        """줄 접기를 풀고 VEVENT별 {이름: 줄} 목록으로 분리"""
+        text = b''.join(response.streaming_content).decode('utf-8').replace('\r\n ', '')
+        events, current = [], None
+        for line in text.split('\r\n'):
+            if line == 'BEGIN:VEVENT':
+                current = {}
+            elif line == 'END:VEVENT':
+                events.append(current)
+                current = None
+            elif current is not None:
+                current[line.split(':', 1)[0].split(';', 1)[0]] = line
+        return events
+
+    def test_rrule_and_exdate_match_occurrences(self):
+        cases = [
+            (date(2024, 1, 31), None, {'pattern': 'monthly', 'until': '2024-12-31'}),
+            (date(2024, 1, 1), time(9, 30), {'pattern': 'weekly', 'byday': ['MO', 'TH'], 'until': '2024-03-31',
+                                             'exceptions': ['2024-01-04', '2024-02-12']}),
+            (date(2024, 2, 1), None, {'pattern': 'daily', 'interval': 3, 'count': 10, 'exceptions': ['2024-02-07']}),
+            (date(2024, 1, 9), time(14, 0), {'pattern': 'monthly', 'byday': ['2TU'], 'until': '2024-12-31'}),
+        ]
+        expected = {}
+        for start, start_time, rules in cases:
+            event = Event.objects.create(
+                user=self.user, title=f'반복, 일정; {rules["pattern"]}', start_date=start, start_time=start_time,
+                recurrence_rules=rules
+            )
+            rule = CompiledRule.from_rules(rules, start)
+            expected[f'{event.event_id}@nooridal'] = list(rule.occurrences(start, rule.until))
+
+        events = self.vevents(self.fetch(self.feed_url()))
+        self.assertEqual(len(events), len(cases))
+        for vevent in events:
+            source = '\n'.join(vevent[name] for name in ('DTSTART', 'RRULE', 'EXDATE') if name in vevent)
+            parsed = du.rrulestr(source, forceset=True)
+            self.assertEqual([value.date() for value in parsed], expected[vevent['UID'].split(':', 1)[1]])
+            self.assertTrue(vevent['SUMMARY'].startswith('SUMMARY:반복\\, 일정\\;'))
+
+    def test_not_modified_until_event_changes(self):
+        url = self.feed_url()
+        response = self.fetch(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        with self.assertNumQueries(1):
+            # 피드 토큰 확인 1회, 일정 조회 없음
+            self.assertEqual(self.fetch(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Event.objects.create(user=self.user, title='검진', start_date=date(2024, 1, 5))
+        response = self.fetch(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.vevents(response)), 1)
+
+    def test_reset_revokes_previous_url(self):
+        old_url = self.feed_url()
+        self.assertEqual(self.feed_url(), old_url)
+        new_url = self.client.post('/v1/calendars/events/feed/reset/').data['feed_url']
+        self.assertNotEqual(new_url, old_url)
+        self.assertEqual(self.fetch(old_url).status_code, 404)
+        self.assertEqual(self.fetch(new_url).status_code, 200)
+
+    def test_unknown_or_deleted_user(self):
+        url = self.feed_url()
+        # 서명이 맞지 않는 토큰
+        self.assertEqual(self.fetch(url.replace('.ics', 'x.ics')).status_code, 404)
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.fetch(url).status_code, 404)
+        self.user.delete()
+        self.assertFalse(CalendarFeed.objects.exists())
+        self.assertEqual(self.fetch(url).status_code, 404)
+
+
+class EventBulkTest(TestCase):
+    """일정 일괄 생성/수정: 항목별 결과, 중복/타인 일정 거부, 개수 제한, 발생일 재생성과 버전 1회 갱신"""
+
+    URL = '/v1/calendars/events/bulk/'
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='bulk', email='bulk@example.com', password='pw')
+        self.other = User.objects.create_user(username='bulk2', email='bulk2@example.com', password='pw')
+        self.client.force_authenticate(self.user)
+        self.event = Event.objects.create(
+            user=self.user, title='복약', start_date=date(2024, 1, 1),
+            recurrence_rules={'pattern': 'daily', 'until': '2024-01-10'}
+        )
+
+    def post(self, events):
+        with mock.patch('calendars.views.bump_calendar_version') as bump, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.URL, {'events': events}, format='json')
+        return response, bump
+
+    def occurrence_dates(self, event_id):
+        return list(
+            EventOccurrence.objects.filter(event_id=event_id).order_by('occurrence_date')
+            .values_list('occurrence_date', flat=True)
+        )
+
+    def test_partial_failure(self):
+        response, bump = self.post([
+            {'title': '운동', 'start_date': '2024-01-03', 'event_type': 'exercise',
+             'recurrence_rules': {'pattern': 'weekly', 'until': '2024-01-31'}},
+            {'start_date': '2024-01-04'},
+            {'event_id': str(self.event.event_id), 'recurrence_rules': {'pattern': 'daily', 'until': '2024-01-05'}},
+            'not an object',
+        ])
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual((response.data['created'], response.data['updated'], response.data['failed']), (1, 1, 2))
+        self.assertEqual(
+            [item['status'] for item in response.data['results']], ['created', 'failed', 'updated', 'failed']
+        )
+        self.assertIn('title', response.data['results'][1]['errors'])
+        self.assertEqual(Event.objects.filter(user=self.user).count(), 2)
+
+        # bulk 저장은 시그널을 거치지 않으므로 발생일 테이블을 직접 재생성하고, 버전은 배치당 한 번만 갱신
+        created_id = response.data['results'][0]['event']['event_id']
+        self.assertEqual(
+            self.occurrence_dates(created_id), [date(2024, 1, 3) + timedelta(weeks=week) for week in range(5)]
+        )
+        self.assertEqual(
+            self.occurrence_dates(self.event.event_id), [date(2024, 1, day) for day in range(1, 6)]
+        )
+        bump.assert_called_once_with(self.user.pk)
+
+    def test_duplicate_and_foreign_ids(self):
+        foreign = Event.objects.create(user=self.other, title='남의 일정', start_date=date(2024, 1, 1))
+        response, bump = self.post([
+            {'event_id': str(self.event.event_id), 'title': '첫 번째'},
+            {'event_id': str(self.event.event_id), 'title': '두 번째'},
+            {'event_id': str(foreign.event_id), 'title': '수정 시도'},
+            {'event_id': 'not-a-uuid', 'title': '형식 오류'},
+        ])
+        self.assertEqual(response.status_code, 207)
+        statuses = [(item['status'], list(item.get('errors', {}))) for item in response.data['results']]
+        self.assertEqual(statuses, [('updated', []), ('failed', ['event_id']), ('failed', ['event_id']),
+                                    ('failed', ['event_id'])])
+        self.event.refresh_from_db()
+        foreign.refresh_from_db()
+        self.assertEqual(self.event.title, '첫 번째')
+        self.assertEqual(foreign.title, '남의 일정')
+        bump.assert_called_once_with(self.user.pk)
+
+    def test_all_failed_and_limit(self):
+        response, bump = self.post([{'start_date': '2024-01-04'}])
+        self.assertEqual(response.status_code, 400)
+        bump.assert_not_called()
+
+        items = [{'title': f'일정 {index}', 'start_date': '2024-01-04'} for index in range(BULK_EVENT_LIMIT + 1)]
+        response, bump = self.post(items)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Event.objects.filter(user=self.user).count(), 1)
+
+        response, bump = self.post(items[:BULK_EVENT_LIMIT])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created'], BULK_EVENT_LIMIT)
+        bump.assert_called_once_with(self.user.pk)
+
+        response, _ = self.post([])
+        self.assertEqual(response.status_code, 400)
+
+
+class ScaleBenchmarkTest(TestCase):
+    """벤치마크 데이터 생성은 시드 기준으로 재현되고, 실행 후 데이터가 남지 않음"""
+
+    def test_generator_is_seeded(self):
+        _, first = generate_user_events(20, seed=7, anchor=date(2024, 6, 1), username='bench_a')
+        rules_a = list(Event.objects.filter(pk__in=first).order_by('title').values_list('recurrence_rules', flat=True))
+        _, second = generate_user_events(20, seed=7, anchor=date(2024, 6, 1), username='bench_b')
+        rules_b = list(Event.objects.filter(pk__in=second).order_by('title').values_list('recurrence_rules', flat=True))
+        self.assertEqual(rules_a, rules_b)
+
+    def test_run_suite_rolls_back(self):
+        report = run_suite(sizes=(10,), windows=('month',), repeat=1, seed=1, anchor=date(2024, 6, 1))
+        result = report['results'][0]
+        self.assertEqual(result['events'], 10)
+        self.assertEqual(result['list']['month']['cached']['queries'], 0)
+        self.assertFalse(Event.objects.exists())
+
+
+class IntervalTreeTest(SimpleTestCase):
+    """interval tree 겹침 조회가 전수 비교와 같은지 확인"""
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            intervals = []
+            for index in range(rng.randint(0, 40)):
+                start = rng.randint(0, 100)
+                intervals.append((start, start + rng.randint(1, 30), index))
+            tree = IntervalTree(intervals)
+            for _ in range(10):
+                start = rng.randint(-5, 130)
+                end = start + rng.randint(1, 40)
+                expected = sorted(
+                    (interval for interval in intervals if interval[0] < end and interval[1] > start),
+                    key=lambda interval: (interval[0], interval[1])
+                )
+                found = tree.overlapping(start, end)
+                self.assertEqual(sorted(found), sorted(expected))
+                self.assertEqual([interval[0] for interval in found], [interval[0] for interval in expected])
+
+
+class AvailabilityTest(TestCase):
+    """반복/멀티데이 일정을 반영한 충돌 및 빈 시간 계산"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='slots', email='slots@example.com', password='pw')
+        # 2024-01-01(월)부터 매주 월요일 10:00 ~ 11:00
+        Event.objects.create(user=self.user, title='요가', start_date=date(2024, 1, 1), start_time=time(10),
+                             end_time=time(11), recurrence_rules={'pattern': 'weekly'})
+        # 1/15 15:00 ~ 1/17 12:00
+        Event.objects.create(user=self.user, title='출장', start_date=date(2024, 1, 15), end_date=date(2024, 1, 17),
+                             start_time=time(15), end_time=time(12))
+        Event.objects.create(user=self.user, title='종일 일정', start_date=date(2024, 1, 16))
+
+    def test_conflicts(self):
+        found = find_conflicts(self.user, proposed_intervals(date(2024, 1, 8), start_time=time(10, 30)))
+        self.assertEqual([record.event.title for _, _, record in found[0][2]], ['요가'])
+
+        found = find_conflicts(self.user, proposed_intervals(date(2024, 1, 16), start_time=time(9)))
+        self.assertEqual([record.event.title for _, _, record in found[0][2]], ['출장'])
+
+        self.assertEqual(find_conflicts(self.user, proposed_intervals(date(2024, 1, 16))), [])
+        weekly = proposed_intervals(date(2024, 1, 2), start_time=time(10),
+                                    recurrence_rules={'pattern': 'daily', 'count': 14})
+        self.assertEqual(len(find_conflicts(self.user, weekly)), 2)
+
+    def test_free_slots(self):
+        slots = find_free_slots(self.user, date(2024, 1, 15), date(2024, 1, 17), timedelta(minutes=60))
+        self.assertEqual(slots, [
+            (datetime(2024, 1, 15, 9), datetime(2024, 1, 15, 10)),
+            (datetime(2024, 1, 15, 11), datetime(2024, 1, 15, 15)),
+            (datetime(2024, 1, 17, 12), datetime(2024, 1, 17, 18)),
+        ])
+
+
+class CheckupOverlayTest(SimpleTestCase):
+    """출산 예정일 기준 주차별 정기검진 일정 계산"""
+
+    def test_csv_has_all_weeks(self):
+        checkups = load_checkups()
+        self.assertEqual(sorted(checkups), list(range(1, 43)))
+        self.assertEqual(checkups[20], '20주 정밀 초음파')
+
+    def test_week_start_matches_pregnancy_week_task(self):
+        due_date = date(2025, 3, 1)
+        for week in range(1, 43):
+            start = week_start(due_date, week)
+            for day in (start, start + timedelta(days=6)):
+                self.assertEqual(math.ceil(40 - (due_date - day).days / 7), week)
+
+    def test_range_matches_full_schedule(self):
+        due_date = date(2025, 3, 1)
+        schedule = checkup_schedule(due_date)
+        rng = random.Random(3)
+        for _ in range(200):
+            start = date(2024, 4, 1) + timedelta(days=rng.randint(0, 400))
+            end = start + timedelta(days=rng.randint(0, 120))
+            expected = [item for item in schedule if start <= item[1] <= end]
+            self.assertEqual(checkups_in_range(due_date, start, end), expected)
+
+
+class DailySummaryTargetTest(TestCase):
+    """전날 대화가 있고 요약이 없는 활성 사용자만 집계 쿼리 한 번으로 선택"""
+
+    def test_users_to_summarize(self):
+        yesterday = timezone.localdate() - timedelta(days=1)
+        users = [
+            User.objects.create_user(username=f'summary{index}', email=f'summary{index}@example.com',
+                                     password='pw', phone_number=f'0100000{index}')
+            for index in range(4)
+        ]
+        for user in users[:3]:
+            for _ in range(2):
+                conversation = LLMConversation.objects.create(user=user, query='질문', response='답변')
+                LLMConversation.objects.filter(pk=conversation.pk).update(
+                    created_at=timezone.make_aware(datetime.combine(yesterday, time(12)))
+                )
+        DailyConversationSummary.objects.create(user=users[0], summary_date=yesterday, summary_text='요약')
+        users[1].is_active = False
+        users[1].save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(users_to_summarize(yesterday), [users[2].user_id])
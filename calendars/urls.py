@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import EventViewSet, DailyConversationSummaryViewSet, BabyDiaryViewSet, BabyDiaryPhotoView
+from .views import EventViewSet, DailyConversationSummaryViewSet, BabyDiaryViewSet, BabyDiaryPhotoView, CalendarFeedView
 
 router = DefaultRouter()
 
@@ -11,6 +11,7 @@ router.register('baby-diaries', BabyDiaryViewSet, basename='baby-diary')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('feed/<str:token>.ics', CalendarFeedView.as_view(), name='calendar-feed'),  # iCalendar 구독 피드
     path('baby-diaries/<uuid:diary_id>/photo/', BabyDiaryPhotoView.as_view(), name='baby_diary_photo_list'),  # 모든 사진 조회 및 추가
     path('baby-diaries/<uuid:diary_id>/photo/<uuid:pk>/', BabyDiaryPhotoView.as_view(), name='baby_diary_photo_detail'),  # 특정 사진 조회, 수정, 삭제
     path('baby-diaries/<uuid:diary_id>/diary/', BabyDiaryViewSet.as_view({
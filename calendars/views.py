@@ -2,25 +2,29 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
 from rest_framework.parsers import MultiPartParser, FormParser
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from django_filters import rest_framework as filters
-from .models import Event, DailyConversationSummary, BabyDiary, Pregnancy
+from .models import Event, EventOccurrence, DailyConversationSummary, BabyDiary, Pregnancy
 from .serializers import (
     EventSerializer, 
     EventDetailSerializer,
+    BULK_EVENT_LIMIT,
+    EventConflictQuerySerializer,
+    FreeSlotQuerySerializer,
+    render_occurrences,
     DailyConversationSummarySerializer,
     DailyConversationSummaryCreateSerializer,
     BabyDiarySerializer,
     BabyDiaryCreateSerializer
 )
-from llm.models import LLMConversation
 import logging
 from datetime import datetime, timedelta, date
 import os
-from openai import OpenAI
 from dotenv import load_dotenv
-from django.http import Http404
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.http import parse_etags
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
@@ -28,10 +32,19 @@ from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from .models import BabyDiary, BabyDiaryPhoto
 from .serializers import BabyDiaryPhotoSerializer
-from django.db.models import Q
 import json
-import copy
-import calendar
+import uuid
+from django.db import transaction
+from .occurrences import OccurrenceRecord, materialize_events, occurrences_in_range
+from .month_cache import (
+    cached_month_payload, cache_stats as month_cache_stats, get_version as get_calendar_version,
+    bump_version as bump_calendar_version
+)
+from .availability import find_conflicts, find_free_slots, proposed_intervals
+from .checkups import CheckupEvent, active_pregnancies, checkup_overlay, load_checkups, week_start
+from .daily_summary import NoConversations, SummaryExists, SummaryNotConfigured, summarize_user_day
+from .ics import feed_from_token, get_feed, iter_calendar, make_feed_token
+from accounts.utils.conditional_utils import ConditionalGetMixin
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -48,7 +61,7 @@ class EventFilter(filters.FilterSet):
         model = Event
         fields = ['start_date', 'end_date', 'event_type', 'start_date_from', 'start_date_to', 'end_date_from', 'end_date_to']
 
-class EventViewSet(viewsets.ViewSet):
+class EventViewSet(ConditionalGetMixin, viewsets.ViewSet):
     """
     일정 관리 ViewSet
     
@@ -60,6 +73,8 @@ class EventViewSet(viewsets.ViewSet):
     """
     permission_classes = [IsAuthenticated]
     filterset_class = EventFilter
+    conditional_resources = ('events',)
+    conditional_actions = ('list', 'free_slots')
     
     def list(self, request):
         """
@@ -71,52 +86,257 @@ class EventViewSet(viewsets.ViewSet):
         
         logger.info(f"Filtering events with start_date_from: {start_date_from}, start_date_to: {start_date_to}")
         
-        # 사용자의 일정만 조회
-        queryset = Event.objects.filter(user=request.user)
-        
-        # 날짜 범위 필터링
-        if start_date_from:
-            queryset = queryset.filter(
-                Q(start_date__gte=start_date_from) | 
-                Q(recurrence_rules__isnull=False)  # 반복 일정은 별도 처리
-            )
-        if start_date_to:
-            # 날짜 범위 내에 있는 이벤트를 모두 포함
-            # 1. start_date가 범위 내인 경우
-            # 2. end_date가 범위 내인 경우
-            # 3. 이벤트가 날짜 범위를 완전히 포함하는 경우
-            date_range_query = Q(start_date__lte=start_date_to) & (
-                Q(end_date__isnull=True) | Q(end_date__gte=start_date_from)
-            )
-            non_recurring_queryset = queryset.filter(
-                Q(recurrence_rules__isnull=True) & date_range_query
-            )
-        else:
-            non_recurring_queryset = queryset.filter(recurrence_rules__isnull=True)
-
-        # 반복 일정 처리
-        recurring_queryset = queryset.filter(recurrence_rules__isnull=False)
-        
-        # 결과 리스트 준비
-        result_events = list(non_recurring_queryset)
-        
-        # 날짜 범위가 지정된 경우에만 반복 이벤트 확장
+        # 날짜 범위가 지정된 경우 발생일 테이블에서 범위 쿼리로 조회
         if start_date_from and start_date_to:
-            start_date_from_obj = datetime.strptime(start_date_from, '%Y-%m-%d').date()
-            start_date_to_obj = datetime.strptime(start_date_to, '%Y-%m-%d').date()
-            
-            # 각 반복 일정에 대해 가상 인스턴스 생성
-            for event in recurring_queryset:
-                virtual_instances = self._expand_recurring_event(
-                    event, start_date_from_obj, start_date_to_obj
+            try:
+                start_date_from_obj = datetime.strptime(start_date_from, '%Y-%m-%d').date()
+                start_date_to_obj = datetime.strptime(start_date_to, '%Y-%m-%d').date()
+            except ValueError:
+                return Response(
+                    {"error": "날짜는 YYYY-MM-DD 형식이어야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # 같은 구간 반복 조회는 (사용자, 구간) 캐시로 응답 (일정 저장/삭제 시 버전이 바뀌어 무효화됨)
+            payload, hit = cached_month_payload(
+                request.user.pk, start_date_from_obj, start_date_to_obj,
+                lambda: render_occurrences(
+                    self._events_with_checkups(request.user, start_date_from_obj, start_date_to_obj)
                 )
-                result_events.extend(virtual_instances)
+            )
+            logger.info(f"Events payload: {len(payload)} bytes, cache hit: {hit}")
+            # 이미 JSON으로 직렬화된 응답이므로 렌더러를 거치지 않음
+            response = HttpResponse(payload, content_type='application/json')
+            response['X-Cache'] = 'HIT' if hit else 'MISS'
+            return response
+
+        # 사용자의 일정만 조회 (반복 일정은 날짜 범위가 모두 지정된 경우에만 확장)
+        queryset = Event.objects.filter(user=request.user, recurrence_rules__isnull=True)
+        if start_date_from:
+            queryset = queryset.filter(start_date__gte=start_date_from)
+        if start_date_to:
+            queryset = queryset.filter(start_date__lte=start_date_to)
+        result_events = list(queryset)
         
         logger.info(f"Total events (including virtual recurring instances): {len(result_events)}")
         
         serializer = EventSerializer(result_events, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
+    def cache_stats(self, request):
+        """월간 일정 캐시 적중률 (관리자 전용)"""
+        return Response(month_cache_stats())
+
+    @action(detail=False, methods=['get'])
+    def feed(self, request):
+        """휴대폰 캘린더 앱 구독용 iCalendar 피드 주소"""
+        url = reverse('calendar-feed', kwargs={'token': make_feed_token(get_feed(request.user))})
+        return Response({"feed_url": request.build_absolute_uri(url)})
+
+    @action(detail=False, methods=['post'], url_path='feed/reset')
+    def reset_feed(self, request):
+        """구독 주소 재발급 (이전 주소는 더 이상 동작하지 않음)"""
+        feed = get_feed(request.user)
+        feed.rotate()
+        url = reverse('calendar-feed', kwargs={'token': make_feed_token(feed)})
+        return Response({"feed_url": request.build_absolute_uri(url)})
+
+    @action(detail=False, methods=['post'])
+    def conflicts(self, request):
+        """
+        등록/수정하려는 일정과 시간이 겹치는 기존 일정 조회
+
+        body: start_date, end_date, start_time, end_time, recurrence_rules (선택), event_id (수정 중인 일정, 선택)
+        반복 규칙이 있으면 최대 1년 안의 반복일을 모두 확인합니다. 시작 시간이 없는 종일 일정은 충돌로 보지 않습니다.
+        """
+        serializer = EventConflictQuerySerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        intervals = proposed_intervals(
+            data['start_date'], data.get('end_date'), data.get('start_time'), data.get('end_time'),
+            data.get('recurrence_rules')
+        )
+        found = find_conflicts(request.user, intervals, exclude_event_id=data.get('event_id'))
+        return Response({
+            "has_conflict": bool(found),
+            "conflicts": [
+                {
+                    "proposed_start": start.isoformat(),
+                    "proposed_end": end.isoformat(),
+                    "events": [
+                        {
+                            "event_id": str(record.event.event_id),
+                            "title": record.event.title,
+                            "event_type": record.event.event_type,
+                            "start": busy_start.isoformat(),
+                            "end": busy_end.isoformat(),
+                            "is_recurring_instance": record.is_virtual,
+                        }
+                        for busy_start, busy_end, record in overlaps
+                    ],
+                }
+                for start, end, overlaps in found
+            ],
+        })
+
+    @action(detail=False, methods=['get'])
+    def free_slots(self, request):
+        """
+        날짜 범위의 빈 시간 조회
+
+        query parameters:
+        - start_date, end_date: 조회 범위 (YYYY-MM-DD, 최대 92일)
+        - min_duration: 최소 길이 (분, 기본값 30)
+        - day_start, day_end: 하루 중 조회할 시간대 (HH:MM, 기본값 09:00 ~ 18:00)
+        """
+        serializer = FreeSlotQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        slots = find_free_slots(
+            request.user, data['start_date'], data['end_date'], timedelta(minutes=data['min_duration']),
+            data['day_start'], data['day_end']
+        )
+        return Response({
+            "free_slots": [
+                {"start": start.isoformat(), "end": end.isoformat(), "minutes": int((end - start).total_seconds() // 60)}
+                for start, end in slots
+            ]
+        })
+
+    @action(detail=False, methods=['post'])
+    def promote_checkup(self, request):
+        """
+        가상 정기검진 일정을 실제 일정으로 등록
+
+        body: {"week": 12, "pregnancy_id": "..." (선택, 활성 임신 정보가 여러 개인 경우)}
+        """
+        try:
+            week = int(request.data.get('week'))
+        except (TypeError, ValueError):
+            return Response({"error": "week는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        pregnancies = active_pregnancies(request.user)
+        if request.data.get('pregnancy_id'):
+            pregnancies = pregnancies.filter(pregnancy_id=request.data['pregnancy_id'])
+        pregnancy = pregnancies.order_by('-created_at').first()
+        if pregnancy is None:
+            return Response({"error": "출산 예정일이 등록된 임신 정보가 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        checkup = load_checkups().get(week)
+        if checkup is None:
+            return Response({"error": "해당 주차의 권장 정기검진이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        virtual = CheckupEvent(pregnancy, week, week_start(pregnancy.due_date, week), checkup)
+        if Event.objects.filter(user=request.user, start_date=virtual.start_date, title=virtual.title).exists():
+            return Response({"error": "이미 일정으로 등록된 정기검진입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        event = Event.objects.create(
+            user=request.user,
+            title=virtual.title,
+            description=virtual.description,
+            start_date=virtual.start_date,
+            end_date=virtual.end_date,
+            event_type=virtual.event_type,
+            event_color=virtual.event_color,
+        )
+        return Response(EventDetailSerializer(event).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        일정 일괄 생성/수정 (최대 BULK_EVENT_LIMIT개)
+
+        body: {"events": [{...새 일정...}, {"event_id": "...", ...수정할 필드...}]}
+
+        유효한 항목은 한 트랜잭션에서 bulk_create/bulk_update로 저장하고,
+        실패한 항목은 나머지 저장을 막지 않고 항목별 오류로 돌려줍니다.
+        """
+        items = request.data.get('events') if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response({"error": "events 목록이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > BULK_EVENT_LIMIT:
+            return Response(
+                {"error": f"한 번에 최대 {BULK_EVENT_LIMIT}개의 일정만 처리할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 수정 대상 일정은 한 번의 쿼리로 조회 (형식이 잘못된 event_id는 항목 검증에서 실패 처리)
+        event_ids = []
+        for item in items:
+            if isinstance(item, dict) and item.get('event_id') is not None:
+                try:
+                    event_ids.append(uuid.UUID(str(item['event_id'])))
+                except ValueError:
+                    pass
+        instances = {
+            str(event.event_id): event
+            for event in Event.objects.filter(user=request.user, event_id__in=event_ids)
+        } if event_ids else {}
+
+        results = EventDetailSerializer(data=items, many=True).validate_items(instances)
+
+        now = timezone.now()
+        creates, updates, update_fields = [], [], set()
+        saved = {}
+        for index, (instance, data, errors) in enumerate(results):
+            if errors:
+                continue
+            if instance is None:
+                event = Event(user=request.user, **data)
+                creates.append(event)
+            else:
+                event = instance
+                for field, value in data.items():
+                    setattr(event, field, value)
+                    update_fields.add(field)
+                # bulk_update는 auto_now를 적용하지 않으므로 직접 갱신 (반복 규칙 캐시 키로도 사용됨)
+                event.updated_at = now
+                updates.append(event)
+            # bulk 저장은 save()를 거치지 않으므로 파생 컬럼 직접 동기화
+            event.sync_recurrence_columns()
+            saved[index] = event
+
+        if saved:
+            with transaction.atomic():
+                Event.objects.bulk_create(creates)
+                if updates:
+                    Event.objects.bulk_update(
+                        updates, list(update_fields | {'updated_at', 'recurrence_pattern', 'recurrence_until'})
+                    )
+                materialize_events(saved.values())
+                # 시그널을 거치지 않으므로 월간 캐시 버전은 배치당 한 번만 올림
+                user_id = request.user.pk
+                transaction.on_commit(lambda: bump_calendar_version(user_id))
+
+        response_items = []
+        for index, (instance, data, errors) in enumerate(results):
+            if errors:
+                response_items.append({"index": index, "status": "failed", "errors": errors})
+            else:
+                response_items.append({
+                    "index": index,
+                    "status": "updated" if instance is not None else "created",
+                    "event": EventDetailSerializer(saved[index]).data,
+                })
+
+        failed = len(results) - len(saved)
+        if not saved:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif failed:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_200_OK
+        return Response({
+            "created": len(creates),
+            "updated": len(updates),
+            "failed": failed,
+            "results": response_items,
+        }, status=response_status)
+
     def retrieve(self, request, pk=None):
         event = get_object_or_404(Event, event_id=pk, user=request.user)
         serializer = EventDetailSerializer(event)
@@ -310,222 +530,43 @@ class EventViewSet(viewsets.ViewSet):
                 
         return Response({"error": "잘못된 update_type 값입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-    def _expand_recurring_event(self, event, start_date, end_date):
-        """
-        반복 일정에 대해 지정된 날짜 범위 내의 가상 인스턴스 생성
-        """
-        if not event.recurrence_rules:
-            return []
-        
-        recurrence_rules = event.recurrence_rules
-        pattern = recurrence_rules.get('pattern')
-        until_date_str = recurrence_rules.get('until')
-        exceptions = recurrence_rules.get('exceptions', [])
-        
-        # 종료일이 지정되어 있지 않은 경우 기본값 설정 (1년)
-        if until_date_str:
-            until_date = datetime.strptime(until_date_str, '%Y-%m-%d').date()
-        else:
-            until_date = event.start_date + timedelta(days=365)
-        
-        # 조회 범위의 종료일이 반복 종료일보다 이후인 경우 종료일로 제한
-        end_date = min(end_date, until_date)
-        
-        # 조회 범위가 반복 시작일보다 이전이거나, 반복 종료일보다 이후인 경우 빈 리스트 반환
-        if end_date < event.start_date or start_date > until_date:
-            return []
-        
-        # 멀티데이 이벤트인 경우 일정 기간 계산
-        event_duration = None
-        if event.end_date:
-            event_duration = (event.end_date - event.start_date).days
-        
-        # 결과 리스트 준비
-        virtual_instances = []
-        
-        # 첫 날짜가 조회 범위 내에 있으면 원본 이벤트 추가
-        if start_date <= event.start_date <= end_date:
-            if event.start_date.strftime('%Y-%m-%d') not in exceptions:
-                virtual_instances.append(event)
-        
-        # 패턴별 처리
-        if pattern == 'daily':
-            # 매일 반복
-            current_date = event.start_date + timedelta(days=1)  # 원본 다음날부터 시작
-            
-            while current_date <= end_date:
-                if current_date < start_date:
-                    current_date += timedelta(days=1)
-                    continue
-                    
-                # 예외 날짜 확인
-                if current_date.strftime('%Y-%m-%d') in exceptions:
-                    current_date += timedelta(days=1)
-                    continue
-                
-                # 가상 인스턴스 생성
-                instance = self._create_virtual_instance(
-                    event, current_date, event_duration
-                )
-                virtual_instances.append(instance)
-                
-                current_date += timedelta(days=1)
-                
-        elif pattern == 'weekly':
-            # 매주 반복 (같은 요일)
-            current_date = event.start_date + timedelta(days=7)  # 1주일 후부터 시작
-            
-            while current_date <= end_date:
-                if current_date < start_date:
-                    current_date += timedelta(days=7)
-                    continue
-                    
-                # 예외 날짜 확인
-                if current_date.strftime('%Y-%m-%d') in exceptions:
-                    current_date += timedelta(days=7)
-                    continue
-                
-                # 가상 인스턴스 생성
-                instance = self._create_virtual_instance(
-                    event, current_date, event_duration
-                )
-                virtual_instances.append(instance)
-                
-                current_date += timedelta(days=7)
-                
-        elif pattern == 'monthly':
-            # 매월 반복 (같은 날짜)
-            day_of_month = event.start_date.day
-            
-            # 첫 번째 반복일 계산 (다음 달 같은 날짜)
-            if event.start_date.month == 12:
-                next_month = 1
-                next_year = event.start_date.year + 1
-            else:
-                next_month = event.start_date.month + 1
-                next_year = event.start_date.year
-            
-            last_day = calendar.monthrange(next_year, next_month)[1]
-            actual_day = min(day_of_month, last_day)
-            
-            try:
-                current_date = date(next_year, next_month, actual_day)
-            except ValueError:
-                # 유효하지 않은 날짜인 경우 다음 달 1일
-                current_date = date(next_year, next_month, 1)
-            
-            # 매월 반복 계산
-            while current_date <= end_date:
-                if current_date < start_date:
-                    # 다음 달로 이동
-                    if current_date.month == 12:
-                        next_month = 1
-                        next_year = current_date.year + 1
-                    else:
-                        next_month = current_date.month + 1
-                        next_year = current_date.year
-                    
-                    last_day = calendar.monthrange(next_year, next_month)[1]
-                    actual_day = min(day_of_month, last_day)
-                    
-                    try:
-                        current_date = date(next_year, next_month, actual_day)
-                    except ValueError:
-                        current_date = date(next_year, next_month, 1)
-                    continue
-                
-                # 예외 날짜 확인
-                if current_date.strftime('%Y-%m-%d') in exceptions:
-                    # 다음 달로 이동
-                    if current_date.month == 12:
-                        next_month = 1
-                        next_year = current_date.year + 1
-                    else:
-                        next_month = current_date.month + 1
-                        next_year = current_date.year
-                    
-                    last_day = calendar.monthrange(next_year, next_month)[1]
-                    actual_day = min(day_of_month, last_day)
-                    
-                    try:
-                        current_date = date(next_year, next_month, actual_day)
-                    except ValueError:
-                        current_date = date(next_year, next_month, 1)
-                    continue
-                
-                # 가상 인스턴스 생성
-                instance = self._create_virtual_instance(
-                    event, current_date, event_duration
-                )
-                virtual_instances.append(instance)
-                
-                # 다음 달로 이동
-                if current_date.month == 12:
-                    next_month = 1
-                    next_year = current_date.year + 1
-                else:
-                    next_month = current_date.month + 1
-                    next_year = current_date.year
-                
-                last_day = calendar.monthrange(next_year, next_month)[1]
-                actual_day = min(day_of_month, last_day)
-                
-                try:
-                    current_date = date(next_year, next_month, actual_day)
-                except ValueError:
-                    current_date = date(next_year, next_month, 1)
-                
-        elif pattern == 'yearly':
-            # 매년 반복 (같은 월, 같은 날)
-            origin_month = event.start_date.month
-            origin_day = event.start_date.day
-            
-            # 다음 해부터 시작
-            for year in range(event.start_date.year + 1, end_date.year + 1):
-                try:
-                    current_date = date(year, origin_month, origin_day)
-                    
-                    if current_date > end_date:
-                        break
-                        
-                    if current_date < start_date:
-                        continue
-                    
-                    # 예외 날짜 확인
-                    if current_date.strftime('%Y-%m-%d') in exceptions:
-                        continue
-                    
-                    # 가상 인스턴스 생성
-                    instance = self._create_virtual_instance(
-                        event, current_date, event_duration
-                    )
-                    virtual_instances.append(instance)
-                    
-                except ValueError:
-                    # 윤년 관련 문제 (2월 29일 등) - 건너뜀
-                    continue
-        
-        return virtual_instances
+    def _events_in_range(self, user, start_date, end_date):
+        """조회 구간에 시작하는 일정 및 반복 인스턴스 목록 (OccurrenceRecord)"""
+        return occurrences_in_range(user, start_date, end_date)
 
-    def _create_virtual_instance(self, event, new_date, duration=None):
-        """
-        반복 일정의 가상 인스턴스를 생성합니다.
-        """
-        # 이벤트 객체 복사 (얕은 복사)
-        instance = copy.copy(event)
-        
-        # 가상 인스턴스임을 표시하는 속성 추가
-        instance._is_virtual = True
-        instance._original_event_id = event.event_id
-        
-        # 날짜 설정
-        instance.start_date = new_date
-        if duration is not None:
-            instance.end_date = new_date + timedelta(days=duration)
+    def _events_with_checkups(self, user, start_date, end_date):
+        """조회 구간 일정 + 출산 예정일 기준 가상 정기검진 일정 (임신 정보 변경 시 일정 버전이 바뀌어 캐시 무효화됨)"""
+        records = self._events_in_range(user, start_date, end_date)
+        records.extend(checkup_overlay(user, start_date, end_date, records))
+        return records
+
+class CalendarFeedView(APIView):
+    """
+    사용자별 iCalendar(.ics) 구독 피드
+
+    캘린더 앱은 인증 헤더를 보낼 수 없으므로 서명된 토큰(사용자 ID + 피드 nonce)으로 사용자를 확인합니다.
+    재발급으로 nonce가 바뀌었거나 탈퇴/비활성 사용자의 토큰이면 404를 반환합니다.
+    ETag는 공유 캐시의 사용자 일정 버전(월간 캐시와 같은 값)이므로, 변경이 없으면 일정 조회 없이 304를 반환합니다.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, token):
+        feed = feed_from_token(token)
+        if feed is None:
+            return Response({"error": "구독 주소가 올바르지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+        user_id = feed.user_id
+
+        etag = f'"ics-{get_calendar_version(user_id)}"'
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and (if_none_match.strip() == '*' or etag in parse_etags(if_none_match)):
+            response = HttpResponseNotModified()
         else:
-            instance.end_date = None
-        
-        return instance
+            response = StreamingHttpResponse(iter_calendar(user_id), content_type='text/calendar; charset=utf-8')
+            response['Content-Disposition'] = 'inline; filename="nooridal.ics"'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
 
 class DailyConversationSummaryFilter(filters.FilterSet):
     start_date = filters.DateFilter(field_name='summary_date', lookup_expr='gte')
@@ -536,7 +577,7 @@ class DailyConversationSummaryFilter(filters.FilterSet):
         fields = ['summary_date', 'user', 'pregnancy', 'start_date', 'end_date']
 
 
-class DailyConversationSummaryViewSet(viewsets.ModelViewSet):
+class DailyConversationSummaryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     일별 LLM 대화 요약 관리 ViewSet
     
@@ -553,6 +594,7 @@ class DailyConversationSummaryViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [IsAuthenticated]
     filterset_class = DailyConversationSummaryFilter
+    conditional_resources = ('conversation-summaries',)
     
     def get_queryset(self):
         # 쿼리 파라미터 로깅
@@ -611,108 +653,31 @@ class DailyConversationSummaryViewSet(viewsets.ModelViewSet):
                 summary_date = datetime.strptime(summary_date_str, '%Y-%m-%d').date()
             else:
                 summary_date = datetime.now().date()
-                
-            # 이미 해당 날짜의 요약이 있는지 확인
-            existing_summary = DailyConversationSummary.objects.filter(
-                user=request.user,
-                summary_date=summary_date
-            ).first()
-            
-            if existing_summary:
-                return Response(
-                    {"error": f"이미 {summary_date} 날짜의 요약이 존재합니다. ID: {existing_summary.summary_id}"},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # 해당 날짜의 대화 찾기
-            start_naive = datetime.combine(summary_date, datetime.min.time())
-            end_naive = datetime.combine(summary_date, datetime.max.time())
-            
-            # 시간대 정보 추가
-            start_datetime = timezone.make_aware(start_naive)
-            end_datetime = timezone.make_aware(end_naive)
-
-            conversations = LLMConversation.objects.filter(
-                user=request.user,
-                created_at__gte=start_datetime,
-                created_at__lte=end_datetime
-            )
-            
-            if not conversations.exists():
-                return Response(
-                    {"error": f"{summary_date} 날짜에 해당하는 대화가 없습니다."},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            # 대화 내용 수집
-            conversation_texts = []
-            conversation_ids = []
-            
-            for conversation in conversations:
-                # conversation 자체가 하나의 질문-응답 쌍입니다
-                conversation_text = f"대화 ID: {conversation.id}\n"
-                conversation_text += f"사용자: {conversation.query}\n"
-                conversation_text += f"AI: {conversation.response}\n"
-                
-                conversation_texts.append(conversation_text)
-                conversation_ids.append(conversation.id)
-            
-            # LLM 호출하여 요약 생성
-            all_conversations = "\n\n".join(conversation_texts)
-            
-            try:
-                # OpenAI API 직접 호출 (GPT-4o mini 사용)
-                api_key = os.getenv('OPENAI_API_KEY')
-                if not api_key:
-                    logger.error("OpenAI API 키가 설정되지 않았습니다.")
-                    return Response(
-                        {"error": "서비스 구성 오류가 발생했습니다. 관리자에게 문의하세요."},
-                        status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                    )
-                
-                client = OpenAI(api_key=api_key)
-                
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",  # 더 가벼운 GPT-4o mini 모델 사용
-                    messages=[
-                        {"role": "system", "content": "당신은 임신 관련 정보를 요약해주는 전문가입니다. 캘린더에 기록될 '오늘의 하루' 요약을 생성해주세요. '대화에서', '대화에 따르면' 같은 표현을 사용하지 말고, 직접적으로 정보와 주제만 요약해주세요. 300자 이내로 작성하세요."},
-                        {"role": "user", "content": "다음은 오늘 나눈 대화 내용입니다. 이 내용을 바탕으로 오늘의 주요 임신 관련 정보와 주제를 요약해주세요. 대화의 출처나 맥락을 언급하지 말고, 내용 자체만 요약해주세요:\n\n" + all_conversations}
-                    ],
-                    temperature=0.3,
-                    max_tokens=500
-                )
-                
-                summary_text = response.choices[0].message.content.strip()
-                
-                # 요약 저장
-                summary = DailyConversationSummary.objects.create(
-                    user=request.user,
-                    pregnancy_id=pregnancy_id,
-                    summary_date=summary_date,
-                    summary_text=summary_text
-                )
-                
-                # 대화 연결
-                summary.conversations.set(conversations)
-                
-                # 결과 반환
-                serializer = DailyConversationSummarySerializer(summary)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-                
-            except Exception as e:
-                logger.error(f"LLM 요약 생성 중 오류 발생: {str(e)}")
-                return Response(
-                    {"error": f"요약 생성 중 오류가 발생했습니다: {str(e)}"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-                
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             logger.error(f"자동 요약 중 오류 발생: {str(e)}")
             return Response(
                 {"error": f"요약 생성 중 오류가 발생했습니다: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            summary = summarize_user_day(request.user.pk, summary_date, pregnancy_id)
+        except SummaryExists as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except NoConversations as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except SummaryNotConfigured as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            logger.error(f"LLM 요약 생성 중 오류 발생: {str(e)}")
+            return Response(
+                {"error": f"요약 생성 중 오류가 발생했습니다: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        serializer = DailyConversationSummarySerializer(summary)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
 class BabyDiaryFilter(filters.FilterSet):
     start_date = filters.DateFilter(field_name='diary_date', lookup_expr='gte')
     end_date = filters.DateFilter(field_name='diary_date', lookup_expr='lte')
@@ -722,7 +687,7 @@ class BabyDiaryFilter(filters.FilterSet):
         fields = ['diary_date', 'user', 'pregnancy', 'start_date', 'end_date']
 
 
-class BabyDiaryViewSet(viewsets.ModelViewSet):
+class BabyDiaryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     아기 일기 관리 ViewSet
 
@@ -739,6 +704,7 @@ class BabyDiaryViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [IsAuthenticated]  # 로그인한 사용자만 접근
     lookup_field = 'pregnancy_id'  # pregnancy_id로 조회
+    conditional_resources = ('baby-diaries',)
 
     def get_queryset(self):
         user = self.request.user
@@ -211,6 +211,15 @@ else:
         }
     }
 
+# 로컬 실행/벤치마크용 SQLite (DB_ENGINE=sqlite)
+if os.getenv('DB_ENGINE') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        }
+    }
+
 
 
 # Password validation
@@ -402,6 +411,9 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE  # 한국 시간대 설정
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
+# 일별 대화 요약(summarize-yesterday-conversations) 태스크 하나가 처리할 사용자 수
+DAILY_SUMMARY_CHUNK_SIZE = int(os.getenv('DAILY_SUMMARY_CHUNK_SIZE', '20'))
+
 # Celery Beat 설정
 from celery.schedules import crontab
 
@@ -416,15 +428,40 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'accounts.tasks.update_pregnancy_weeks',
         'schedule': crontab(hour=0, minute=0),  # 매일 자정 0시 0분 실행
     },
+    # 반복 일정 발생일 테이블을 EVENT_OCCURRENCE_HORIZON_DAYS까지 연장
+    'extend-event-occurrences': {
+        'task': 'calendars.tasks.extend_event_occurrences',
+        'schedule': crontab(hour=2, minute=30),  # 매일 새벽 2시 30분 실행
+    },
+    # 만료된 사용자 데이터 내보내기 파일 정리
+    'cleanup-expired-data-exports': {
+        'task': 'accounts.tasks.cleanup_expired_data_exports',
+        'schedule': crontab(minute=30),  # 매시 30분 실행
+    },
 }
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
-        "TIMEOUT": 600,
+# 캐시 (조건부 GET 리소스 버전, 월간 일정 캐시는 Gunicorn 워커와 Celery 워커가 모두 같은 값을 봐야 하므로
+# Celery와 같은 Redis의 별도 DB를 공유 캐시로 사용)
+REDIS_CACHE_URL = os.getenv('REDIS_CACHE_URL') or CELERY_BROKER_URL.rsplit('/', 1)[0] + '/1'
+
+if os.getenv('CACHE_BACKEND') == 'locmem':
+    # Redis 없이 단일 프로세스로 실행할 때만 사용 (프로세스 간 캐시가 공유되지 않음)
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unique-snowflake",
+            "TIMEOUT": 600,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_CACHE_URL,
+            "TIMEOUT": 600,
+            "KEY_PREFIX": "florence",
+        }
     }
-}
 
 # Media
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -433,6 +470,14 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 사용자 데이터 내보내기 파일 저장 경로 (MEDIA와 분리해 공개 URL로 노출되지 않도록 함)
+DATA_EXPORT_ROOT = os.path.join(BASE_DIR, 'exports')
+DATA_EXPORT_TTL_HOURS = int(os.getenv('DATA_EXPORT_TTL_HOURS', '24'))  # 다운로드 가능 시간
+DATA_EXPORT_STALE_MINUTES = int(os.getenv('DATA_EXPORT_STALE_MINUTES', '60'))  # 이 시간이 지나도 끝나지 않은 작업은 실패 처리
+
+# 반복 일정 발생일을 미리 생성해 둘 기간 (오늘부터, 일)
+EVENT_OCCURRENCE_HORIZON_DAYS = int(os.getenv('EVENT_OCCURRENCE_HORIZON_DAYS', '730'))
+
 # 정적 파일 저장 경로
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
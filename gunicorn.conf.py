@@ -0,0 +1,13 @@
+# gunicorn 설정 파일 (실행 디렉토리의 gunicorn.conf.py를 자동으로 읽음)
+
+
+def post_worker_init(worker):
+    """워커 초기화 후 에이전트 이벤트 루프 시작 (fork 이후에 스레드를 만들어야 함)"""
+    from llm.agent_loop import agent_loop_executor
+    agent_loop_executor.start()
+
+
+def worker_exit(server, worker):
+    """워커 종료 시 에이전트 이벤트 루프와 공유 연결 풀 정리"""
+    from llm.agent_loop import agent_loop_executor
+    agent_loop_executor.shutdown()
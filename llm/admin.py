@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db.models import Q
 from .models import LLMConversation, ChatManager
+from .tasks import summarize_chat_rooms
+from .search import search_filter
 
 @admin.register(ChatManager)
 class ChatManagerAdmin(admin.ModelAdmin):
@@ -7,13 +10,13 @@ class ChatManagerAdmin(admin.ModelAdmin):
     list_display = ('chat_id', 'get_user_name', 'topic_preview', 'message_count', 'created_at', 'is_active')
     list_filter = ('created_at', 'is_active')
     search_fields = ('user__name', 'topic')
-    readonly_fields = ('chat_id', 'message_count', 'created_at', 'updated_at')
+    readonly_fields = ('chat_id', 'message_count', 'summarized_message_count', 'created_at', 'updated_at')
     fieldsets = (
         ('기본 정보', {
             'fields': ('chat_id', 'user', 'pregnancy', 'is_active', 'created_at', 'updated_at')
         }),
         ('채팅 정보', {
-            'fields': ('topic', 'message_count')
+            'fields': ('topic', 'message_count', 'summarized_message_count')
         }),
     )
     actions = ['summarize_selected_chats']
@@ -31,10 +34,13 @@ class ChatManagerAdmin(admin.ModelAdmin):
     topic_preview.short_description = '주제'
     
     def summarize_selected_chats(self, request, queryset):
-        """선택된 채팅방 요약 액션"""
-        for chat in queryset:
-            chat.summarize_chat()
-        self.message_user(request, f"{queryset.count()}개의 채팅방이 요약되었습니다.")
+        """선택된 채팅방 요약 액션 (Celery 배치 작업으로 등록)"""
+        chat_ids = [str(chat_id) for chat_id in queryset.values_list('chat_id', flat=True)]
+        job = summarize_chat_rooms.delay(chat_ids)
+        self.message_user(
+            request,
+            f"{len(chat_ids)}개의 채팅방 요약 작업이 등록되었습니다. (작업 ID: {job.id}, 변경 없는 채팅방은 건너뜁니다)"
+        )
     summarize_selected_chats.short_description = "선택된 채팅방 요약하기"
 
 @admin.register(LLMConversation)
@@ -43,7 +49,8 @@ class LLMConversationAdmin(admin.ModelAdmin):
     list_display = ('id', 'get_user_name', 'query_preview', 'get_chat_room', 'created_at')
     list_filter = ('created_at', 'using_rag')
     search_fields = ('query', 'response', 'user__name')
-    readonly_fields = ('id', 'created_at')
+    readonly_fields = ('id', 'created_at', 'user_info_snapshot', 'get_user_info')
+    list_select_related = ('user', 'chat_room')
     fieldsets = (
         ('기본 정보', {
             'fields': ('id', 'user', 'chat_room', 'created_at')
@@ -52,7 +59,7 @@ class LLMConversationAdmin(admin.ModelAdmin):
             'fields': ('query', 'response')
         }),
         ('메타데이터', {
-            'fields': ('user_info', 'source_documents', 'using_rag'),
+            'fields': ('user_info_snapshot', 'get_user_info', 'source_documents', 'using_rag', 'model_name', 'model_fallbacks'),
             'classes': ('collapse',)
         }),
     )
@@ -62,6 +69,17 @@ class LLMConversationAdmin(admin.ModelAdmin):
         return obj.user.name if obj.user else ''
     get_user_name.short_description = '사용자'
     
+    def get_search_results(self, request, queryset, search_term):
+        """질문/응답 검색은 API와 같은 n-gram 검색 색인 사용 (사용자 이름은 부분 일치)"""
+        if not search_term:
+            return queryset, False
+        return queryset.filter(search_filter(search_term) | Q(user__name__icontains=search_term)), False
+    
+    def get_user_info(self, obj):
+        """대화 시점의 사용자 정보 반환"""
+        return obj.get_user_info()
+    get_user_info.short_description = '사용자 정보'
+    
     def query_preview(self, obj):
         """질문 미리보기 반환"""
         return obj.query[:30] + '...' if len(obj.query) > 30 else obj.query
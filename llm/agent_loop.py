@@ -1,14 +1,175 @@
+import os
 import asyncio
+import logging
+import itertools
+import threading
+
+import httpx
+from agents import RunConfig
+from agents.models.openai_provider import OpenAIProvider
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class _LoopWorker:
+    """영구 asyncio 이벤트 루프를 실행하는 백그라운드 스레드 하나"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.http_client = None
+        self.openai_client = None
+        self.provider = None
+        self.thread = threading.Thread(
+            target=self._run,
+            name=f"agent-loop-{index}",
+            daemon=True
+        )
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self.ready.set)
+        self.loop.run_forever()
+
+        # 루프 종료 후 남은 태스크 정리
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+    async def _create_clients(self):
+        """
+        루프 안에서 httpx 연결 풀과 OpenAI 클라이언트 생성
+        (httpx 연결 풀은 생성된 이벤트 루프에서만 사용해야 함)
+        """
+        from openai import AsyncOpenAI
+
+        self.http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key:
+            self.openai_client = AsyncOpenAI(api_key=api_key, http_client=self.http_client)
+            self.provider = OpenAIProvider(openai_client=self.openai_client)
+
+    async def _close_clients(self):
+        if self.openai_client is not None:
+            await self.openai_client.close()
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    def start(self):
+        self.thread.start()
+        self.ready.wait()
+        asyncio.run_coroutine_threadsafe(self._create_clients(), self.loop).result()
+
+    def stop(self, timeout: float = 5.0):
+        if not self.loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_clients(), self.loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"에이전트 루프 {self.index} 클라이언트 종료 중 오류: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+
+
+class AgentLoopExecutor:
+    """
+    프로세스 전역 에이전트 이벤트 루프 실행기
+
+    LLM_AGENT_LOOPS 개(기본 1개)의 백그라운드 스레드가 각각 영구 이벤트 루프를 실행하고,
+    코루틴은 run_coroutine_threadsafe로 제출됩니다. 각 루프는 자신의 httpx 연결 풀과
+    OpenAI 클라이언트를 계속 재사용하므로 업스트림 TLS 연결이 요청 간에 유지됩니다.
+    """
+
+    def __init__(self, size: int = None):
+        self.size = size or int(os.getenv("LLM_AGENT_LOOPS", "1"))
+        self._lock = threading.Lock()
+        self._workers = []
+        self._counter = itertools.count()
+        self._pid = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers) and self._pid == os.getpid()
+
+    def start(self):
+        """루프 스레드 시작 (이미 시작된 경우 무시, fork 이후에는 새로 시작)"""
+        with self._lock:
+            if self.started:
+                return
+            # fork된 프로세스에는 스레드가 복제되지 않으므로 이전 상태를 버림
+            self._workers = []
+            self._pid = os.getpid()
+            for index in range(self.size):
+                worker = _LoopWorker(index)
+                worker.start()
+                self._workers.append(worker)
+
+            if self.size == 1 and self._workers[0].openai_client is not None:
+                # 루프가 하나면 에이전트 SDK 기본 클라이언트로도 등록
+                from agents import set_default_openai_client
+                set_default_openai_client(self._workers[0].openai_client, use_for_tracing=False)
+            logger.info(f"에이전트 이벤트 루프 {self.size}개 시작 (pid={self._pid})")
+
+    def shutdown(self, timeout: float = 5.0):
+        """루프와 공유 클라이언트 종료"""
+        with self._lock:
+            if not self.started:
+                return
+            for worker in self._workers:
+                worker.stop(timeout)
+            self._workers = []
+            logger.info(f"에이전트 이벤트 루프 종료 (pid={self._pid})")
+
+    def submit(self, coro):
+        """
+        코루틴을 에이전트 루프에 제출
+
+        Returns:
+            concurrent.futures.Future: 코루틴 결과
+        """
+        self.start()
+        worker = self._workers[next(self._counter) % len(self._workers)]
+        return asyncio.run_coroutine_threadsafe(coro, worker.loop)
+
+    def current_worker(self):
+        """현재 실행 중인 루프의 워커 (에이전트 루프 밖이면 None)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        for worker in self._workers:
+            if worker.loop is loop:
+                return worker
+        return None
+
+
+# 프로세스 전역 실행기
+agent_loop_executor = AgentLoopExecutor()
+
+
+def current_run_config():
+    """
+    현재 에이전트 루프의 OpenAI 클라이언트를 사용하는 RunConfig
+    (에이전트 루프 밖이거나 클라이언트가 없으면 None → SDK 기본 설정 사용)
+    """
+    worker = agent_loop_executor.current_worker()
+    if worker is None or worker.provider is None:
+        return None
+    return RunConfig(model_provider=worker.provider)
 
-global_loop = None
 
 def get_agent_loop():
     """
     글로벌(전역) 이벤트 루프를 한 번만 생성해 재사용
     """
-    global global_loop
-    print(global_loop)
-    if global_loop is None:
-        global_loop = asyncio.new_event_loop()
-        # 절대 loop.close() 하지 않음
-    return global_loop
\ No newline at end of file
+    agent_loop_executor.start()
+    return agent_loop_executor._workers[0].loop
@@ -1,5 +1,6 @@
 from django.apps import AppConfig
 import os
+import atexit
 import logging
 
 # 로깅 설정
@@ -27,4 +28,11 @@ class LlmConfig(AppConfig):
         except ImportError:
             logger.error('OpenAI 에이전트 패키지를 가져올 수 없습니다. "agents" 패키지가 설치되었는지 확인하세요.')
             
+        # 에이전트 이벤트 루프는 첫 요청 시 시작되고, 프로세스 종료 시 연결 풀과 함께 정리
+        # (gunicorn 워커는 gunicorn.conf.py의 post_worker_init/worker_exit 훅에서 시작/종료)
+        from .agent_loop import agent_loop_executor
+        atexit.register(agent_loop_executor.shutdown)
+
+        import llm.signals  # 시그널 모듈 로드
+            
         logger.info('LLM 서비스가 초기화되었습니다.')
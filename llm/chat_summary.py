@@ -0,0 +1,202 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from openai import OpenAI
+
+from accounts.utils.conditional_utils import bump_resource_version
+from .models import ChatManager, LLMConversation
+from .model_router import MODEL_TIERS
+
+# 환경 변수 로드
+load_dotenv()
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 배치 요약 설정
+# - CHAT_SUMMARY_BATCH_SIZE: 한 번에 불러와 처리할 채팅방 수
+# - CHAT_SUMMARY_CONCURRENCY: 동시에 실행할 LLM 호출 수
+# - CHAT_SUMMARY_RATE_PER_MINUTE: 분당 최대 LLM 호출 수
+# - CHAT_SUMMARY_MESSAGES: 요약에 사용할 채팅방별 최근 메시지 수
+CHAT_SUMMARY_BATCH_SIZE = int(os.getenv("CHAT_SUMMARY_BATCH_SIZE", "20"))
+CHAT_SUMMARY_CONCURRENCY = int(os.getenv("CHAT_SUMMARY_CONCURRENCY", "4"))
+CHAT_SUMMARY_RATE_PER_MINUTE = int(os.getenv("CHAT_SUMMARY_RATE_PER_MINUTE", "60"))
+CHAT_SUMMARY_MESSAGES = int(os.getenv("CHAT_SUMMARY_MESSAGES", "20"))
+TOPIC_MAX_LENGTH = 50
+
+# 요약 작업 ID → 요청한 채팅방 사용자 (작업 상태 조회 시 다른 Celery 작업이나 다른 사용자의 작업을 막기 위함)
+SUMMARY_JOB_KEY = 'chat_summary_job:{job_id}'
+SUMMARY_JOB_TTL = 60 * 60 * 24
+
+
+class RateLimiter:
+    """여러 스레드가 공유하는 분당 호출 수 제한 (호출 간 최소 간격 보장)"""
+
+    def __init__(self, rate_per_minute: int):
+        self.interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def register_summary_job(job_id, user_id):
+    """요약 작업 등록 (상태 조회는 등록한 사용자만 가능)"""
+    cache.set(SUMMARY_JOB_KEY.format(job_id=job_id), str(user_id), timeout=SUMMARY_JOB_TTL)
+
+
+def summary_job_owner(job_id):
+    """요약 작업을 등록한 사용자 ID (요약 작업이 아니거나 만료되었으면 None)"""
+    return cache.get(SUMMARY_JOB_KEY.format(job_id=job_id))
+
+
+def needs_summary(chat_room) -> bool:
+    """마지막 요약 이후 메시지 수가 바뀐 채팅방만 요약"""
+    return chat_room.message_count > 0 and (
+        not chat_room.topic or chat_room.message_count != chat_room.summarized_message_count
+    )
+
+
+def load_recent_messages(chat_rooms, limit: int = CHAT_SUMMARY_MESSAGES) -> dict:
+    """
+    채팅방 묶음의 최근 메시지를 한 번의 쿼리로 조회
+
+    Returns:
+        dict: {chat_id: 시간순 메시지 리스트}
+    """
+    messages = LLMConversation.objects.filter(
+        chat_room__in=chat_rooms
+    ).annotate(
+        row_number=Window(
+            expression=RowNumber(),
+            partition_by=[F('chat_room')],
+            order_by=F('created_at').desc()
+        )
+    ).filter(row_number__lte=limit).only('chat_room_id', 'query', 'response', 'created_at')
+
+    grouped = {room.chat_id: [] for room in chat_rooms}
+    for message in messages:
+        grouped[message.chat_room_id].append(message)
+    for room_messages in grouped.values():
+        room_messages.sort(key=lambda message: message.created_at)
+    return grouped
+
+
+class ChatTopicSummarizer:
+    """채팅방 주제 배치 요약 서비스"""
+
+    def __init__(self, batch_size: int = CHAT_SUMMARY_BATCH_SIZE, concurrency: int = CHAT_SUMMARY_CONCURRENCY,
+                 rate_per_minute: int = CHAT_SUMMARY_RATE_PER_MINUTE, model: str = None):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.rate_limiter = RateLimiter(rate_per_minute)
+        self.model = model or MODEL_TIERS['fast']['model']
+        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+    def summarize_topic(self, messages) -> str:
+        """대화 내용을 50자 이내 주제로 요약"""
+        conversation = "\n\n".join(
+            f"사용자: {message.query}\nAI: {message.response}" for message in messages
+        )
+        self.rate_limiter.acquire()
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": f"당신은 임신 관련 상담 채팅의 주제를 정리하는 전문가입니다. 대화의 핵심 주제를 {TOPIC_MAX_LENGTH}자 이내의 한 문장으로 작성하세요. 따옴표나 부가 설명 없이 주제만 답하세요."},
+                {"role": "user", "content": conversation}
+            ],
+            temperature=0.3,
+            max_tokens=100
+        )
+        return response.choices[0].message.content.strip().strip('"')[:TOPIC_MAX_LENGTH]
+
+    def _summarize_batch(self, chat_rooms, pool) -> list:
+        messages_by_room = load_recent_messages(chat_rooms)
+        futures = {
+            room.chat_id: pool.submit(self.summarize_topic, messages_by_room[room.chat_id])
+            for room in chat_rooms
+        }
+
+        results = []
+        updated_rooms = []
+        for room in chat_rooms:
+            try:
+                topic = futures[room.chat_id].result()
+            except Exception as e:
+                logger.error(f"채팅방 {room.chat_id} 주제 요약 실패: {str(e)}")
+                results.append({'chat_id': str(room.chat_id), 'status': 'failed', 'error': str(e)})
+                continue
+
+            is_updated = topic != room.topic
+            room.topic = topic
+            room.summarized_message_count = room.message_count
+            updated_rooms.append(room)
+            results.append({
+                'chat_id': str(room.chat_id),
+                'status': 'updated',
+                'topic': topic,
+                'message_count': room.message_count,
+                'is_updated': is_updated,
+            })
+
+        # 주제 요약은 채팅방 수정 시각(updated_at)을 바꾸지 않도록 bulk_update 사용
+        if updated_rooms:
+            ChatManager.objects.bulk_update(updated_rooms, ['topic', 'summarized_message_count'])
+            # bulk_update는 시그널을 보내지 않으므로 채팅방 목록 버전을 직접 갱신
+            for user_id in {room.user_id for room in updated_rooms}:
+                bump_resource_version(user_id, 'chat-rooms')
+        return results
+
+    def run(self, chat_ids=None) -> dict:
+        """
+        채팅방 주제 요약 실행
+
+        Args:
+            chat_ids: 요약할 채팅방 ID 목록 (None이면 모든 활성 채팅방)
+
+        Returns:
+            dict: 처리 결과 집계와 채팅방별 결과
+        """
+        queryset = ChatManager.objects.all() if chat_ids else ChatManager.objects.filter(is_active=True)
+        if chat_ids:
+            queryset = queryset.filter(chat_id__in=chat_ids)
+        queryset = queryset.filter(message_count__gt=0).exclude(
+            message_count=F('summarized_message_count'), topic__isnull=False
+        ).only('chat_id', 'user_id', 'topic', 'message_count', 'summarized_message_count').order_by('chat_id')
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='chat-summary') as pool:
+            batch = []
+            for chat_room in queryset.iterator(chunk_size=self.batch_size):
+                if not needs_summary(chat_room):
+                    continue
+                batch.append(chat_room)
+                if len(batch) >= self.batch_size:
+                    results.extend(self._summarize_batch(batch, pool))
+                    batch = []
+            if batch:
+                results.extend(self._summarize_batch(batch, pool))
+
+        updated = sum(1 for result in results if result['status'] == 'updated')
+        failed = len(results) - updated
+        requested = len(chat_ids) if chat_ids else None
+        return {
+            'requested': requested,
+            'updated': updated,
+            'failed': failed,
+            'skipped': (requested - len(results)) if requested is not None else None,
+            'rooms': results,
+        }
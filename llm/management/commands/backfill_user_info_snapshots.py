@@ -0,0 +1,72 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from llm.models import LLMConversation, UserInfoSnapshot
+
+
+class Command(BaseCommand):
+    help = '기존 대화의 user_info를 내용 해시 기반 스냅샷으로 옮기고 원본 컬럼을 비움 (청크 단위)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='한 번에 처리할 대화 수 (기본값: 1000)'
+        )
+        parser.add_argument(
+            '--keep-original',
+            action='store_true',
+            help='스냅샷 연결 후에도 기존 user_info 컬럼 값을 유지'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        keep_original = options['keep_original']
+        pending = LLMConversation.objects.filter(user_info_snapshot__isnull=True)
+        total = pending.count()
+        self.stdout.write(f"백필 대상 대화: {total}건 (청크 크기 {chunk_size})")
+
+        processed = 0
+        created_snapshots = 0
+        last_id = None
+        while True:
+            chunk_query = pending.order_by('id')
+            if last_id is not None:
+                chunk_query = chunk_query.filter(id__gt=last_id)
+            chunk = list(chunk_query.only('id', 'user_info')[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1].id
+
+            # 청크 안에서 고유한 스냅샷만 만들어 한 번에 저장
+            snapshots = {}
+            for conversation in chunk:
+                snapshot_id = UserInfoSnapshot.make_id(conversation.user_info)
+                if snapshot_id not in snapshots:
+                    snapshots[snapshot_id] = UserInfoSnapshot(
+                        snapshot_id=snapshot_id,
+                        data=json.loads(UserInfoSnapshot.normalize(conversation.user_info))
+                    )
+                conversation.user_info_snapshot_id = snapshot_id
+                if not keep_original:
+                    conversation.user_info = {}
+
+            update_fields = ['user_info_snapshot'] if keep_original else ['user_info_snapshot', 'user_info']
+            with transaction.atomic():
+                existing = set(
+                    UserInfoSnapshot.objects.filter(snapshot_id__in=snapshots).values_list('snapshot_id', flat=True)
+                )
+                new_snapshots = [snapshot for key, snapshot in snapshots.items() if key not in existing]
+                UserInfoSnapshot.objects.bulk_create(new_snapshots, ignore_conflicts=True)
+                LLMConversation.objects.bulk_update(chunk, update_fields)
+
+            processed += len(chunk)
+            created_snapshots += len(new_snapshots)
+            self.stdout.write(f"  {processed}/{total}건 처리 (새 스냅샷 {created_snapshots}개)")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"백필 완료: 대화 {processed}건, 새 스냅샷 {created_snapshots}개"
+        ))
@@ -0,0 +1,97 @@
+import json
+import time
+import threading
+
+from django.core.management.base import BaseCommand
+
+from llm.single_flight import FlightStream
+from llm.sse import SSEFrameCoalescer
+
+SAMPLE_ANSWER = (
+    "임신 24주차에는 태아의 폐가 발달하고 청각이 더욱 예민해집니다. "
+    "이 시기에는 임신성 당뇨 검사를 받는 것이 좋으며, 철분과 칼슘을 충분히 섭취하세요. "
+    "가벼운 산책이나 임산부 요가는 혈액 순환에 도움이 되지만, 무리한 운동은 피해야 합니다. "
+    "배 뭉침이 잦거나 출혈이 있다면 바로 병원에 방문하세요. "
+)
+
+
+class Command(BaseCommand):
+    help = 'SSE delta 프레임 병합 전후의 프레임 수, 전송 바이트, CPU 사용량 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=4, help='답변 길이 배수 (기본값: 4)')
+        parser.add_argument('--interval-ms', type=float, default=2.0, help='delta 생성 간격 ms (기본값: 2)')
+        parser.add_argument('--window-ms', type=int, default=30, help='병합 시간 기준 ms (기본값: 30)')
+        parser.add_argument('--max-bytes', type=int, default=512, help='병합 크기 기준 byte (기본값: 512)')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def _produce(self, flight, deltas, interval):
+        """모델 스트림처럼 한 글자씩 delta를 발행"""
+        flight.publish({"status": "start"})
+        for delta in deltas:
+            flight.publish({"delta": delta, "complete": False})
+            if interval:
+                time.sleep(interval)
+        flight.publish({"response": "".join(deltas), "complete": True})
+        flight.publish({"status": "done"})
+        flight.close()
+
+    def _consume(self, deltas, interval, frame_iter):
+        flight = FlightStream('benchmark')
+        producer = threading.Thread(target=self._produce, args=(flight, deltas, interval))
+        frames = 0
+        total_bytes = 0
+        cpu_started = time.thread_time()
+        wall_started = time.perf_counter()
+        producer.start()
+        for frame in frame_iter(flight):
+            frames += 1
+            total_bytes += len(frame)
+        cpu = time.thread_time() - cpu_started
+        wall = time.perf_counter() - wall_started
+        producer.join()
+        return {
+            'frames': frames,
+            'bytes': total_bytes,
+            'cpu_ms': round(cpu * 1000, 2),
+            'wall_ms': round(wall * 1000, 2),
+        }
+
+    def handle(self, *args, **options):
+        deltas = list(SAMPLE_ANSWER * options['repeat'])
+        interval = options['interval_ms'] / 1000
+
+        def baseline(flight):
+            # 기존 방식: delta마다 json.dumps로 프레임 하나씩 전송
+            for chunk in flight.subscribe():
+                yield f"data: {json.dumps(chunk)}\n\n".encode('utf-8')
+
+        def coalesced(flight):
+            coalescer = SSEFrameCoalescer(window_ms=options['window_ms'], max_bytes=options['max_bytes'])
+            yield from coalescer.frames(flight.subscribe(timeout=coalescer.idle_timeout, idle_ticks=True))
+
+        before = self._consume(deltas, interval, baseline)
+        after = self._consume(deltas, interval, coalesced)
+        result = {
+            'deltas': len(deltas),
+            'window_ms': options['window_ms'],
+            'max_bytes': options['max_bytes'],
+            'baseline': before,
+            'coalesced': after,
+            'frame_reduction': round(1 - after['frames'] / before['frames'], 3),
+            'byte_reduction': round(1 - after['bytes'] / before['bytes'], 3),
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(f"delta 수: {result['deltas']} (병합 기준 {options['window_ms']}ms / {options['max_bytes']}B)")
+        for label, stats in (('기존', before), ('병합', after)):
+            self.stdout.write(
+                f"{label}: 프레임 {stats['frames']}개, {stats['bytes']}B, "
+                f"CPU {stats['cpu_ms']}ms, 소요 {stats['wall_ms']}ms"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"프레임 {result['frame_reduction']:.1%} 감소, 바이트 {result['byte_reduction']:.1%} 감소"
+        ))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from llm.models import LLMConversation
+from llm.search import update_search_vector, uses_search_index
+
+
+class Command(BaseCommand):
+    help = '대화 질문/응답의 n-gram 검색 색인(search_vector)을 청크 단위로 다시 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='한 번에 처리할 대화 수 (기본값: 500)'
+        )
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='색인이 없는 대화만 처리'
+        )
+
+    def handle(self, *args, **options):
+        if not uses_search_index():
+            self.stdout.write(self.style.WARNING("검색 색인은 PostgreSQL에서만 사용됩니다."))
+            return
+
+        queryset = LLMConversation.objects.all()
+        if options['missing_only']:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        chunk_size = options['chunk_size']
+        processed = 0
+        last_id = None
+        while True:
+            chunk = queryset.order_by('id')
+            if last_id is not None:
+                chunk = chunk.filter(id__gt=last_id)
+            ids = list(chunk.values_list('id', flat=True)[:chunk_size])
+            if not ids:
+                break
+            last_id = ids[-1]
+            processed += update_search_vector(LLMConversation.objects.filter(id__in=ids))
+            self.stdout.write(f"  {processed}건 처리")
+
+        self.stdout.write(self.style.SUCCESS(f"검색 색인 재생성 완료: {processed}건"))
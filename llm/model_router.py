@@ -0,0 +1,412 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from django.utils import timezone
+from agents import Agent, Runner, ModelSettings
+
+from .agent_loop import current_run_config
+
+# 환경 변수 로드
+load_dotenv()
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+# 모델 티어 정의 (fallback: 지연 발생 시 전환할 더 빠른 티어)
+MODEL_TIERS = {
+    'fast': {
+        'model': os.getenv("LLM_FAST_MODEL") or "gpt-4.1-nano",
+        'fallback': None,
+    },
+    'standard': {
+        'model': os.getenv("LLM_MODEL") or "gpt-4o-mini",
+        'fallback': 'fast',
+    },
+}
+
+# 에이전트/카테고리별 라우팅 테이블
+# - tier: 사용할 모델 티어
+# - max_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
+# - timeout: 비스트리밍 호출 전체 제한 시간(초)
+# - first_token_timeout: 스트리밍 호출의 첫 토큰까지의 지연 예산(초). 초과 시 fallback 티어로 전환
+# - latency_budget: 비스트리밍 호출의 전체 응답 지연 예산(초). 응답 전체를 기다리므로 첫 토큰 기준이 아님
+#   (구조화 출력 500토큰 생성에 수 초가 걸리므로 timeout보다 짧되 정상 응답을 끊지 않는 값으로 설정)
+# - hedge: 응답 지연 시 중복 요청(헤징) 사용 여부 (짧은 구조화 출력 호출 전용)
+MODEL_ROUTES = {
+    'classifier': {'tier': 'fast', 'max_tokens': 100, 'timeout': 5.0, 'first_token_timeout': None, 'hedge': True},
+    'verification': {'tier': 'standard', 'max_tokens': 500, 'timeout': 15.0, 'latency_budget': 10.0, 'hedge': True},
+    'general': {'tier': 'fast', 'max_tokens': 1000, 'timeout': 30.0, 'first_token_timeout': None},
+    'medical': {'tier': 'standard', 'max_tokens': 2000, 'timeout': 60.0, 'first_token_timeout': 8.0},
+    'policy': {'tier': 'standard', 'max_tokens': 2000, 'timeout': 60.0, 'first_token_timeout': 8.0},
+    'nutrition': {'tier': 'standard', 'max_tokens': 1500, 'timeout': 60.0, 'first_token_timeout': 8.0},
+    'exercise': {'tier': 'standard', 'max_tokens': 1500, 'timeout': 60.0, 'first_token_timeout': 8.0},
+    'emotional': {'tier': 'standard', 'max_tokens': 1500, 'timeout': 60.0, 'first_token_timeout': 8.0},
+    'calendar': {'tier': 'standard', 'max_tokens': 800, 'timeout': 30.0, 'first_token_timeout': 6.0},
+}
+
+# 헤징 설정
+# - 최근 지연 시간의 HEDGE_PERCENTILE 백분위를 넘기면 중복 요청 발송
+# - 표본이 HEDGE_MIN_SAMPLES 미만이면 HEDGE_DEFAULT_DELAY 사용
+HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = 20
+HEDGE_DEFAULT_DELAY = 1.5
+HEDGE_MIN_DELAY = 0.3
+HEDGE_WINDOW = 200
+
+# 첫 토큰으로 보지 않는 응답 이벤트 (요청 수락 직후 바로 도착함)
+NON_TOKEN_EVENT_TYPES = ('response.created', 'response.in_progress')
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """라우팅 결과"""
+    role: str
+    tier: str
+    model: str
+    max_tokens: Optional[int] = None
+    timeout: float = 30.0
+    first_token_timeout: Optional[float] = None
+    latency_budget: Optional[float] = None
+    hedge: bool = False
+
+    def model_settings(self) -> ModelSettings:
+        return ModelSettings(max_tokens=self.max_tokens)
+
+
+FALLBACK_REASONS = {
+    'first_token_timeout': '첫 토큰',
+    'latency_budget': '응답',
+}
+
+
+def record_fallback(recorder, route: ModelRoute, fallback_route: ModelRoute, elapsed: float,
+                    reason: str = 'first_token_timeout'):
+    """
+    fallback 이벤트를 recorder(PregnancyContext 등)에 기록
+    recorder에 model_fallbacks 리스트가 없으면 로그만 남김
+
+    Args:
+        reason: 'first_token_timeout'(스트리밍 첫 토큰 지연) 또는 'latency_budget'(비스트리밍 전체 응답 지연)
+    """
+    fallback_event = {
+        "role": route.role,
+        "from_model": route.model,
+        "to_model": fallback_route.model,
+        "reason": reason,
+        "elapsed_ms": int(elapsed * 1000),
+        "time": timezone.now().isoformat(),
+    }
+    logger.warning(
+        f"모델 전환: {route.role} {route.model} -> {fallback_route.model} "
+        f"({FALLBACK_REASONS.get(reason, reason)} {fallback_event['elapsed_ms']}ms 초과)"
+    )
+    fallbacks = getattr(recorder, 'model_fallbacks', None)
+    if fallbacks is not None:
+        fallbacks.append(fallback_event)
+    return fallback_event
+
+
+class LatencyTracker:
+    """역할/모델별 최근 응답 지연과 헤징 통계 기록"""
+
+    def __init__(self, window: int = HEDGE_WINDOW):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=window))
+        self.stats = defaultdict(lambda: {'calls': 0, 'hedged': 0, 'hedge_wins': 0, 'hedge_budget_ms': 0})
+
+    def observe(self, key: str, seconds: float):
+        with self._lock:
+            self.samples[key].append(seconds)
+
+    def percentile(self, key: str, pct: float) -> Optional[float]:
+        """최근 지연 시간의 백분위 값 (표본 부족 시 None)"""
+        with self._lock:
+            samples = sorted(self.samples[key])
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def record_call(self, key: str, budget: float, hedged: bool, hedge_won: bool):
+        with self._lock:
+            stat = self.stats[key]
+            stat['calls'] += 1
+            stat['hedge_budget_ms'] += int(budget * 1000)
+            if hedged:
+                stat['hedged'] += 1
+            if hedge_won:
+                stat['hedge_wins'] += 1
+
+    def hedge_stats(self) -> Dict[str, Dict[str, Any]]:
+        """키별 헤징 통계 (평균 헤징 예산, 헤징 비율, 헤징 승률)"""
+        with self._lock:
+            stats = {key: dict(stat) for key, stat in self.stats.items()}
+        for stat in stats.values():
+            stat['avg_hedge_budget_ms'] = stat['hedge_budget_ms'] // stat['calls'] if stat['calls'] else 0
+            stat['hedge_rate'] = stat['hedged'] / stat['calls'] if stat['calls'] else 0.0
+            stat['hedge_win_rate'] = stat['hedge_wins'] / stat['hedged'] if stat['hedged'] else 0.0
+        return stats
+
+
+def is_first_token_event(event) -> bool:
+    """모델이 실제 출력을 시작했는지 여부"""
+    if getattr(event, 'type', None) != 'raw_response_event':
+        return False
+    return getattr(event.data, 'type', None) not in NON_TOKEN_EVENT_TYPES
+
+
+class ModelRouter:
+    """에이전트/카테고리별 모델 선택 및 지연 기반 fallback 처리"""
+
+    def __init__(self, routes: Dict[str, Dict[str, Any]] = None, tiers: Dict[str, Dict[str, Any]] = None):
+        self.routes = routes or MODEL_ROUTES
+        self.tiers = tiers or MODEL_TIERS
+        self.latency = LatencyTracker()
+
+    def route(self, role: str, tier: str = None) -> ModelRoute:
+        """역할(role)에 맞는 라우트 반환. 라우팅 테이블에 없으면 general 설정 사용"""
+        config = self.routes.get(role) or self.routes['general']
+        tier = tier or config['tier']
+        return ModelRoute(
+            role=role,
+            tier=tier,
+            model=self.tiers[tier]['model'],
+            max_tokens=config.get('max_tokens'),
+            timeout=config.get('timeout', 30.0),
+            first_token_timeout=config.get('first_token_timeout'),
+            latency_budget=config.get('latency_budget'),
+            hedge=config.get('hedge', False),
+        )
+
+    def fallback(self, route: ModelRoute) -> Optional[ModelRoute]:
+        """같은 역할에서 더 빠른 티어의 라우트 반환 (없으면 None)"""
+        fallback_tier = self.tiers[route.tier].get('fallback')
+        if not fallback_tier:
+            return None
+        return self.route(route.role, tier=fallback_tier)
+
+    def apply(self, agent: Agent, route: ModelRoute) -> Agent:
+        """에이전트에 라우트의 모델과 설정 적용"""
+        return agent.clone(model=route.model, model_settings=route.model_settings())
+
+    async def run(self, agent: Agent, role: str, input, context=None, hooks=None, recorder=None):
+        """
+        비스트리밍 실행 (분류, 검증 등 짧은 구조화 출력용)
+        latency_budget 안에 전체 응답이 없으면 fallback 티어로 다시 실행
+
+        응답을 스트리밍하지 않으므로 첫 토큰 도착 시점을 알 수 없고,
+        first_token_timeout 대신 전체 응답 기준의 latency_budget을 사용합니다.
+        fallback 실행은 라우트의 전체 제한 시간(timeout) 중 남은 시간 안에서만 실행하고,
+        남은 시간이 없으면 바로 asyncio.TimeoutError를 발생시킵니다.
+        """
+        recorder = recorder if recorder is not None else context
+        route = self.route(role)
+        fallback_route = self.fallback(route)
+
+        if not (route.latency_budget and fallback_route):
+            return await self._run_attempt(agent, route, input, context, hooks, route.timeout)
+
+        start_time = time.monotonic()
+        try:
+            return await self._run_attempt(
+                agent, route, input, context, hooks, min(route.latency_budget, route.timeout)
+            )
+        except asyncio.TimeoutError:
+            elapsed = time.monotonic() - start_time
+
+        remaining = route.timeout - elapsed
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        record_fallback(recorder, route, fallback_route, elapsed, reason='latency_budget')
+        return await self._run_attempt(agent, fallback_route, input, context, hooks, remaining)
+
+    async def _run_attempt(self, agent: Agent, route: ModelRoute, input, context, hooks, timeout: float):
+        if route.hedge:
+            return await self._run_hedged(agent, route, input, context, hooks, timeout)
+        return await asyncio.wait_for(
+            Runner.run(
+                self.apply(agent, route), input,
+                context=context, hooks=hooks, run_config=current_run_config()
+            ),
+            timeout=timeout
+        )
+
+    def hedge_delay(self, route: ModelRoute) -> float:
+        """중복 요청을 보내기 전까지 기다릴 시간(헤징 예산)"""
+        delay = self.latency.percentile(f"{route.role}:{route.model}", HEDGE_PERCENTILE)
+        if delay is None:
+            delay = HEDGE_DEFAULT_DELAY
+        return max(delay, HEDGE_MIN_DELAY)
+
+    async def _run_hedged(self, agent: Agent, route: ModelRoute, input, context, hooks, timeout: float):
+        """
+        헤징 실행: 헤징 예산 안에 응답이 없으면 같은 요청을 한 번 더 보내고 먼저 도착한 결과 사용
+        """
+        key = f"{route.role}:{route.model}"
+        budget = self.hedge_delay(route)
+        routed_agent = self.apply(agent, route)
+        run_config = current_run_config()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+
+        primary = asyncio.ensure_future(Runner.run(routed_agent, input, context=context, hooks=hooks, run_config=run_config))
+        started_at = {primary: start_time}
+        pending = {primary}
+        hedge = None
+        winner = None
+        last_error = None
+
+        try:
+            while pending:
+                now = time.monotonic()
+                wait_until = deadline if hedge else min(deadline, start_time + budget)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(wait_until - now, 0),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        break
+                    last_error = task.exception()
+                if winner:
+                    break
+
+                now = time.monotonic()
+                if now >= deadline:
+                    raise asyncio.TimeoutError()
+                if hedge is None and (now >= start_time + budget or not pending):
+                    # 헤징 예산 초과(또는 첫 요청 실패) 시 중복 요청 발송
+                    hedge = asyncio.ensure_future(Runner.run(routed_agent, input, context=context, hooks=hooks, run_config=run_config))
+                    started_at[hedge] = now
+                    pending.add(hedge)
+
+            if winner is None:
+                raise last_error or asyncio.TimeoutError()
+
+            self.latency.observe(key, time.monotonic() - started_at[winner])
+            self.latency.record_call(key, budget, hedged=hedge is not None, hedge_won=winner is hedge)
+            if hedge is not None:
+                logger.info(
+                    f"헤징 요청 발송: {key} (예산 {int(budget * 1000)}ms, "
+                    f"{'중복 요청' if winner is hedge else '원 요청'} 응답 사용)"
+                )
+            return winner.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def hedge_stats(self) -> Dict[str, Dict[str, Any]]:
+        """역할/모델별 헤징 통계"""
+        return self.latency.hedge_stats()
+
+    def run_streamed(self, agent: Agent, role: str, input, context=None, hooks=None, recorder=None):
+        """스트리밍 실행. 첫 토큰 지연 시 fallback 티어로 전환하는 래퍼 반환"""
+        return RoutedStreamRun(
+            self, agent, role, input,
+            context=context,
+            hooks=hooks,
+            recorder=recorder if recorder is not None else context
+        )
+
+
+class RoutedStreamRun:
+    """
+    Runner.run_streamed 결과를 감싸는 스트리밍 실행 객체
+
+    stream_events()는 기존 RunResultStreaming과 같은 이벤트를 전달하며,
+    첫 토큰이 first_token_timeout 안에 도착하지 않으면 기존 실행을 취소하고
+    fallback 티어로 다시 실행합니다.
+    """
+
+    def __init__(self, router: ModelRouter, agent: Agent, role: str, input, context=None, hooks=None, recorder=None):
+        self._result = None
+        self.router = router
+        self.agent = agent
+        self.role = role
+        self.input = input
+        self.context = context
+        self.hooks = hooks
+        self.recorder = recorder
+        self.route = router.route(role)
+        self.model_name = self.route.model
+        self.model_fallbacks: List[Dict[str, Any]] = (
+            recorder.model_fallbacks if recorder is not None and hasattr(recorder, 'model_fallbacks') else []
+        )
+
+    def __getattr__(self, name):
+        # final_output, new_items 등은 실제 실행 결과에 위임
+        result = self.__dict__.get('_result')
+        if result is None:
+            raise AttributeError(name)
+        return getattr(result, name)
+
+    def _start(self, route: ModelRoute):
+        self.route = route
+        self.model_name = route.model
+        if self.recorder is not None and hasattr(self.recorder, 'model_name'):
+            self.recorder.model_name = route.model
+        self._result = Runner.run_streamed(
+            self.router.apply(self.agent, route),
+            self.input,
+            context=self.context,
+            hooks=self.hooks,
+            run_config=current_run_config()
+        )
+        return self._result.stream_events().__aiter__()
+
+    async def _wait_first_token(self, events, timeout: float):
+        """첫 토큰까지 이벤트를 모아 반환. 시간 초과 시 asyncio.TimeoutError"""
+        buffered = []
+        deadline = time.monotonic() + timeout
+        while True:
+            next_event = asyncio.ensure_future(events.__anext__())
+            done, _ = await asyncio.wait({next_event}, timeout=max(deadline - time.monotonic(), 0))
+            if not done:
+                # 대기 중인 이벤트를 취소하면 기존 실행의 태스크도 함께 정리됨
+                next_event.cancel()
+                try:
+                    await next_event
+                except (asyncio.CancelledError, StopAsyncIteration, Exception):
+                    pass
+                raise asyncio.TimeoutError()
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                return buffered, True
+            buffered.append(event)
+            if is_first_token_event(event):
+                return buffered, False
+
+    async def stream_events(self):
+        route = self.route
+        fallback_route = self.router.fallback(route)
+        events = self._start(route)
+
+        if route.first_token_timeout and fallback_route:
+            start_time = time.monotonic()
+            try:
+                buffered, finished = await self._wait_first_token(events, route.first_token_timeout)
+            except asyncio.TimeoutError:
+                # model_fallbacks는 recorder의 리스트를 공유하므로 self에 기록
+                record_fallback(self, route, fallback_route, time.monotonic() - start_time)
+                events = self._start(fallback_route)
+                buffered, finished = [], False
+
+            for event in buffered:
+                yield event
+            if finished:
+                return
+
+        async for event in events:
+            yield event
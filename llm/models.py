@@ -1,8 +1,13 @@
 import uuid
 import os
+import json
+import hashlib
 import logging
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from accounts.models import User, Pregnancy
+from .search import search_vector_expression, uses_search_index
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -51,11 +56,19 @@ class ChatManager(models.Model):
         default=0,
         verbose_name='메시지 수'
     )
+    summarized_message_count = models.IntegerField(
+        default=0,
+        verbose_name='요약 시점 메시지 수'
+    )
     
     class Meta:
         verbose_name = '채팅방'
         verbose_name_plural = '채팅방 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 사용자별 활성 채팅방 목록 (최근 수정순)
+            models.Index(fields=['user', 'is_active', 'updated_at'], name='llm_chat_user_active_upd_idx'),
+        ]
     
     def __str__(self):
         """채팅방의 문자열 표현"""
@@ -64,6 +77,55 @@ class ChatManager(models.Model):
         else:
             return f"채팅 {self.chat_id} ({self.user.name})"
 
+class UserInfoSnapshot(models.Model):
+    """
+    대화 시점의 사용자 정보 스냅샷
+
+    정규화한 JSON의 해시를 키로 사용하므로 같은 내용은 한 번만 저장되고,
+    대화 기록은 스냅샷 ID만 참조합니다.
+    """
+    snapshot_id = models.CharField(
+        primary_key=True,
+        max_length=64,
+        editable=False,
+        verbose_name='스냅샷 해시'
+    )
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='사용자 정보'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성 시간'
+    )
+
+    class Meta:
+        verbose_name = '사용자 정보 스냅샷'
+        verbose_name_plural = '사용자 정보 스냅샷 목록'
+
+    def __str__(self):
+        return self.snapshot_id[:12]
+
+    @staticmethod
+    def normalize(data) -> str:
+        """키 정렬, 공백 제거한 JSON 문자열로 정규화"""
+        return json.dumps(data or {}, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+
+    @classmethod
+    def make_id(cls, data) -> str:
+        return hashlib.sha256(cls.normalize(data).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_user_info(cls, data):
+        """사용자 정보에 해당하는 스냅샷 조회 (없으면 생성)"""
+        snapshot_id = cls.make_id(data)
+        snapshot, _ = cls.objects.get_or_create(
+            snapshot_id=snapshot_id,
+            defaults={'data': json.loads(cls.normalize(data))}
+        )
+        return snapshot
+
 class LLMConversation(models.Model):
     """LLM과의 대화 기록 모델"""
     id = models.UUIDField(
@@ -91,7 +153,15 @@ class LLMConversation(models.Model):
     user_info = models.JSONField(
         default=dict, 
         blank=True, 
-        verbose_name='사용자 정보'
+        verbose_name='사용자 정보 (이전 방식)'
+    )
+    user_info_snapshot = models.ForeignKey(
+        UserInfoSnapshot,
+        on_delete=models.PROTECT,
+        related_name='conversations',
+        null=True,
+        blank=True,
+        verbose_name='사용자 정보 스냅샷'
     )
     source_documents = models.JSONField(
         default=list,
@@ -102,6 +172,23 @@ class LLMConversation(models.Model):
         default=False,
         verbose_name='RAG 사용 여부'
     )
+    model_name = models.CharField(
+        max_length=100,
+        blank=True,
+        null=True,
+        verbose_name='응답 모델'
+    )
+    model_fallbacks = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name='모델 전환 기록'
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='검색 색인'
+    )
     created_at = models.DateTimeField(
         auto_now_add=True, 
         verbose_name='생성 시간'
@@ -115,14 +202,32 @@ class LLMConversation(models.Model):
         verbose_name = 'LLM 대화'
         verbose_name_plural = 'LLM 대화 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 채팅방 메시지 조회 (상세 화면, 대화 맥락 로드)
+            models.Index(fields=['chat_room', 'created_at'], name='llm_conv_room_created_idx'),
+            # 사용자별 대화 조회 (대화 맥락 로드, 일별 요약)
+            models.Index(fields=['user', 'created_at'], name='llm_conv_user_created_idx'),
+            # 질문/응답 n-gram 전문 검색
+            GinIndex(fields=['search_vector'], name='llm_conv_search_gin_idx'),
+        ]
     
     def __str__(self):
         """대화의 문자열 표현"""
         user_name = self.user.name if self.user else ''
         return f"{user_name}: {self.query[:30]}..."
     
+    def get_user_info(self) -> dict:
+        """대화 시점의 사용자 정보 (스냅샷 우선, 백필 전 행은 기존 컬럼 사용)"""
+        if self.user_info_snapshot_id:
+            return self.user_info_snapshot.data
+        return self.user_info or {}
+    
     def save(self, *args, **kwargs):
         """저장 후 채팅방의 메시지 수 업데이트"""
+        # 질문/응답 n-gram 검색 색인 갱신 (Postgres 전용)
+        if uses_search_index():
+            self.search_vector = search_vector_expression(self.query, self.response)
+        
         # 일반 저장 로직
         super().save(*args, **kwargs)
         
@@ -13,6 +13,7 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from .models import LLMConversation, ChatManager
+from .model_router import ModelRouter
 import asyncio
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
@@ -118,6 +119,8 @@ class PregnancyContext:
         self.verification_results: List[DataValidationResult] = []
         self.user_id = user_id
         self.thread_id = thread_id
+        self.model_name: Optional[str] = None  # 실제 응답을 생성한 모델
+        self.model_fallbacks: List[Dict[str, Any]] = []  # 지연으로 인한 모델 전환 기록
         
         # 유저 ID가 제공된 경우 DB에서 관련 정보 로드 -> 여기서 DB를 바로 로드하지 않음!
         # if user_id:
@@ -230,7 +233,7 @@ class PregnancyContext:
         대화 내용을 DB에 저장 (비동기 -> sync_to_async)
         """
         from accounts.models import User, Pregnancy
-        from .models import ChatManager, LLMConversation
+        from .models import ChatManager, LLMConversation, UserInfoSnapshot
 
         if not self.user_id:
             return None
@@ -254,17 +257,34 @@ class PregnancyContext:
                     user=user, pregnancy=pregnancy, is_active=True
                 )
 
+        # 사용자 정보는 내용 해시 기반 스냅샷으로 저장 (동일 내용은 재사용)
+        user_info_snapshot = await sync_to_async(UserInfoSnapshot.from_user_info)(self.user_info)
+
         # 대화 저장
         conversation = await sync_to_async(LLMConversation.objects.create)(
             user=user,
             chat_room=chat_room,
             query=user_input,
             response=assistant_output,
-            user_info=self.user_info,
+            user_info_snapshot=user_info_snapshot,
             source_documents=source_documents or [],
-            using_rag=using_rag
+            using_rag=using_rag,
+            model_name=self.model_name,
+            model_fallbacks=self.model_fallbacks
         )
         return conversation
+
+    async def save_model_usage_async(self, conversation):
+        """
+        대화 저장 이후 발생한 모델 전환 기록(검증 단계 등)을 반영
+        """
+        from .models import LLMConversation
+
+        if not conversation:
+            return
+        await sync_to_async(
+            LLMConversation.objects.filter(id=conversation.id).update
+        )(model_name=self.model_name, model_fallbacks=self.model_fallbacks)
     
 
 # 가드레일 정의
@@ -554,8 +574,27 @@ class CalendarTool(FunctionTool):
         else:
             self.api_endpoint = os.getenv("CALENDAR_API_ENDPOINT_PROD", "https://nooridal.click/v1/calendars/events/")
         
+        # 등록 전 시간이 겹치는 일정 확인용
+        self.conflicts_endpoint = self.api_endpoint.rstrip('/') + '/conflicts/'
+        
         print(f"CalendarTool initialized. API Endpoint: {self.api_endpoint}")
 
+    async def _find_conflicts(self, client, payload: dict, headers: dict) -> list:
+        """등록 전 시간이 겹치는 기존 일정 제목 목록 (확인 실패 시 빈 목록, 등록은 계속 진행)"""
+        query = {key: payload[key] for key in ('start_date', 'end_date', 'start_time', 'end_time') if key in payload}
+        try:
+            response = await client.post(self.conflicts_endpoint, json=query, headers=headers, timeout=30)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"CalendarTool 일정 충돌 확인 실패: {e}")
+            return []
+        titles = []
+        for conflict in response.json().get('conflicts', []):
+            for event in conflict.get('events', []):
+                if event.get('title') not in titles:
+                    titles.append(event.get('title'))
+        return titles
+
     async def run(self, context: RunContextWrapper, tool_input: Union[CalendarEventInput, str, Dict]) -> str:
         print(f"CalendarTool 실행 시작. 받은 tool_input 타입: {type(tool_input)}")
         
@@ -622,6 +661,7 @@ class CalendarTool(FunctionTool):
 
         try:
             async with httpx.AsyncClient() as client:
+                conflicts = await self._find_conflicts(client, payload, headers)
                 response = await client.post(
                     self.api_endpoint,
                     json=payload,
@@ -633,6 +673,8 @@ class CalendarTool(FunctionTool):
 
             if response.status_code == 201:
                 result = f"{response.json().get('title')} 일정이 등록되었습니다."
+                if conflicts:
+                    result += f" 다만 같은 시간에 {', '.join(conflicts)} 일정이 있어 겹칩니다."
             else:
                 result = "일정 등록에 실패했습니다."
             
@@ -681,6 +723,7 @@ class OpenAIAgentService:
         self.model_name = model_name
         self.openai_api_key = openai_api_key
         self.vector_store_id = vector_store_id
+        self.router = ModelRouter()  # 에이전트/카테고리별 모델 라우팅
     
     # 질문 분류 에이전트 정의
     def get_query_classifier_agent(self) -> Agent:
@@ -856,12 +899,13 @@ class OpenAIAgentService:
             query_classifier = self.get_query_classifier_agent()
             print("질문 분류 에이전트 생성함")
 
-            # 최대 3번 재시도
+            # 최대 3번 재시도 (모델, 제한 시간은 라우팅 테이블의 classifier 설정 사용)
             for attempt in range(3):
                 try:
-                    classification_result = await asyncio.wait_for(
-                        Runner.run(query_classifier, query_text, hooks=hooks),
-                        timeout=5.0
+                    classification_result = await self.router.run(
+                        query_classifier, 'classifier', query_text,
+                        hooks=hooks,
+                        recorder=context
                     )
                     query_type = classification_result.final_output.category
                     needs_verification = classification_result.final_output.needs_verification
@@ -902,8 +946,10 @@ class OpenAIAgentService:
             # 에이전트 실행 - context 객체 그대로 전달
             if stream:
                 try:
-                    result = Runner.run_streamed(
+                    # 카테고리별 모델로 실행하고, 첫 토큰 지연 시 빠른 티어로 전환
+                    result = self.router.run_streamed(
                         agent_to_use,
+                        query_type,
                         query_text,
                         context=context,  # PregnancyContext 객체 직접 전달
                         hooks=hooks
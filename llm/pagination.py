@@ -0,0 +1,91 @@
+import json
+import base64
+import logging
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """잘못된 커서 값"""
+
+
+def encode_cursor(timestamp: datetime, pk) -> str:
+    """(시간, 기본키)를 URL에 안전한 커서 문자열로 인코딩"""
+    raw = json.dumps([timestamp.isoformat(), str(pk)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """
+    커서 문자열을 (시간, 기본키)로 디코딩
+
+    Raises:
+        InvalidCursor: 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        timestamp, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(timestamp), pk
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursor(f"잘못된 커서입니다: {cursor}") from e
+
+
+def parse_page_size(value, default: int = DEFAULT_PAGE_SIZE) -> int:
+    """limit 쿼리 파라미터 파싱 (1 ~ MAX_PAGE_SIZE)"""
+    try:
+        limit = int(value) if value not in (None, '') else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def keyset_page(queryset, field: str, pk_field: str, cursor: str = None, direction: str = 'before',
+                limit: int = DEFAULT_PAGE_SIZE):
+    """
+    (field, pk_field) 기준 키셋 페이지네이션
+
+    - direction='before': 커서보다 이전(오래된) 항목
+    - direction='after': 커서보다 이후(새로운) 항목
+    커서가 없으면 가장 최근 항목부터 반환합니다.
+    OFFSET 없이 인덱스 범위 조회만 하므로 페이지가 깊어져도 비용이 일정합니다.
+
+    Returns:
+        tuple: (최신순으로 정렬된 항목 리스트, 요청한 방향으로 항목이 더 있는지 여부)
+    """
+    if direction not in ('before', 'after'):
+        raise InvalidCursor(f"잘못된 방향입니다: {direction}")
+
+    if cursor:
+        timestamp, pk = decode_cursor(cursor)
+        try:
+            pk = queryset.model._meta.get_field(pk_field).to_python(pk)
+        except ValidationError as e:
+            raise InvalidCursor(f"잘못된 커서입니다: {cursor}") from e
+        if direction == 'before':
+            queryset = queryset.filter(
+                Q(**{f'{field}__lt': timestamp}) | Q(**{field: timestamp, f'{pk_field}__lt': pk})
+            )
+        else:
+            queryset = queryset.filter(
+                Q(**{f'{field}__gt': timestamp}) | Q(**{field: timestamp, f'{pk_field}__gt': pk})
+            )
+
+    if direction == 'after' and cursor:
+        # 커서 바로 다음 항목부터 가져온 뒤 최신순으로 뒤집음
+        rows = list(queryset.order_by(field, pk_field)[:limit + 1])
+        has_more = len(rows) > limit
+        items = rows[:limit][::-1]
+    else:
+        rows = list(queryset.order_by(f'-{field}', f'-{pk_field}')[:limit + 1])
+        has_more = len(rows) > limit
+        items = rows[:limit]
+
+    return items, has_more
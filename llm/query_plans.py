@@ -0,0 +1,167 @@
+import json
+import uuid
+import random
+import logging
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from accounts.models import User
+from .models import ChatManager, LLMConversation
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 실행 계획을 검사할 테이블
+WATCHED_TABLES = {LLMConversation._meta.db_table, ChatManager._meta.db_table}
+
+
+def explain(queryset) -> dict:
+    """쿼리셋의 Postgres 실행 계획(JSON) 반환"""
+    plan = queryset.explain(format='json')
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Plan']
+
+
+def find_seq_scans(plan: dict, tables=WATCHED_TABLES) -> list:
+    """실행 계획 트리에서 감시 대상 테이블의 Seq Scan 노드 목록 반환"""
+    found = []
+    if plan.get('Node Type') == 'Seq Scan' and plan.get('Relation Name') in tables:
+        found.append(plan['Relation Name'])
+    for child in plan.get('Plans', []):
+        found.extend(find_seq_scans(child, tables))
+    return found
+
+
+def hot_queries(user, chat_room) -> dict:
+    """
+    운영 중 자주 실행되는 채팅 관련 쿼리
+
+    Returns:
+        dict: {쿼리 이름: 쿼리셋}
+    """
+    now = timezone.now()
+    last_message = LLMConversation.objects.filter(chat_room=OuterRef('pk')).order_by('-created_at', '-id')
+    return {
+        # 채팅방 상세 - 메시지 페이지
+        'room_messages': chat_room.messages.order_by('-created_at', '-id')[:30],
+        # 대화 맥락 로드 - 채팅방 최근 대화
+        'room_context': LLMConversation.objects.filter(chat_room=chat_room).order_by('-created_at')[:5],
+        # 대화 맥락 로드 - 사용자 최근 대화
+        'user_context': LLMConversation.objects.filter(user=user).order_by('-created_at')[:5],
+        # 일별 대화 요약 - 사용자 하루 대화
+        'daily_summary': LLMConversation.objects.filter(
+            user=user,
+            created_at__gte=now - timedelta(days=1),
+            created_at__lte=now
+        ),
+        # 채팅방 목록 - 마지막 메시지 주석 포함
+        'room_list': ChatManager.objects.filter(user=user, is_active=True).annotate(
+            last_message_at=Subquery(last_message.values('created_at')[:1])
+        ).order_by('-updated_at', '-chat_id')[:30],
+    }
+
+
+def seed_chat_data(users: int = 200, rooms_per_user: int = 10, messages_per_room: int = 20, batch_size: int = 2000):
+    """
+    실행 계획 검사용 대량 채팅 데이터 생성 (bulk_create 사용, save() 훅 생략)
+
+    Returns:
+        tuple: (조회 대상 사용자, 조회 대상 채팅방)
+    """
+    user_objs = [
+        User(
+            email=f'plan-{index}-{uuid.uuid4().hex[:8]}@example.com',
+            username=f'plan-{index}-{uuid.uuid4().hex[:8]}',
+            name=f'사용자{index}',
+        )
+        for index in range(users)
+    ]
+    User.objects.bulk_create(user_objs, batch_size=batch_size)
+
+    rooms = [
+        ChatManager(user=user, is_active=random.random() > 0.2, message_count=messages_per_room)
+        for user in user_objs
+        for _ in range(rooms_per_user)
+    ]
+    ChatManager.objects.bulk_create(rooms, batch_size=batch_size)
+
+    messages = []
+    for room in rooms:
+        for index in range(messages_per_room):
+            messages.append(LLMConversation(
+                user=room.user,
+                chat_room=room,
+                query=f'질문 {index}',
+                response='답변',
+            ))
+            if len(messages) >= batch_size:
+                LLMConversation.objects.bulk_create(messages)
+                messages = []
+    if messages:
+        LLMConversation.objects.bulk_create(messages)
+
+    with connection.cursor() as cursor:
+        # created_at은 auto_now_add라 bulk_create에서 지정할 수 없으므로 최근 90일로 분산
+        cursor.execute(
+            f"UPDATE {LLMConversation._meta.db_table} "
+            f"SET created_at = NOW() - random() * INTERVAL '90 days'"
+        )
+        # 통계 갱신 (플래너가 실제 데이터 분포를 보도록)
+        for table in WATCHED_TABLES:
+            cursor.execute(f'ANALYZE {table}')
+
+    return user_objs[0], rooms[0]
+
+
+def find_sqlite_full_scans(queryset) -> list:
+    """
+    SQLite 실행 계획(EXPLAIN QUERY PLAN)에서 인덱스 없이 테이블 전체를 읽는 노드 목록
+
+    SQLite의 'SCAN 테이블'은 Postgres의 Seq Scan에 해당합니다 ('SEARCH ... USING INDEX'는 인덱스 범위 조회).
+    """
+    found = []
+    for line in queryset.explain().splitlines():
+        detail = line.split(' ', 3)[-1]
+        if detail.startswith('SCAN ') and 'USING' not in detail and 'CONSTANT ROW' not in detail:
+            found.append(detail)
+    return found
+
+
+def missing_indexes(model) -> dict:
+    """
+    모델의 Meta.indexes 중 데이터베이스에 없거나 컬럼이 다른 인덱스
+
+    Returns:
+        dict: {인덱스 이름: 실제 컬럼 목록 또는 None(없음)}
+    """
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    problems = {}
+    for index in model._meta.indexes:
+        expected = [model._meta.get_field(field.lstrip('-')).column for field in index.fields]
+        actual = constraints.get(index.name)
+        if actual is None or not actual.get('index') or actual['columns'] != expected:
+            problems[index.name] = actual['columns'] if actual else None
+    return problems
+
+
+def check_hot_query_plans(user, chat_room) -> dict:
+    """
+    모든 핫 쿼리의 실행 계획 검사 (Postgres: Seq Scan, SQLite: 인덱스 없는 SCAN)
+
+    Returns:
+        dict: {쿼리 이름: Seq Scan이 발생한 테이블 목록} (문제가 없는 쿼리는 제외)
+    """
+    failures = {}
+    for name, queryset in hot_queries(user, chat_room).items():
+        if connection.vendor == 'sqlite':
+            scans = find_sqlite_full_scans(queryset)
+        else:
+            scans = find_seq_scans(explain(queryset))
+        if scans:
+            failures[name] = scans
+    return failures
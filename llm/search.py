@@ -0,0 +1,128 @@
+import re
+import html
+import logging
+import unicodedata
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q, Value
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 한국어는 형태소 분석기 없이 검색하기 위해 음절 2-gram으로 색인
+NGRAM_SIZE = 2
+SEARCH_CONFIG = 'simple'
+HIGHLIGHT_FRAGMENT = 40
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def split_words(text: str) -> list:
+    """유니코드 정규화 후 단어 단위로 분리 (대소문자 무시)"""
+    normalized = unicodedata.normalize('NFC', text or '').casefold()
+    return _WORD_RE.findall(normalized)
+
+
+def word_ngrams(word: str, size: int = NGRAM_SIZE) -> list:
+    """단어를 n-gram 목록으로 변환 (n보다 짧은 단어는 그대로 사용)"""
+    if len(word) <= size:
+        return [word]
+    return [word[index:index + size] for index in range(len(word) - size + 1)]
+
+
+def ngram_document(text: str) -> str:
+    """tsvector로 색인할 n-gram 문자열"""
+    return ' '.join(gram for word in split_words(text) for gram in word_ngrams(word))
+
+
+def search_vector_expression(query: str, response: str):
+    """질문(가중치 A)과 응답(가중치 B)의 n-gram tsvector 표현식"""
+    return (
+        SearchVector(Value(ngram_document(query)), weight='A', config=SEARCH_CONFIG)
+        + SearchVector(Value(ngram_document(response)), weight='B', config=SEARCH_CONFIG)
+    )
+
+
+def build_search_query(term: str):
+    """
+    검색어를 n-gram tsquery로 변환
+
+    모든 n-gram을 AND로 묶고, 한 글자 단어는 접두사 검색(:*)으로 처리합니다.
+    검색어에 단어가 없으면 None을 반환합니다.
+    """
+    parts = []
+    for word in split_words(term):
+        if len(word) < NGRAM_SIZE:
+            parts.append(f"{word}:*")
+        else:
+            parts.extend(word_ngrams(word))
+    if not parts:
+        return None
+    return SearchQuery(' & '.join(dict.fromkeys(parts)), search_type='raw', config=SEARCH_CONFIG)
+
+
+def uses_search_index() -> bool:
+    """n-gram 전문 검색 색인 사용 가능 여부 (Postgres 전용)"""
+    return connection.vendor == 'postgresql'
+
+
+def update_search_vector(queryset):
+    """쿼리셋 대화들의 검색 색인 갱신"""
+    if not uses_search_index():
+        return 0
+    updated = 0
+    for conversation in queryset.only('id', 'query', 'response'):
+        updated += type(conversation).objects.filter(pk=conversation.pk).update(
+            search_vector=search_vector_expression(conversation.query, conversation.response)
+        )
+    return updated
+
+
+def search_filter(term: str) -> Q:
+    """검색어 조건 (Postgres는 n-gram 색인, 그 외 DB는 부분 문자열 검색)"""
+    if uses_search_index():
+        search_query = build_search_query(term)
+        if search_query is None:
+            return Q(pk__in=[])
+        return Q(search_vector=search_query)
+    return Q(query__icontains=term) | Q(response__icontains=term)
+
+
+def search_conversations(queryset, term: str):
+    """검색어와 일치하는 대화를 관련도순으로 정렬해 반환"""
+    queryset = queryset.filter(search_filter(term))
+    if uses_search_index():
+        return queryset.annotate(
+            rank=SearchRank(F('search_vector'), build_search_query(term))
+        ).order_by('-rank', '-created_at')
+    return queryset.annotate(rank=Value(0.0)).order_by('-created_at')
+
+
+def highlight(text: str, term: str, fragment: int = HIGHLIGHT_FRAGMENT) -> str:
+    """
+    검색어가 처음 나타나는 부분을 중심으로 발췌하고 <mark>로 강조 (HTML 이스케이프 포함)
+    """
+    text = text or ''
+    words = sorted(set(split_words(term)), key=len, reverse=True)
+    if not words:
+        return html.escape(text[:fragment * 2])
+
+    pattern = re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+    first = pattern.search(text)
+    center = first.start() if first else 0
+    start = max(0, center - fragment)
+    end = min(len(text), center + fragment)
+    snippet = text[start:end]
+
+    result = []
+    position = 0
+    for match in pattern.finditer(snippet):
+        result.append(html.escape(snippet[position:match.start()]))
+        result.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    result.append(html.escape(snippet[position:]))
+
+    prefix = '…' if start > 0 else ''
+    suffix = '…' if end < len(text) else ''
+    return prefix + ''.join(result) + suffix
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import LLMConversation, ChatManager
+from .search import highlight
 
 class QuerySerializer(serializers.Serializer):
     user_id = serializers.CharField(required=True)
@@ -20,6 +21,7 @@ class ResponseSerializer(serializers.Serializer):
 
 class LLMConversationSerializer(serializers.ModelSerializer):
     name = serializers.SerializerMethodField()
+    user_info = serializers.SerializerMethodField()
     
     class Meta:
         model = LLMConversation
@@ -27,12 +29,16 @@ class LLMConversationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
     
     def get_name(self, obj):
+        user_info = obj.get_user_info()
         if obj.user:
             return obj.user.name
-        elif obj.user_info and 'name' in obj.user_info:
-            return obj.user_info.get('name', '')
+        elif user_info and 'name' in user_info:
+            return user_info.get('name', '')
         else:
             return ''
+    
+    def get_user_info(self, obj):
+        return obj.get_user_info()
 
 class LLMConversationEditSerializer(serializers.Serializer):
     query = serializers.CharField(required=True)
@@ -64,6 +70,36 @@ class ChatRoomMessageSerializer(serializers.ModelSerializer):
         fields = ['id', 'query', 'response', 'source_documents', 'using_rag', 'created_at']
         read_only_fields = ['id', 'created_at']
 
+class ChatMessageCompactSerializer(serializers.Serializer):
+    """채팅방 메시지 목록용 경량 시리얼라이저 (모델 필드 조회 없이 필요한 값만 직렬화)"""
+    id = serializers.UUIDField(read_only=True)
+    query = serializers.CharField(read_only=True)
+    response = serializers.CharField(read_only=True)
+    using_rag = serializers.BooleanField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        fields = ['id', 'query', 'response', 'using_rag', 'created_at']
+
+class ConversationSearchResultSerializer(serializers.Serializer):
+    """대화 검색 결과 시리얼라이저 (검색어 강조 발췌 포함)"""
+    id = serializers.UUIDField(read_only=True)
+    chat_room = serializers.UUIDField(source='chat_room_id', read_only=True, allow_null=True)
+    query = serializers.CharField(read_only=True)
+    query_highlight = serializers.SerializerMethodField()
+    response_highlight = serializers.SerializerMethodField()
+    rank = serializers.FloatField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        fields = ['id', 'chat_room', 'query', 'query_highlight', 'response_highlight', 'rank', 'created_at']
+
+    def get_query_highlight(self, obj):
+        return highlight(obj.query, self.context.get('term', ''))
+
+    def get_response_highlight(self, obj):
+        return highlight(obj.response, self.context.get('term', ''))
+
 class ChatRoomSerializer(serializers.ModelSerializer):
     """채팅방 시리얼라이저"""
     messages = serializers.SerializerMethodField()
@@ -104,6 +140,31 @@ class ChatRoomListSerializer(serializers.ModelSerializer):
             return obj.user.name
         return ""
         
+class ChatRoomListItemSerializer(serializers.Serializer):
+    """
+    채팅방 목록용 경량 시리얼라이저
+
+    values() 딕셔너리(마지막 메시지 주석 포함)를 직렬화하며,
+    사용자 이름은 context['user_name']으로 한 번만 전달받습니다.
+    """
+    chat_id = serializers.UUIDField(read_only=True)
+    user = serializers.UUIDField(source='user_id', read_only=True)
+    user_name = serializers.SerializerMethodField()
+    topic = serializers.CharField(read_only=True, allow_null=True)
+    message_count = serializers.IntegerField(read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    last_message_preview = serializers.CharField(read_only=True, allow_null=True)
+    last_message_at = serializers.DateTimeField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        fields = ['chat_id', 'user', 'user_name', 'topic', 'message_count', 'is_active',
+                  'last_message_preview', 'last_message_at', 'created_at', 'updated_at']
+
+    def get_user_name(self, obj):
+        return self.context.get('user_name', '')
+
 class ChatRoomSummarizeSerializer(serializers.Serializer):
     """채팅방 요약 시리얼라이저"""
     topic = serializers.CharField(read_only=True)
@@ -0,0 +1,11 @@
+from accounts.utils.conditional_utils import register_resource
+from .models import ChatManager, LLMConversation
+
+# 조건부 요청(ETag) 리소스 버전: 채팅방 목록은 채팅방과 마지막 메시지에 의존
+register_resource('chat-rooms', ChatManager)
+register_resource(
+    'chat-rooms', LLMConversation,
+    get_user_id=lambda conversation: conversation.user_id or ChatManager.objects.filter(
+        pk=conversation.chat_room_id
+    ).values_list('user_id', flat=True).first()
+)
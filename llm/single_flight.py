@@ -0,0 +1,120 @@
+import hashlib
+import logging
+import threading
+import unicodedata
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query_text: str) -> str:
+    """
+    같은 질문을 같은 키로 묶기 위한 질문 정규화
+    (유니코드 NFC, 공백 정리, 대소문자 무시)
+    """
+    normalized = unicodedata.normalize('NFC', query_text or '')
+    return ' '.join(normalized.split()).casefold()
+
+
+def make_flight_key(agent: str, query_text: str, personalization_key) -> str:
+    """(에이전트, 정규화된 질문, 개인화 키)로 single-flight 키 생성"""
+    raw = '\x1f'.join([agent, normalize_query(query_text), str(personalization_key)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class FlightStream:
+    """
+    하나의 에이전트 실행에서 나온 이벤트를 여러 SSE 소비자에게 전달하는 스트림
+
+    이벤트는 실행이 끝날 때까지 보관되므로, 늦게 합류한 소비자도
+    처음 이벤트부터 모두 받습니다.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.events = []
+        self.done = False
+        self.subscribers = 0
+        self._condition = threading.Condition()
+
+    def publish(self, chunk: dict):
+        """이벤트 추가 후 대기 중인 소비자 깨우기"""
+        with self._condition:
+            if self.done:
+                return
+            self.events.append(chunk)
+            self._condition.notify_all()
+
+    def close(self):
+        with self._condition:
+            self.done = True
+            self._condition.notify_all()
+
+    def subscribe(self, timeout: float = 0.1, idle_ticks: bool = False):
+        """
+        처음부터 끝까지 이벤트를 순서대로 반환하는 제너레이터
+
+        idle_ticks=True이면 timeout 동안 새 이벤트가 없을 때 None을 반환합니다.
+        (프레임 병합기가 시간 기준으로 버퍼를 비울 수 있도록)
+        """
+        with self._condition:
+            self.subscribers += 1
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self.events) and not self.done:
+                    if not self._condition.wait(timeout) and idle_ticks:
+                        break
+                if index >= len(self.events):
+                    if self.done:
+                        return
+                    pending = [None]
+                else:
+                    pending = self.events[index:]
+                    index += len(pending)
+            for chunk in pending:
+                yield chunk
+
+
+class SingleFlight:
+    """
+    동일한 질문에 대한 중복 실행 방지 (프로세스 단위)
+
+    진행 중인 실행이 있으면 같은 FlightStream에 합류시키고,
+    실행이 끝나거나 실패하면 키를 제거해 다음 요청은 새로 실행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def join(self, key: str):
+        """
+        키에 해당하는 실행에 합류
+
+        Returns:
+            tuple: (FlightStream, 리더 여부) - 리더인 경우 직접 실행해야 함
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and not flight.done:
+                logger.info(f"진행 중인 동일 질문 실행에 합류: {key[:12]}")
+                return flight, False
+            flight = FlightStream(key)
+            self._flights[key] = flight
+            return flight, True
+
+    def finish(self, flight: FlightStream):
+        """실행 종료(성공/실패 모두) 시 스트림을 닫고 키 제거"""
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+        flight.close()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+# 프로세스 전역 인스턴스
+agent_single_flight = SingleFlight()
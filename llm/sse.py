@@ -0,0 +1,105 @@
+import os
+import json
+import time
+import logging
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 프레임 병합 정책
+# - SSE_COALESCE_WINDOW_MS: 첫 delta 이후 이 시간(ms)이 지나면 전송 (0이면 시간 기준 비활성화)
+# - SSE_COALESCE_MAX_BYTES: 모인 delta가 이 크기(byte) 이상이면 즉시 전송 (0이면 크기 기준 비활성화)
+# 두 값이 모두 0이면 병합하지 않고 delta마다 프레임을 전송합니다.
+SSE_COALESCE_WINDOW_MS = int(os.getenv("SSE_COALESCE_WINDOW_MS", "30"))
+SSE_COALESCE_MAX_BYTES = int(os.getenv("SSE_COALESCE_MAX_BYTES", "512"))
+
+
+def encode_sse_frame(chunk: dict) -> bytes:
+    """SSE data 프레임 인코딩 (orjson 사용, UTF-8 그대로 전송)"""
+    if orjson is not None:
+        try:
+            return b"data: " + orjson.dumps(chunk) + b"\n\n"
+        except TypeError:
+            pass
+    payload = json.dumps(chunk, ensure_ascii=False, separators=(',', ':'), default=str)
+    return b"data: " + payload.encode('utf-8') + b"\n\n"
+
+
+def is_delta_chunk(chunk) -> bool:
+    """병합 가능한 텍스트 delta 이벤트인지 여부"""
+    return (
+        isinstance(chunk, dict)
+        and chunk.keys() == {"delta", "complete"}
+        and chunk["complete"] is False
+    )
+
+
+class SSEFrameCoalescer:
+    """
+    연속된 텍스트 delta를 하나의 SSE 프레임으로 병합
+
+    delta가 아닌 이벤트(도구, 검증, 완료 등)는 그 앞까지 모인 delta를 먼저 보낸 뒤
+    순서대로 그대로 전송합니다.
+    """
+
+    def __init__(self, window_ms: int = None, max_bytes: int = None, encoder=encode_sse_frame):
+        self.window = (SSE_COALESCE_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_bytes = SSE_COALESCE_MAX_BYTES if max_bytes is None else max_bytes
+        self.encoder = encoder
+        self.enabled = bool(self.window or self.max_bytes)
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_started = None
+
+    @property
+    def idle_timeout(self) -> float:
+        """이벤트 소스가 유휴 상태를 알려줘야 하는 간격(초)"""
+        return self.window if self.window else 0.1
+
+    def _flush(self):
+        if not self._buffer:
+            return None
+        frame = self.encoder({"delta": "".join(self._buffer), "complete": False})
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_started = None
+        return frame
+
+    def frames(self, chunks):
+        """
+        이벤트 이터레이터를 SSE 프레임(bytes) 이터레이터로 변환
+
+        chunks가 None을 내보내면 유휴 신호로 보고, 시간 기준을 넘긴 delta를 전송합니다.
+        """
+        for chunk in chunks:
+            now = time.monotonic()
+            if chunk is None:
+                if self._buffer and self.window and now - self._buffer_started >= self.window:
+                    yield self._flush()
+                continue
+
+            if not self.enabled or not is_delta_chunk(chunk):
+                frame = self._flush()
+                if frame:
+                    yield frame
+                yield self.encoder(chunk)
+                continue
+
+            delta = chunk["delta"]
+            if self._buffer_started is None:
+                self._buffer_started = now
+            self._buffer.append(delta)
+            self._buffer_bytes += len(delta.encode('utf-8'))
+
+            if (self.max_bytes and self._buffer_bytes >= self.max_bytes) or \
+                    (self.window and now - self._buffer_started >= self.window):
+                yield self._flush()
+
+        frame = self._flush()
+        if frame:
+            yield frame
@@ -0,0 +1,21 @@
+import logging
+from celery import shared_task
+
+from .chat_summary import ChatTopicSummarizer
+
+logger = logging.getLogger(__name__)
+
+@shared_task(bind=True)
+def summarize_chat_rooms(self, chat_ids=None):
+    """
+    채팅방 주제 배치 요약 태스크
+
+    chat_ids가 없으면 모든 활성 채팅방 중 마지막 요약 이후 메시지가 바뀐 채팅방을 요약합니다.
+    """
+    logger.info(f"채팅방 주제 요약 시작 (작업 ID: {self.request.id}, 대상: {len(chat_ids) if chat_ids else '전체'})")
+    result = ChatTopicSummarizer().run(chat_ids)
+    logger.info(
+        f"채팅방 주제 요약 완료 (작업 ID: {self.request.id}): "
+        f"갱신 {result['updated']}건, 실패 {result['failed']}건"
+    )
+    return result
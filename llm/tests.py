@@ -1,3 +1,599 @@
-from django.test import TestCase
+import asyncio
+import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import uuid
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.db import connection
+from django.utils import timezone
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .agent_loop import AgentLoopExecutor
+from .chat_summary import ChatTopicSummarizer
+from .model_router import HEDGE_MIN_SAMPLES, ModelRouter
+from .single_flight import SingleFlight, make_flight_key
+from .models import ChatManager, LLMConversation
+from .pagination import encode_cursor
+from .query_plans import check_hot_query_plans, missing_indexes, seed_chat_data
+from .search import build_search_query, highlight, ngram_document
+
+
+class ChatRoomListQueryCountTest(TestCase):
+    """채팅방 목록 조회 쿼리 수가 채팅방 수와 무관하게 일정한지 확인"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='list@example.com', username='list', name='테스트', password='password'
+        )
+
+    def _create_rooms(self, count):
+        for index in range(count):
+            room = ChatManager.objects.create(user=self.user)
+            for message_index in range(3):
+                LLMConversation.objects.create(
+                    user=self.user, chat_room=room,
+                    query=f'질문 {index}-{message_index}', response='답변'
+                )
+
+    def _get_rooms(self, **params):
+        return self.client.get('/v1/llm/chat/rooms/', {'user_id': str(self.user.user_id), **params})
+
+    def test_query_count_is_constant(self):
+        # 사용자 조회 1회 + 채팅방 목록(마지막 메시지 서브쿼리 포함) 1회
+        self._create_rooms(1)
+        with self.assertNumQueries(2):
+            response = self._get_rooms(limit=30)
+        self.assertEqual(len(response.data['results']), 1)
+
+        self._create_rooms(20)
+        with self.assertNumQueries(2):
+            response = self._get_rooms(limit=30)
+        self.assertEqual(len(response.data['results']), 21)
+        with self.assertNumQueries(2):
+            response = self._get_rooms()
+        self.assertEqual(len(response.data), 21)
+
+    def test_default_response_is_plain_list(self):
+        # 페이지 파라미터가 없으면 기존 클라이언트와 같은 배열 형식으로 전체 목록 반환 (최근 수정순)
+        self._create_rooms(3)
+        response = self._get_rooms()
+        self.assertIsInstance(response.data, list)
+        self.assertEqual([room['last_message_preview'] for room in response.data], ['질문 2-2', '질문 1-2', '질문 0-2'])
+        self.assertEqual(
+            set(response.data[0]),
+            {'chat_id', 'user', 'user_name', 'topic', 'message_count', 'is_active', 'created_at', 'updated_at',
+             'last_message_preview', 'last_message_at'}
+        )
+
+    def test_last_message_and_cursor_pagination(self):
+        self._create_rooms(5)
+        response = self._get_rooms(limit=2)
+        first_page = response.data['results']
+        self.assertEqual(len(first_page), 2)
+        self.assertTrue(response.data['pagination']['has_more'])
+        self.assertEqual(first_page[0]['last_message_preview'], '질문 4-2')
+
+        chat_ids = [room['chat_id'] for room in first_page]
+        cursor = response.data['pagination']['next_cursor']
+        while cursor:
+            response = self._get_rooms(limit=2, cursor=cursor)
+            chat_ids += [room['chat_id'] for room in response.data['results']]
+            cursor = response.data['pagination']['next_cursor']
+        self.assertEqual(len(set(chat_ids)), 5)
+
+
+class ChatTopicSummaryQueryCountTest(TestCase):
+    """채팅방 주제 요약 쿼리 수가 채팅방 수와 무관하게 일정한지 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='summary@example.com', username='summary', name='테스트', password='password'
+        )
+
+    def _create_rooms(self, count):
+        for index in range(count):
+            room = ChatManager.objects.create(user=self.user)
+            LLMConversation.objects.create(user=self.user, chat_room=room, query=f'질문 {index}', response='답변')
+
+    def _summarize(self):
+        with mock.patch('llm.chat_summary.OpenAI'), \
+                mock.patch.object(ChatTopicSummarizer, 'summarize_topic', return_value='임신 초기 영양'):
+            return ChatTopicSummarizer(batch_size=50, rate_per_minute=0).run()
+
+    def test_query_count_is_constant(self):
+        # 채팅방 조회 + 최근 메시지 조회 + bulk_update (채팅방별 지연 로딩 쿼리 없음)
+        self._create_rooms(1)
+        with self.assertNumQueries(3):
+            result = self._summarize()
+        self.assertEqual(result['updated'], 1)
+
+        self._create_rooms(10)
+        ChatManager.objects.update(topic=None)
+        with self.assertNumQueries(3):
+            result = self._summarize()
+        self.assertEqual(result['updated'], 11)
+        self.assertEqual(set(ChatManager.objects.values_list('topic', flat=True)), {'임신 초기 영양'})
+
+
+class ChatSummaryJobAccessTest(TestCase):
+    """요약 작업 상태는 채팅방 요약 API로 등록한 작업을 등록한 사용자에게만 보여줌"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='job@example.com', username='job', name='테스트', password='pw')
+        self.other = User.objects.create_user(email='other@example.com', username='other', name='테스트', password='pw')
+        self.room = ChatManager.objects.create(user=self.user)
+        LLMConversation.objects.create(user=self.user, chat_room=self.room, query='질문', response='답변')
+
+    def _start_job(self):
+        job_id = str(uuid.uuid4())
+        with mock.patch('llm.views.summarize_chat_rooms.delay', return_value=SimpleNamespace(id=job_id)):
+            response = self.client.post(f'/v1/llm/chat/rooms/{self.room.chat_id}/summarize/')
+        self.assertEqual(response.status_code, 202)
+        return job_id
+
+    def _get_job(self, job_id, **params):
+        result = mock.Mock(state='SUCCESS', result={'updated': 1})
+        result.successful.return_value = True
+        with mock.patch('llm.views.AsyncResult', return_value=result) as async_result:
+            response = self.client.get(f'/v1/llm/chat/summarize/jobs/{job_id}/', params)
+        return response, async_result
+
+    def test_owner_sees_result(self):
+        job_id = self._start_job()
+        response, _ = self._get_job(job_id, user_id=str(self.user.user_id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['result'], {'updated': 1})
+
+        self.client.force_authenticate(self.user)
+        response, _ = self._get_job(job_id)
+        self.assertEqual(response.status_code, 200)
+
+    def test_other_jobs_are_hidden(self):
+        job_id = self._start_job()
+        for params in ({'user_id': str(self.other.user_id)}, {'user_id': 'invalid'}, {}):
+            response, async_result = self._get_job(job_id, **params)
+            self.assertEqual(response.status_code, 404)
+            async_result.assert_not_called()
+
+        # 요약 API로 등록하지 않은 작업 ID (다른 Celery 작업)
+        response, async_result = self._get_job(uuid.uuid4(), user_id=str(self.user.user_id))
+        self.assertEqual(response.status_code, 404)
+        async_result.assert_not_called()
+
+
+class ModelRouterHedgeTest(SimpleTestCase):
+    """헤징: 최근 지연 백분위를 넘기면 중복 요청을 보내고, 먼저 온 응답을 쓰고 늦은 요청은 취소"""
+
+    routes = {'general': {'tier': 'fast', 'timeout': 5.0}, 'classifier': {'tier': 'fast', 'timeout': 5.0, 'hedge': True}}
+    tiers = {'fast': {'model': 'fast-model', 'fallback': None}}
+
+    def test_slow_primary_fast_hedge(self):
+        router = ModelRouter(routes=self.routes, tiers=self.tiers)
+        for _ in range(HEDGE_MIN_SAMPLES):
+            router.latency.observe('classifier:fast-model', 0.4)
+        self.assertEqual(router.hedge_delay(router.route('classifier')), 0.4)
+
+        agent = mock.Mock()
+        agent.clone.return_value = 'routed-agent'
+        calls = []
+
+        async def fake_run(routed_agent, input, **kwargs):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    calls.append('primary cancelled')
+                    raise
+                return 'primary'
+            await asyncio.sleep(0.01)
+            return 'hedge'
+
+        async def scenario():
+            started = time.monotonic()
+            with mock.patch('llm.model_router.Runner.run', side_effect=fake_run):
+                result = await router.run(agent, 'classifier', '분류할 질문')
+            await asyncio.sleep(0)
+            return started, result
+
+        started, result = asyncio.run(scenario())
+        self.assertEqual(result, 'hedge')
+        # 중복 요청은 헤징 예산(백분위 0.4초)이 지난 뒤에 발송
+        self.assertGreaterEqual(calls[1] - started, 0.4)
+        self.assertLess(calls[1] - started, 1.0)
+        self.assertEqual(calls[2], 'primary cancelled')
+
+        stats = router.hedge_stats()['classifier:fast-model']
+        self.assertEqual((stats['calls'], stats['hedged'], stats['hedge_wins']), (1, 1, 1))
+        self.assertEqual(stats['avg_hedge_budget_ms'], 400)
+        self.assertEqual(stats['hedge_win_rate'], 1.0)
+
+
+class AgentLoopExecutorTest(SimpleTestCase):
+    """에이전트 루프: 여러 스레드에서 제출한 코루틴이 각 워커 루프에서 실행되고, 종료 시 클라이언트를 닫음"""
+
+    def test_submit_from_threads_and_shutdown(self):
+        executor = AgentLoopExecutor(size=2)
+        self.addCleanup(executor.shutdown)
+
+        async def probe(index):
+            await asyncio.sleep(0.01)
+            worker = executor.current_worker()
+            return index, worker, asyncio.get_running_loop(), threading.current_thread().name
+
+        with mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = list(pool.map(lambda index: executor.submit(probe(index)), range(8)))
+            results = [future.result(timeout=5) for future in futures]
+
+        workers = {id(worker): worker for _, worker, _, _ in results}
+        self.assertEqual(len(workers), 2)
+        for _, worker, loop, thread_name in results:
+            self.assertIs(loop, worker.loop)
+            self.assertEqual(thread_name, f'agent-loop-{worker.index}')
+        self.assertIsNone(executor.current_worker())
+
+        # 워커마다 자신의 루프에서 만든 연결 풀과 OpenAI 클라이언트를 사용
+        first, second = workers.values()
+        self.assertIsNot(first.http_client, second.http_client)
+        self.assertIsNot(first.openai_client, second.openai_client)
+        for worker in (first, second):
+            self.assertIs(worker.openai_client._client, worker.http_client)
+            self.assertIs(worker.provider._client, worker.openai_client)
+
+        executor.shutdown()
+        self.assertFalse(executor.started)
+        for worker in (first, second):
+            self.assertTrue(worker.http_client.is_closed)
+            self.assertTrue(worker.loop.is_closed())
+            self.assertFalse(worker.thread.is_alive())
+
+
+class SingleFlightTest(SimpleTestCase):
+    """동일 질문 실행 합류: 모든 소비자가 같은 이벤트를 받고, 리더 실패 시 오류 전달 후 키 제거"""
+
+    FOLLOWERS = 5
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.key = make_flight_key('agent', '입덧에 좋은 음식', ('user', None))
+
+    def join_followers(self, flight):
+        for _ in range(self.FOLLOWERS):
+            # 공백/대소문자만 다른 질문도 같은 실행에 합류
+            follower, is_leader = self.single_flight.join(make_flight_key('agent', '  입덧에  좋은 음식 ', ('user', None)))
+            self.assertFalse(is_leader)
+            self.assertIs(follower, flight)
+
+    async def consume(self, flight, start_delay=0.0):
+        # SSE 소비자는 요청 스레드에서 동기 제너레이터로 이벤트를 읽음
+        await asyncio.sleep(start_delay)
+        return await asyncio.to_thread(lambda: list(flight.subscribe(timeout=0.01)))
+
+    def test_followers_receive_same_events(self):
+        flight, is_leader = self.single_flight.join(self.key)
+        self.assertTrue(is_leader)
+        self.join_followers(flight)
+        events = [{'delta': f'{index}', 'complete': False} for index in range(10)] + [{'status': 'done'}]
+
+        async def lead():
+            try:
+                for event in events:
+                    flight.publish(event)
+                    await asyncio.sleep(0.005)
+            finally:
+                self.single_flight.finish(flight)
+
+        async def scenario():
+            # 실행 중간에 구독을 시작한 소비자도 처음 이벤트부터 받음
+            consumers = [self.consume(flight, start_delay=0.01 * index) for index in range(self.FOLLOWERS)]
+            return await asyncio.gather(lead(), *consumers)
+
+        _, *received = asyncio.run(scenario())
+        self.assertEqual(received, [events] * self.FOLLOWERS)
+        self.assertEqual(flight.subscribers, self.FOLLOWERS)
+        self.assertEqual(self.single_flight.in_flight(), 0)
+
+    def test_leader_failure(self):
+        flight, _ = self.single_flight.join(self.key)
+        self.join_followers(flight)
+
+        async def lead():
+            # 뷰의 stream_processor와 같은 방식으로 오류를 이벤트로 전달하고 종료
+            try:
+                flight.publish({'delta': '답변', 'complete': False})
+                await asyncio.sleep(0.01)
+                raise RuntimeError('모델 호출 실패')
+            except Exception as e:
+                flight.publish({'error': str(e)})
+                flight.publish({'status': 'done'})
+            finally:
+                self.single_flight.finish(flight)
+
+        async def scenario():
+            return await asyncio.gather(lead(), *[self.consume(flight) for _ in range(self.FOLLOWERS)])
+
+        _, *received = asyncio.run(scenario())
+        expected = [{'delta': '답변', 'complete': False}, {'error': '모델 호출 실패'}, {'status': 'done'}]
+        self.assertEqual(received, [expected] * self.FOLLOWERS)
+        self.assertEqual(self.single_flight.in_flight(), 0)
+
+        next_flight, is_leader = self.single_flight.join(self.key)
+        self.assertTrue(is_leader)
+        self.assertIsNot(next_flight, flight)
+
+    def test_leader_crash_releases_followers(self):
+        # 리더 코루틴이 오류를 처리하지 못하고 끝나도 완료 콜백으로 스트림을 닫아 소비자가 남지 않음
+        flight, _ = self.single_flight.join(self.key)
+        self.join_followers(flight)
+
+        async def crash():
+            flight.publish({'delta': '답변', 'complete': False})
+            await asyncio.sleep(0.01)
+            raise RuntimeError('루프 오류')
+
+        async def scenario():
+            leader = asyncio.ensure_future(crash())
+            leader.add_done_callback(lambda _: self.single_flight.finish(flight))
+            received = await asyncio.wait_for(
+                asyncio.gather(*[self.consume(flight) for _ in range(self.FOLLOWERS)]), timeout=5
+            )
+            with self.assertRaises(RuntimeError):
+                await leader
+            return received
+
+        received = asyncio.run(scenario())
+        self.assertEqual(received, [[{'delta': '답변', 'complete': False}]] * self.FOLLOWERS)
+        self.assertTrue(self.single_flight.join(self.key)[1])
+
+
+class ChatRoomMessageCursorTest(TestCase):
+    """채팅방 상세 메시지 키셋 커서: 중복/누락 없는 페이지 이동과 잘못된 커서 처리"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='cursor@example.com', username='cursor', name='테스트', password='password'
+        )
+        self.room = ChatManager.objects.create(user=self.user)
+        messages = [
+            LLMConversation.objects.create(user=self.user, chat_room=self.room, query=f'질문 {index}', response='답변')
+            for index in range(8)
+        ]
+        # 같은 created_at을 가진 메시지가 페이지 경계에 걸치도록 일부 시각을 동일하게 맞춤
+        base = timezone.now()
+        for index, message in enumerate(messages):
+            LLMConversation.objects.filter(pk=message.pk).update(
+                created_at=base if 2 <= index <= 6 else base + timedelta(seconds=index - 4)
+            )
+        self.expected = [
+            str(pk) for pk in self.room.messages.order_by('created_at', 'id').values_list('id', flat=True)
+        ]
+
+    def _get(self, **params):
+        return self.client.get(f'/v1/llm/chat/rooms/{self.room.chat_id}/', {'limit': 3, **params})
+
+    def test_walk_backwards_without_duplicates_or_gaps(self):
+        seen = []
+        response = self._get()
+        while True:
+            self.assertEqual(response.status_code, 200)
+            # 각 페이지는 시간순, 이전 페이지는 앞쪽에 이어 붙임
+            seen = [message['id'] for message in response.data['messages']] + seen
+            if not response.data['pagination']['has_more']:
+                break
+            response = self._get(cursor=response.data['pagination']['before_cursor'])
+        self.assertEqual(seen, self.expected)
+
+    def test_walk_forwards_without_duplicates_or_gaps(self):
+        oldest = self.room.messages.order_by('created_at', 'id').first()
+        seen = [str(oldest.id)]
+        cursor = encode_cursor(oldest.created_at, oldest.id)
+        while True:
+            response = self._get(cursor=cursor, direction='after')
+            self.assertEqual(response.status_code, 200)
+            seen += [message['id'] for message in response.data['messages']]
+            if not response.data['pagination']['has_more']:
+                break
+            cursor = response.data['pagination']['after_cursor']
+        self.assertEqual(seen, self.expected)
+
+    def test_malformed_cursor_returns_400(self):
+        bad_pk = base64.urlsafe_b64encode(b'["2024-01-01T00:00:00+00:00","not-a-uuid"]').decode('ascii')
+        for cursor in ['garbage!', 'bm90LWpzb24', '한글', bad_pk]:
+            with self.subTest(cursor=cursor):
+                response = self._get(cursor=cursor)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.data)
+        self.assertEqual(self._get(direction='sideways').status_code, 400)
+
+
+class ConversationSearchTest(TestCase):
+    """대화 검색: n-gram 색인(Postgres) / 부분 문자열 검색(그 외 DB), 사용자 범위, 강조, 특수문자 입력"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='search@example.com', username='search', name='테스트', password='password'
+        )
+        self.other = User.objects.create_user(
+            email='other-search@example.com', username='other-search', name='다른 사용자', password='password'
+        )
+        room = ChatManager.objects.create(user=self.user)
+        self.match = LLMConversation.objects.create(
+            user=self.user, chat_room=room,
+            query='임신중독증 증상이 궁금해요', response='혈압이 오르고 <b>부종</b>이 생길 수 있어요'
+        )
+        LLMConversation.objects.create(
+            user=self.user, chat_room=room, query='입덧은 언제 끝나나요', response='보통 16주 전후로 줄어요'
+        )
+        LLMConversation.objects.create(
+            user=self.other, chat_room=ChatManager.objects.create(user=self.other),
+            query='임신중독증 검사 시기', response='정기 검진 때 확인해요'
+        )
+
+    def _search(self, term, user=None):
+        return self.client.get('/v1/llm/conversations/search/', {
+            'user_id': str((user or self.user).user_id), 'q': term,
+        })
+
+    def test_partial_korean_word_matches_own_conversations_only(self):
+        response = self._search('중독')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.match.id)])
+        result = response.data['results'][0]
+        self.assertEqual(result['query_highlight'], '임신<mark>중독</mark>증 증상이 궁금해요')
+        # 강조되지 않은 응답도 HTML 이스케이프
+        self.assertEqual(result['response_highlight'], '혈압이 오르고 &lt;b&gt;부종&lt;/b&gt;이 생길 수 있어요')
+
+    def test_tsquery_operators_in_term_do_not_fail(self):
+        for term in ['&|!():*', "중독 & !증상", "'임신'", '증상:*)']:
+            with self.subTest(term=term):
+                response = self._search(term)
+                self.assertEqual(response.status_code, 200)
+                self.assertFalse(response.data['pagination']['has_more'])
+
+    @skipUnless(connection.vendor != 'postgresql', 'Postgres 외 DB의 부분 문자열 검색')
+    def test_icontains_fallback(self):
+        response = self._search('궁금')
+
+        self.assertEqual([row['id'] for row in response.data['results']], [str(self.match.id)])
+        self.assertEqual(response.data['results'][0]['rank'], 0.0)
+        self.assertEqual(self._search('&|!():*').data['results'], [])
+
+    def test_bigram_query_is_covered_by_document(self):
+        # 부분 단어의 2-gram이 모두 원문 색인에 포함되어야 AND 검색으로 일치
+        document = set(ngram_document('임신중독증 증상이 궁금해요').split())
+        query = build_search_query('중독증').source_expressions[-1].value
+        self.assertEqual(query, '중독 & 독증')
+        self.assertTrue(set(query.split(' & ')) <= document)
+
+    def test_build_search_query_strips_operators(self):
+        self.assertIsNone(build_search_query('&|!():*'))
+        self.assertEqual(build_search_query("a&b | !c").source_expressions[-1].value, 'a:* & b:* & c:*')
+        self.assertEqual(build_search_query("임신:* & (중독)").source_expressions[-1].value, '임신 & 중독')
+
+    def test_highlight_fragment(self):
+        text = '가' * 100 + '중독' + '나' * 100
+        snippet = highlight(text, '중독', fragment=10)
+        self.assertEqual(snippet, '…' + '가' * 10 + '<mark>중독</mark>' + '나' * 8 + '…')
+        self.assertEqual(highlight('<script>', '!!'), '&lt;script&gt;')
+
+
+class HotQueryIndexTest(TestCase):
+    """
+    핫 쿼리용 복합 인덱스가 선언대로 생성되는지 확인 (모든 DB)
+    SQLite에서는 소량 데이터로 핫 쿼리가 테이블 전체 SCAN 없이 실행되는지도 확인
+    """
+
+    def test_indexes_declared_and_created(self):
+        declared = {
+            index.name: index.fields
+            for model in (ChatManager, LLMConversation) for index in model._meta.indexes
+        }
+        self.assertEqual(declared['llm_chat_user_active_upd_idx'], ['user', 'is_active', 'updated_at'])
+        self.assertEqual(declared['llm_conv_room_created_idx'], ['chat_room', 'created_at'])
+        self.assertEqual(declared['llm_conv_user_created_idx'], ['user', 'created_at'])
+
+        problems = {**missing_indexes(ChatManager), **missing_indexes(LLMConversation)}
+        if connection.vendor != 'postgresql':
+            # GIN 인덱스는 Postgres 전용
+            problems.pop('llm_conv_search_gin_idx', None)
+        self.assertEqual(problems, {})
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite 실행 계획 검사')
+    def test_hot_queries_avoid_full_scans_on_sqlite(self):
+        user = User.objects.create_user(email='plan@example.com', username='plan', name='테스트', password='pw')
+        room = ChatManager.objects.create(user=user)
+        for index in range(5):
+            LLMConversation.objects.create(user=user, chat_room=room, query=f'질문 {index}', response='답변')
+        self.assertEqual(check_hot_query_plans(user, room), {})
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Postgres 실행 계획 검사')
+class HotQueryPlanTest(TestCase):
+    """
+    핫 쿼리가 실제 규모의 데이터에서 Seq Scan으로 떨어지지 않는지 확인
+    (사용자 200명 x 채팅방 10개 x 메시지 20개)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.chat_room = seed_chat_data()
+
+    def test_hot_queries_use_indexes(self):
+        failures = check_hot_query_plans(self.user, self.chat_room)
+        self.assertEqual(failures, {}, f"Seq Scan이 발생한 쿼리: {failures}")
+
+
+class ModelRouterLatencyBudgetTest(SimpleTestCase):
+    """비스트리밍 호출은 전체 응답 기준 latency_budget으로 fallback 하는지 확인"""
+
+    routes = {
+        'general': {'tier': 'fast', 'timeout': 5.0},
+        'verification': {'tier': 'standard', 'timeout': 5.0, 'latency_budget': 0.05},
+    }
+    tiers = {
+        'fast': {'model': 'fast-model', 'fallback': None},
+        'standard': {'model': 'standard-model', 'fallback': 'fast'},
+    }
+
+    def test_slow_response_falls_back_with_latency_budget_reason(self):
+        router = ModelRouter(routes=self.routes, tiers=self.tiers)
+        recorder = SimpleNamespace(model_fallbacks=[])
+        agent = mock.Mock()
+        agent.clone.side_effect = lambda model, model_settings: model
+
+        async def fake_run(model, input, **kwargs):
+            if model == 'standard-model':
+                await asyncio.sleep(1)
+            return model
+
+        with mock.patch('llm.model_router.Runner.run', side_effect=fake_run):
+            result = asyncio.run(router.run(agent, 'verification', '응답', recorder=recorder))
+
+        self.assertEqual(result, 'fast-model')
+        self.assertEqual(len(recorder.model_fallbacks), 1)
+        self.assertEqual(recorder.model_fallbacks[0]['reason'], 'latency_budget')
+
+    def test_fallback_stays_within_total_timeout(self):
+        routes = {
+            'general': {'tier': 'fast', 'timeout': 5.0},
+            'verification': {'tier': 'standard', 'timeout': 0.6, 'latency_budget': 0.4},
+            'classifier': {'tier': 'standard', 'timeout': 0.2, 'latency_budget': 0.4},
+        }
+        router = ModelRouter(routes=routes, tiers=self.tiers)
+        agent = mock.Mock()
+        agent.clone.side_effect = lambda model, model_settings: model
+
+        async def slow_run(model, input, **kwargs):
+            await asyncio.sleep(1)
+            return model
+
+        async def timed(role, recorder):
+            started = time.monotonic()
+            with self.assertRaises(asyncio.TimeoutError):
+                await router.run(agent, role, '응답', recorder=recorder)
+            return time.monotonic() - started
+
+        with mock.patch('llm.model_router.Runner.run', side_effect=slow_run):
+            # fallback은 전체 제한 시간(0.6초) 중 남은 0.2초만 사용
+            recorder = SimpleNamespace(model_fallbacks=[])
+            elapsed = asyncio.run(timed('verification', recorder))
+            self.assertLess(elapsed, 0.75)
+            self.assertEqual(len(recorder.model_fallbacks), 1)
+
+            # latency_budget이 전체 제한 시간보다 길면 남은 시간이 없으므로 fallback 없이 실패
+            recorder = SimpleNamespace(model_fallbacks=[])
+            elapsed = asyncio.run(timed('classifier', recorder))
+            self.assertLess(elapsed, 0.35)
+            self.assertEqual(recorder.model_fallbacks, [])
@@ -14,15 +14,17 @@ URL 패턴:
     /v1/llm/conversations/ - 대화 조회 API (GET)
     /v1/llm/conversations/edit/ - 대화 수정 API (PUT)
     /v1/llm/conversations/delete/ - 대화 삭제 API (DELETE)
+    /v1/llm/conversations/search/ - 대화 기록 검색 API (GET)
     /v1/llm/pregnancy-search/ - 임신 주차 검색 API (POST)
     /v1/llm/agent/ - OpenAI 에이전트 API (POST)
     /v1/llm/agent/stream/ - OpenAI 에이전트 스트리밍 API (POST)
     
     # 채팅방 관련 URL
-    /v1/llm/chat/rooms/ - 채팅방 목록 조회 (GET) 및 생성 (POST)
-    /v1/llm/chat/rooms/<chat_id>/ - 채팅방 상세 정보 조회 (GET)
+    /v1/llm/chat/rooms/ - 채팅방 목록 조회 (GET, limit/cursor를 보내면 커서 페이지 응답) 및 생성 (POST)
+    /v1/llm/chat/rooms/<chat_id>/ - 채팅방 상세 정보 및 메시지 커서 페이지 조회 (GET)
     /v1/llm/chat/rooms/<chat_id>/messages/ - 채팅방에 메시지 생성 (POST)
-    /v1/llm/chat/rooms/<chat_id>/summarize/ - 채팅방 요약 (POST)
+    /v1/llm/chat/rooms/<chat_id>/summarize/ - 채팅방 요약 작업 등록 (POST)
+    /v1/llm/chat/summarize/jobs/<job_id>/ - 채팅방 요약 작업 상태 조회 (GET, 요청한 사용자만)
 """
 
 app_name = 'llm'
@@ -41,10 +43,14 @@ urlpatterns = [
     # OpenAI 에이전트 스트리밍 API
     path('agent/stream/', views.OpenAIAgentStreamView.as_view(), name='openai_agent_stream'),
     
+    # 대화 검색 API
+    path('conversations/search/', views.ConversationSearchView.as_view(), name='conversation_search'),
+    
     # 채팅방 관련 API
     path('chat/rooms/', views.ChatRoomListCreateView.as_view(), name='chat_rooms'),
     path('chat/rooms/<uuid:chat_id>/', views.ChatRoomDetailView.as_view(), name='chat_room_detail'),
     path('chat/rooms/<uuid:chat_id>/summarize/', views.ChatRoomSummarizeView.as_view(), name='chat_room_summarize'),
+    path('chat/summarize/jobs/<uuid:job_id>/', views.ChatRoomSummarizeJobView.as_view(), name='chat_room_summarize_job'),
     
     # 뷰셋 라우터 포함
     # path('', include(router.urls)),
@@ -9,17 +9,28 @@ from django.http import Http404, JsonResponse, StreamingHttpResponse
 import logging
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Substr
 from datetime import datetime, date
 import json
 import asyncio
-from .agent_loop import get_agent_loop
+from .agent_loop import agent_loop_executor
+from .single_flight import agent_single_flight, make_flight_key
+from .sse import SSEFrameCoalescer
+from .pagination import InvalidCursor, encode_cursor, keyset_page, parse_page_size
+from .chat_summary import needs_summary, register_summary_job, summary_job_owner
+from .search import search_conversations
+from .tasks import summarize_chat_rooms
+from celery.result import AsyncResult
 
 from .models import LLMConversation, ChatManager
+from accounts.utils.conditional_utils import ConditionalGetMixin, parse_user_id
 from .serializers import (
     QuerySerializer, ResponseSerializer, LLMConversationSerializer,
     LLMConversationEditSerializer, LLMConversationDeleteSerializer,
     ChatRoomSerializer, ChatRoomCreateSerializer, ChatRoomListSerializer, 
-    ChatMessageCreateSerializer, ChatRoomSummarizeSerializer,
+    ChatMessageCreateSerializer, ChatRoomSummarizeSerializer, ChatMessageCompactSerializer,
+    ChatRoomListItemSerializer, ConversationSearchResultSerializer,
     # LLMAgentQuerySerializer, LLMAgentResponseSerializer
 )
 from accounts.models import Pregnancy  # Pregnancy 모델 임포트
@@ -37,6 +48,9 @@ User = get_user_model()
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 채팅방 목록의 마지막 메시지 미리보기 길이
+LAST_MESSAGE_PREVIEW_LENGTH = 50
+
 
 def get_current_date():
     """
@@ -63,21 +77,69 @@ def custom_get_object_or_404(klass, *args, **kwargs):
             raise Http404("요청한 객체를 찾을 수 없습니다.")
 
 
-class ChatRoomListCreateView(APIView):
+class ChatRoomListCreateView(ConditionalGetMixin, APIView):
     """채팅방 목록 조회 및 생성 API"""
     permission_classes = [AllowAny]  # 실제 구현 시 IsAuthenticated로 변경
+    conditional_resources = ('chat-rooms',)
+
+    def get_conditional_user_id(self, request):
+        """채팅방 목록은 user_id 쿼리 파라미터 기준"""
+        return parse_user_id(request.query_params.get('user_id'))
     
     def get(self, request):
-        """사용자의 채팅방 목록 조회"""
+        """
+        사용자의 채팅방 목록 조회
+
+        기존 클라이언트 호환을 위해 기본 응답은 전체 채팅방 목록(배열)이고,
+        limit 또는 cursor 쿼리 파라미터를 보내면 커서 페이지 응답({results, pagination})을 반환합니다.
+        """
         user_id = request.query_params.get('user_id')
         if not user_id:
             return Response({"error": "user_id가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
             
         try:
             user = get_object_or_404(User, user_id=user_id)
-            chat_rooms = ChatManager.objects.filter(user=user, is_active=True).order_by('-updated_at')
-            serializer = ChatRoomListSerializer(chat_rooms, many=True)
-            return Response(serializer.data)
+            
+            # 마지막 메시지 미리보기와 시간을 서브쿼리로 주석 처리 (채팅방 수와 무관하게 쿼리 1회)
+            last_message = LLMConversation.objects.filter(
+                chat_room=OuterRef('pk')
+            ).order_by('-created_at', '-id')
+            chat_rooms = ChatManager.objects.filter(user=user, is_active=True).annotate(
+                last_message_preview=Subquery(
+                    last_message.annotate(preview=Substr('query', 1, LAST_MESSAGE_PREVIEW_LENGTH)).values('preview')[:1]
+                ),
+                last_message_at=Subquery(last_message.values('created_at')[:1]),
+            ).values(
+                'chat_id', 'user_id', 'topic', 'message_count', 'is_active',
+                'last_message_preview', 'last_message_at', 'created_at', 'updated_at'
+            )
+            
+            # 페이지 파라미터가 없으면 기존 형식(전체 목록 배열)으로 응답
+            if 'limit' not in request.query_params and 'cursor' not in request.query_params:
+                rooms = chat_rooms.order_by('-updated_at', '-chat_id')
+                serializer = ChatRoomListItemSerializer(rooms, many=True, context={'user_name': user.name})
+                return Response(serializer.data)
+            
+            # updated_at 커서 기준 페이지네이션 (최근 수정순)
+            limit = parse_page_size(request.query_params.get('limit'))
+            try:
+                rooms, has_more = keyset_page(
+                    chat_rooms, 'updated_at', 'chat_id',
+                    cursor=request.query_params.get('cursor'),
+                    limit=limit
+                )
+            except InvalidCursor as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            
+            serializer = ChatRoomListItemSerializer(rooms, many=True, context={'user_name': user.name})
+            return Response({
+                'results': serializer.data,
+                'pagination': {
+                    'limit': limit,
+                    'has_more': has_more,
+                    'next_cursor': encode_cursor(rooms[-1]['updated_at'], rooms[-1]['chat_id']) if has_more else None,
+                }
+            })
         except Http404:
             return Response({"error": "사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
@@ -117,33 +179,103 @@ class ChatRoomListCreateView(APIView):
             logger.error(f"채팅방 생성 중 오류: {str(e)}")
             return Response({"error": f"요청 처리 중 오류가 발생했습니다: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
+class ConversationSearchView(APIView):
+    """사용자 대화 기록 검색 API"""
+    permission_classes = [AllowAny]  # 실제 구현 시 IsAuthenticated로 변경
+    
+    def get(self, request):
+        """
+        사용자 본인의 대화를 질문/응답 n-gram 색인으로 검색
+        
+        - q: 검색어
+        - page: 페이지 번호 (기본 1)
+        - limit: 페이지 크기 (기본 30, 최대 100)
+        관련도순으로 정렬하며, 검색어를 <mark>로 강조한 발췌를 함께 반환합니다.
+        """
+        user_id = request.query_params.get('user_id')
+        term = (request.query_params.get('q') or '').strip()
+        if not user_id:
+            return Response({"error": "user_id가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if not term:
+            return Response({"error": "검색어(q)가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            user = get_object_or_404(User, user_id=user_id)
+            limit = parse_page_size(request.query_params.get('limit'))
+            try:
+                page = max(1, int(request.query_params.get('page', 1)))
+            except ValueError:
+                page = 1
+            
+            offset = (page - 1) * limit
+            conversations = search_conversations(
+                LLMConversation.objects.filter(user=user).only('id', 'chat_room_id', 'query', 'response', 'created_at'),
+                term
+            )
+            rows = list(conversations[offset:offset + limit + 1])
+            serializer = ConversationSearchResultSerializer(rows[:limit], many=True, context={'term': term})
+            return Response({
+                'results': serializer.data,
+                'pagination': {
+                    'page': page,
+                    'limit': limit,
+                    'has_more': len(rows) > limit,
+                }
+            })
+        except Http404:
+            return Response({"error": "사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"대화 검색 중 오류: {str(e)}")
+            return Response({"error": "요청 처리 중 오류가 발생했습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 class ChatRoomDetailView(APIView):
     """채팅방 상세 정보 및 메시지 조회 API"""
     permission_classes = [AllowAny]  # 실제 구현 시 IsAuthenticated로 변경
     
     def get(self, request, chat_id):
-        """채팅방 상세 정보 및 메시지 조회"""
+        """
+        채팅방 상세 정보 및 메시지 조회
+
+        메시지는 (created_at, id) 키셋 커서로 페이지 단위 조회합니다.
+        - cursor: 이전 응답의 before_cursor / after_cursor
+        - direction: before(이전 메시지, 기본값) / after(새 메시지)
+        - limit: 페이지 크기 (기본 30, 최대 100)
+        """
         try:
-            chat_room = get_object_or_404(ChatManager, chat_id=chat_id)
+            chat_room = get_object_or_404(ChatManager.objects.select_related('user'), chat_id=chat_id)
             
             # 메시지 포함 여부 확인
             include_messages = request.query_params.get('include_messages', 'true').lower() == 'true'
             
-            if include_messages:
-                # 모든 메시지 포함
-                serializer = ChatRoomSerializer(chat_room)
-                data = serializer.data
-                
-                # 메시지 가져오기 (시간순 정렬)
-                messages = chat_room.messages.all().order_by('created_at')
-                message_serializer = LLMConversationSerializer(messages, many=True)
-                data['all_messages'] = message_serializer.data
-                
+            # 채팅방 기본 정보
+            data = ChatRoomListSerializer(chat_room).data
+            if not include_messages:
                 return Response(data)
-            else:
-                # 메시지 없이 기본 정보만 반환
-                serializer = ChatRoomListSerializer(chat_room)
-                return Response(serializer.data)
+            
+            limit = parse_page_size(request.query_params.get('limit'))
+            direction = request.query_params.get('direction', 'before')
+            try:
+                messages, has_more = keyset_page(
+                    chat_room.messages.only('id', 'query', 'response', 'using_rag', 'created_at'),
+                    'created_at', 'id',
+                    cursor=request.query_params.get('cursor'),
+                    direction=direction,
+                    limit=limit
+                )
+            except InvalidCursor as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            
+            # 화면 표시용 시간순 정렬
+            messages.reverse()
+            data['messages'] = ChatMessageCompactSerializer(messages, many=True).data
+            data['pagination'] = {
+                'limit': limit,
+                'direction': direction,
+                'has_more': has_more,
+                'before_cursor': encode_cursor(messages[0].created_at, messages[0].id) if messages else None,
+                'after_cursor': encode_cursor(messages[-1].created_at, messages[-1].id) if messages else None,
+            }
+            return Response(data)
         except Http404:
             return Response({"error": "채팅방을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
@@ -155,37 +287,67 @@ class ChatRoomSummarizeView(APIView):
     permission_classes = [AllowAny]  # 실제 구현 시 IsAuthenticated로 변경
     
     def post(self, request, chat_id):
-        """채팅방 대화 요약"""
+        """
+        채팅방 대화 요약 작업 등록
+        
+        LLM 호출은 Celery 작업(summarize_chat_rooms)에서 처리하고 작업 ID를 반환합니다.
+        마지막 요약 이후 메시지 수가 바뀌지 않았다면 기존 주제를 바로 반환합니다.
+        """
         try:
             chat_room = get_object_or_404(ChatManager, chat_id=chat_id)
             
-            # 요약 전 기존 토픽 저장
-            previous_topic = chat_room.topic
-            
-            # LLM을 사용한 대화 요약 처리
-            # ChatManager.summarize_chat() 메서드는 이제 LLM을 사용하여 채팅 내용을 50자 이내로 요약합니다.
-            chat_room.summarize_chat()
-            
-            # 응답 데이터 구성
-            response_data = {
-                'topic': chat_room.topic,
-                'message_count': chat_room.message_count,
-                'is_updated': previous_topic != chat_room.topic
-            }
-            
-            serializer = ChatRoomSummarizeSerializer(response_data)
+            if not needs_summary(chat_room):
+                serializer = ChatRoomSummarizeSerializer({
+                    'topic': chat_room.topic,
+                    'message_count': chat_room.message_count,
+                    'is_updated': False
+                })
+                return Response(serializer.data)
             
-            return Response(serializer.data)
+            job = summarize_chat_rooms.delay([str(chat_room.chat_id)])
+            register_summary_job(job.id, chat_room.user_id)
+            return Response({
+                'job_id': job.id,
+                'status': 'queued',
+                'message_count': chat_room.message_count
+            }, status=status.HTTP_202_ACCEPTED)
             
         except Http404:
             return Response({"error": "채팅방을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            logger.error(f"채팅방 요약 중 오류: {str(e)}")
+            logger.error(f"채팅방 요약 작업 등록 중 오류: {str(e)}")
             return Response({"error": f"요청 처리 중 오류가 발생했습니다: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+class ChatRoomSummarizeJobView(APIView):
+    """채팅방 요약 작업 상태 조회 API"""
+    permission_classes = [AllowAny]  # 실제 구현 시 IsAuthenticated로 변경
+    
+    def get(self, request, job_id):
+        """
+        요약 작업 상태 및 결과 조회
+
+        채팅방 요약 API로 등록한 작업만, 채팅방 사용자(로그인 사용자 또는 user_id 쿼리 파라미터)에게만 보여줍니다.
+        그 외 작업 ID는 결과 백엔드의 다른 Celery 작업일 수 있으므로 존재 여부도 알리지 않고 404를 반환합니다.
+        """
+        if request.user and request.user.is_authenticated:
+            caller_id = request.user.pk
+        else:
+            caller_id = parse_user_id(request.query_params.get('user_id'))
+        owner_id = summary_job_owner(job_id)
+        if caller_id is None or owner_id is None or owner_id != str(caller_id):
+            return Response({"error": "요약 작업을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        result = AsyncResult(str(job_id))
+        data = {'job_id': str(job_id), 'status': result.state.lower()}
+        if result.successful():
+            data['result'] = result.result
+        elif result.failed():
+            data['error'] = str(result.result)
+        return Response(data)
+
 class OpenAIAgentStreamView(APIView):
     """
-    ThreadPoolExecutor를 사용하여 비동기-동기 컨텍스트 전환 문제를 해결한 SSE 스트리밍 뷰
+    프로세스 전역 에이전트 루프(agent_loop_executor)를 사용하여 비동기-동기 컨텍스트 전환 문제를 해결한 SSE 스트리밍 뷰
     """
 
     permission_classes = [AllowAny]
@@ -194,7 +356,6 @@ class OpenAIAgentStreamView(APIView):
         """실시간 스트리밍 SSE 이벤트"""
         import json
         import asyncio
-        import threading
         import re
         
         # 파라미터 추출
@@ -206,9 +367,9 @@ class OpenAIAgentStreamView(APIView):
         auth_token = None
         if auth_header and auth_header.startswith("Bearer "):
             auth_token = auth_header.split(" ")[1]
-            print(f"뷰: 인증 토큰 추출됨 (길이: {len(auth_token)})")
+            logger.debug(f"뷰: 인증 토큰 추출됨 (길이: {len(auth_token)})")
         else:
-            print("뷰: Authorization 헤더 없거나 Bearer 토큰 아님. 헤더 값: {auth_header}")
+            logger.debug("뷰: Authorization 헤더 없거나 Bearer 토큰 아님")
         
         if not query_text or not user_id:
             yield f"data: {json.dumps({'error': 'query_text와 user_id는 필수입니다.'})}\n\n"
@@ -217,160 +378,162 @@ class OpenAIAgentStreamView(APIView):
         # 시작 메시지
         yield f"data: {json.dumps({'status': 'start'})}\n\n"
         
-        # 스레드간 데이터 큐
-        from queue import Queue
-        chunk_queue = Queue()
-        stop_event = threading.Event()
+        # 동일한 질문이 이미 실행 중이면 그 실행의 이벤트 스트림에 합류
+        # (개인 정보와 대화 내역이 프롬프트에 포함되므로 사용자/채팅방/주차/태명을 개인화 키로 사용)
+        personalization_key = (
+            user_id,
+            request.data.get("thread_id"),
+            request.data.get("pregnancy_week"),
+            request.data.get("baby_name"),
+        )
+        flight_key = make_flight_key("openai_agent_stream", query_text, personalization_key)
+        flight, is_leader = agent_single_flight.join(flight_key)
         
-        def worker():
-            """별도 스레드에서 비동기 처리 실행"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def stream_processor():
-                try:
-                    # JSON 필터링 변수 다시 추가
-                    filtering_json = False
-                    json_buffer = ""
+        async def stream_processor():
+            try:
+                # JSON 필터링 변수 다시 추가
+                filtering_json = False
+                json_buffer = ""
+                
+                # 에이전트 스트림 설정
+                stream_result = await openai_agent_service.process_query(
+                    query_text=query_text,
+                    user_id=user_id,
+                    thread_id=request.data.get("thread_id"),
+                    auth_token=auth_token,
+                    pregnancy_week=request.data.get("pregnancy_week"),
+                    baby_name=request.data.get("baby_name"),
+                    stream=True
+                )
+                
+                # 실시간으로 큐에 추가
+                accumulated_response = ""
+                
+                logger.debug(f"스트림 응답 시작: needs_verification={getattr(stream_result, 'needs_verification', 'undefined')}")
+                
+                async for event in stream_result.stream_events():
+                    if event.type == "raw_response_event" and hasattr(event.data, 'delta'):
+                        delta = event.data.delta
+                        accumulated_response += delta
+                        
+                        # JSON 필터링 로직 복원
+                        if not filtering_json:
+                            # JSON 시작 패턴 확인 (중괄호로 시작하거나 따옴표+중괄호 패턴)
+                            if (delta.strip().startswith('{') or 
+                                delta.strip().startswith('"') and accumulated_response.rstrip().endswith('{')):
+                                # JSON 필터링 시작
+                                filtering_json = True
+                                json_buffer = delta
+                                continue
+                            # 정상 텍스트는 전송
+                            flight.publish({"delta": delta, "complete": False})
+                        else:
+                            # 필터링 중인 경우
+                            json_buffer += delta
+                            # JSON 종료 확인
+                            if '}' in delta:
+                                filtering_json = False
+                                json_buffer = ""
+                                # 필터링된 JSON 대신 공백 전송
+                                flight.publish({"delta": "", "complete": False})
+                                continue
                     
-                    # 에이전트 스트림 설정
-                    stream_result = await openai_agent_service.process_query(
-                        query_text=query_text,
-                        user_id=user_id,
-                        thread_id=request.data.get("thread_id"),
-                        auth_token=auth_token,
-                        pregnancy_week=request.data.get("pregnancy_week"),
-                        baby_name=request.data.get("baby_name"),
-                        stream=True
-                    )
+                    # 기존 도구 이벤트 처리는 유지
+                    elif event.type == "tool_start":
+                        flight.publish({"tool": event.data.name, "status": "start"})
                     
-                    # 실시간으로 큐에 추가
-                    accumulated_response = ""
+                    elif event.type == "tool_end":
+                        flight.publish({"tool": event.data.name, "status": "end", "result": event.data.result})
+                        logger.debug(f"도구 종료: {event.data.name}")
                     
-                    print(f"스트림 응답 시작: needs_verification={getattr(stream_result, 'needs_verification', 'undefined')}")
+                    elif event.type == "handoff":
+                        flight.publish({
+                            "handoff": True, 
+                            "from": event.data.from_agent, 
+                            "to": event.data.to_agent
+                        })
+                
+                # 전체 응답 보내기 전에 필터링
+                filtered_response = re.sub(r'```(?:json)?\s*\{[\s\S]*?\}\s*```', '', accumulated_response)
+                
+                # 대화 저장 (실제 응답 모델과 모델 전환 기록 포함)
+                context = PregnancyContext(user_id=user_id, thread_id=request.data.get("thread_id"))
+                context.model_name = getattr(stream_result, 'model_name', None)
+                context.model_fallbacks = list(getattr(stream_result, 'model_fallbacks', []))
+                conversation = await context.save_to_db_async(query_text, filtered_response)
+                
+                # 검증이 필요한 경우 스트리밍 후 검증 수행
+                if hasattr(stream_result, 'needs_verification') and stream_result.needs_verification:
+                    logger.debug(f"검증 필요: 응답 길이 = {len(filtered_response)} 글자")
+                    # 검증 진행 중임을 알림
+                    flight.publish({"verification_status": "start"})
                     
-                    async for event in stream_result.stream_events():
-                        if event.type == "raw_response_event" and hasattr(event.data, 'delta'):
-                            delta = event.data.delta
-                            accumulated_response += delta
-                            
-                            # JSON 필터링 로직 복원
-                            if not filtering_json:
-                                # JSON 시작 패턴 확인 (중괄호로 시작하거나 따옴표+중괄호 패턴)
-                                if (delta.strip().startswith('{') or 
-                                    delta.strip().startswith('"') and accumulated_response.rstrip().endswith('{')):
-                                    # JSON 필터링 시작
-                                    filtering_json = True
-                                    json_buffer = delta
-                                    continue
-                                # 정상 텍스트는 전송
-                                chunk_queue.put({"delta": delta, "complete": False})
-                            else:
-                                # 필터링 중인 경우
-                                json_buffer += delta
-                                # JSON 종료 확인
-                                if '}' in delta:
-                                    filtering_json = False
-                                    json_buffer = ""
-                                    # 필터링된 JSON 대신 공백 전송
-                                    chunk_queue.put({"delta": "", "complete": False})
-                                    continue
+                    try:
+                        # 데이터 검증 에이전트 실행
+                        verification_agent = openai_agent_service.get_data_verification_agent(context)
+                        logger.debug("검증 에이전트 생성 완료")
                         
-                        # 기존 도구 이벤트 처리는 유지
-                        elif event.type == "tool_start":
-                            chunk_queue.put({"tool": event.data.name, "status": "start"})
+                        saved_fallback_count = len(context.model_fallbacks)
+                        verification_result = await openai_agent_service.router.run(
+                            verification_agent,
+                            'verification',
+                            filtered_response,
+                            context=context
+                        )
+                        logger.debug("검증 실행 완료")
                         
-                        elif event.type == "tool_end":
-                            chunk_queue.put({"tool": event.data.name, "status": "end", "result": event.data.result})
-                            print(f"도구 종료: {event.data.name}, 결과: {event.data.result}")
+                        # 검증 단계에서 모델 전환이 있었다면 대화 기록에 반영
+                        if len(context.model_fallbacks) > saved_fallback_count:
+                            await context.save_model_usage_async(conversation)
                         
-                        elif event.type == "handoff":
-                            chunk_queue.put({
-                                "handoff": True, 
-                                "from": event.data.from_agent, 
-                                "to": event.data.to_agent
-                            })
-                    
-                    # 전체 응답 보내기 전에 필터링
-                    filtered_response = re.sub(r'```(?:json)?\s*\{[\s\S]*?\}\s*```', '', accumulated_response)
-                    
-                    # 대화 저장
-                    context = PregnancyContext(user_id=user_id, thread_id=request.data.get("thread_id"))
-                    await context.save_to_db_async(query_text, filtered_response)
-                    
-                    # 검증이 필요한 경우 스트리밍 후 검증 수행
-                    if hasattr(stream_result, 'needs_verification') and stream_result.needs_verification:
-                        print(f"검증 필요: 응답 길이 = {len(filtered_response)} 글자")
-                        # 검증 진행 중임을 알림
-                        chunk_queue.put({"verification_status": "start"})
+                        # 검증 결과 저장 및 전송
+                        validation_result = verification_result.final_output
+                        context.add_verification_result(validation_result)
                         
-                        try:
-                            # 데이터 검증 에이전트 실행
-                            verification_agent = openai_agent_service.get_data_verification_agent(context)
-                            print("검증 에이전트 생성 완료")
-                            
-                            verification_result = await Runner.run(
-                                verification_agent,
-                                filtered_response,
-                                context=context
-                            )
-                            print("검증 실행 완료")
-                            
-                            # 검증 결과 저장 및 전송
-                            validation_result = verification_result.final_output
-                            context.add_verification_result(validation_result)
-                            
-                            print(f"검증 결과: is_accurate={validation_result.is_accurate}, score={validation_result.confidence_score}")
-                            
-                            # 검증 결과 전송
-                            chunk_queue.put({
-                                "verification_status": "complete",
-                                "verification": {
-                                    "is_accurate": validation_result.is_accurate,
-                                    "confidence_score": validation_result.confidence_score,
-                                    "reason": validation_result.reason,
-                                    "corrected_information": validation_result.corrected_information
-                                }
-                            })
-                        except Exception as e:
-                            print(f"검증 과정에서 오류 발생: {str(e)}")
-                            chunk_queue.put({
-                                "verification_status": "error",
-                                "error": str(e)
-                            })
-                    else:
-                        print("검증이 필요하지 않습니다")
-                    
-                    # 완료 메시지
-                    chunk_queue.put({
-                        "response": filtered_response,
-                        "complete": True
-                    })
-                    chunk_queue.put({"status": "done"})
-                except Exception as e:
-                    print(f"스트림 프로세서 오류: {str(e)}")
-                    chunk_queue.put({"error": str(e)})
-                    chunk_queue.put({"status": "done"})
-                finally:
-                    stop_event.set()
-            
-            # 비동기 처리 실행
-            loop.run_until_complete(stream_processor())
+                        logger.debug(f"검증 결과: is_accurate={validation_result.is_accurate}, score={validation_result.confidence_score}")
+                        
+                        # 검증 결과 전송
+                        flight.publish({
+                            "verification_status": "complete",
+                            "verification": {
+                                "is_accurate": validation_result.is_accurate,
+                                "confidence_score": validation_result.confidence_score,
+                                "reason": validation_result.reason,
+                                "corrected_information": validation_result.corrected_information
+                            }
+                        })
+                    except Exception as e:
+                        logger.error(f"검증 과정에서 오류 발생: {str(e)}")
+                        flight.publish({
+                            "verification_status": "error",
+                            "error": str(e)
+                        })
+                else:
+                    logger.debug("검증이 필요하지 않습니다")
+                
+                # 완료 메시지
+                flight.publish({
+                    "response": filtered_response,
+                    "complete": True
+                })
+                flight.publish({"status": "done"})
+            except Exception as e:
+                logger.error(f"스트림 프로세서 오류: {str(e)}")
+                flight.publish({"error": str(e)})
+                flight.publish({"status": "done"})
+            finally:
+                agent_single_flight.finish(flight)
         
-        # 스레드 시작
-        thread = threading.Thread(target=worker)
-        thread.daemon = True
-        thread.start()
+        # 리더만 프로세스 전역 에이전트 루프에 실행 제출
+        # (실패하더라도 대기 중인 소비자가 남지 않도록 완료 시 종료 처리)
+        if is_leader:
+            future = agent_loop_executor.submit(stream_processor())
+            future.add_done_callback(lambda _: agent_single_flight.finish(flight))
         
-        # 메인 스레드에서 큐 소비 및 실시간 전송
-        while not (stop_event.is_set() and chunk_queue.empty()):
-            try:
-                chunk = chunk_queue.get(timeout=0.1)
-                yield f"data: {json.dumps(chunk)}\n\n"
-                chunk_queue.task_done()
-            except Exception:
-                # 큐가 비었지만 작업이 아직 진행 중인 경우 대기
-                pass
+        # 메인 스레드에서 이벤트 소비 및 실시간 전송 (여러 SSE 소비자에게 동일하게 전달)
+        # 연속된 delta는 시간/크기 기준으로 하나의 프레임으로 병합해 전송
+        coalescer = SSEFrameCoalescer()
+        yield from coalescer.frames(flight.subscribe(timeout=coalescer.idle_timeout, idle_ticks=True))
 
     def post(self, request):
         """